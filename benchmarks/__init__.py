@@ -0,0 +1,15 @@
+"""Performance benchmarks for convoke
+
+Run the suite from the repository root, writing machine-readable
+results to a JSON file:
+
+    python -m benchmarks --output bench.json
+
+Compare a fresh run against results saved from another commit, failing
+if any benchmark slowed down by more than the given ratio:
+
+    python -m benchmarks --compare bench.json --threshold 1.25
+
+Benchmarks live outside the `src` tree and are not shipped with the
+package.
+"""
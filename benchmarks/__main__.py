@@ -0,0 +1,47 @@
+"""Command-line entrypoint for the benchmark suite"""
+import argparse
+import fnmatch
+import sys
+from pathlib import Path
+
+from benchmarks import bases, configs, signals  # noqa: F401 -- registers benchmarks
+from benchmarks.runner import BENCHMARKS, compare, dump, load, run
+
+
+def main(argv=None) -> int:
+    """Run benchmarks, optionally saving results and comparing them to a baseline."""
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description=__doc__)
+    parser.add_argument("patterns", nargs="*", help="glob patterns selecting benchmarks to run (default: all)")
+    parser.add_argument("--list", action="store_true", help="list available benchmarks and exit")
+    parser.add_argument("--output", "-o", type=Path, help="write JSON results to this path")
+    parser.add_argument("--compare", "-c", type=Path, help="compare against JSON results from a previous run")
+    parser.add_argument(
+        "--threshold", type=float, default=1.25, help="slowdown ratio that counts as a regression (default: 1.25)"
+    )
+    parser.add_argument("--repeat", type=int, default=5, help="timing repeats per benchmark (default: 5)")
+    parser.add_argument(
+        "--min-time", type=float, default=0.2, help="minimum seconds per repeat, used to calibrate loops (default: 0.2)"
+    )
+    args = parser.parse_args(argv)
+
+    names = [name for name in BENCHMARKS if not args.patterns or any(fnmatch.fnmatch(name, p) for p in args.patterns)]
+    if args.list:
+        print("\n".join(names))
+        return 0
+
+    report = run(names, repeat=args.repeat, min_time=args.min_time)
+    if args.output:
+        dump(report, args.output)
+
+    if args.compare:
+        regressions = compare(load(args.compare), report, args.threshold)
+        for name, ratio in regressions:
+            print(f"REGRESSION {name}: {ratio:.2f}x slower", file=sys.stderr)
+        if regressions:
+            return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
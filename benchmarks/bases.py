@@ -0,0 +1,69 @@
+"""Benchmarks for Base initialization and HQ resets"""
+from __future__ import annotations
+
+import sys
+import types
+
+from benchmarks.runner import benchmark
+from convoke.bases import HQ, Base
+from convoke.mountpoints import Mountpoint
+from convoke.signals import Signal
+
+
+class BenchSignal(Signal):
+    """A signal for synthetic handlers to respond to."""
+
+
+class BenchMountpoint(Mountpoint):
+    """A mountpoint for synthetic handlers to register with."""
+
+
+def make_base_class(n_handlers: int, n_plain: int = 20) -> type[Base]:
+    """Build a synthetic Base subclass with signal handlers, mountpoint registrations and plain methods."""
+    attrs = {}
+    for i in range(n_handlers):
+
+        def handler(self, msg):  # pragma: nocover
+            pass
+
+        handler.__name__ = f"handler_{i}"
+        attrs[handler.__name__] = (
+            Base.responds(BenchSignal)(handler) if i % 2 else BenchMountpoint.register(handler)
+        )
+    for i in range(n_plain):
+
+        def plain(self):  # pragma: nocover
+            pass
+
+        attrs[f"plain_{i}"] = plain
+    return type("Main", (Base,), attrs)
+
+
+def make_hq(n_bases: int, n_handlers: int) -> HQ:
+    """Load an HQ with synthetic dependency modules."""
+    names = []
+    for i in range(n_bases):
+        name = f"bench_base_{n_handlers}_{i}"
+        module = types.ModuleType(name)
+        module.Main = make_base_class(n_handlers)
+        sys.modules[name] = module
+        names.append(name)
+    hq = HQ()
+    hq.load_dependencies(names)
+    return hq
+
+
+for n_handlers in (0, 10, 50):
+
+    @benchmark(f"base.reset[handlers={n_handlers}]")
+    def bench_base_reset(n_handlers=n_handlers):
+        """Reset a single Base."""
+        hq = make_hq(1, n_handlers)
+        base = next(iter(hq.bases.values()))
+        return base.reset
+
+
+@benchmark("hq.reset[bases=200,handlers=10]")
+def bench_hq_reset():
+    """Reset an HQ with many Bases."""
+    return make_hq(200, 10).reset
@@ -0,0 +1,130 @@
+"""Benchmarks for config construction, casting and .env generation"""
+from __future__ import annotations
+
+import gc
+import os
+from pathlib import Path
+from typing import ContextManager, Optional
+from unittest import mock
+
+from benchmarks.runner import benchmark
+from convoke.configs import (
+    BaseConfig,
+    Secret,
+    env_field,
+    generate_dot_env,
+    get_casting_type,
+    get_sequence_parser,
+    strtobool,
+)
+
+# (annotation, default value, environment string) for each kind of field:
+FIELD_KINDS = {
+    "str": (str, "value", "other"),
+    "bool": (bool, False, "yes"),
+    "int": (int, 10, "42"),
+    "float": (float, 1.5, "2.5"),
+    "path": (Path, Path("/tmp"), "/var/tmp"),
+    "optional": (Optional[int], None, "7"),
+    "tuple": (tuple[str], ("a", "b"), "c,d,e"),
+    "secret": (Secret, Secret("hush"), "hush-hush"),
+}
+
+
+def make_config_class(name: str, n_fields: int, kinds: tuple[str, ...], doc: str = "") -> type[BaseConfig]:
+    """Build a synthetic BaseConfig subclass with `n_fields` fields, cycling through `kinds`."""
+    annotations = {}
+    attrs = {"__doc__": doc or f"Synthetic config {name}", "__annotations__": annotations}
+    for i in range(n_fields):
+        the_type, default, _ = FIELD_KINDS[kinds[i % len(kinds)]]
+        field_name = f"{name.upper()}_{i}"
+        annotations[field_name] = the_type
+        attrs[field_name] = env_field(default=default, doc=f"Setting number {i} of {name}")
+    return type(name, (BaseConfig,), attrs)
+
+
+def set_env(config_class: type[BaseConfig], kinds: tuple[str, ...]) -> ContextManager:
+    """Provide environment values for every synthetic field on the given class, within a `with` block."""
+    names = [name for name in config_class.__annotations__ if name not in BaseConfig.__annotations__]
+    return mock.patch.dict(os.environ, {name: FIELD_KINDS[kinds[i % len(kinds)]][2] for i, name in enumerate(names)})
+
+
+def make_config_classes(prefix: str, count: int, n_fields: int = 10) -> list[type[BaseConfig]]:
+    """Build `count` synthetic config classes, dropping any left over from previous benchmarks."""
+    gc.collect()
+    kinds = tuple(FIELD_KINDS)
+    return [make_config_class(f"{prefix}{i}", n_fields, kinds) for i in range(count)]
+
+
+for n_fields in (0, 10, 50, 200):
+    for label, kinds in (("str", ("str",)), ("mixed", tuple(FIELD_KINDS))):
+
+        @benchmark(f"config.instantiate[fields={n_fields},{label},defaults]")
+        def bench_instantiate_defaults(n_fields=n_fields, kinds=kinds, label=label):
+            """Instantiate a config whose fields all use their defaults."""
+            config_class = make_config_class(f"InstDefault{label.title()}{n_fields}", n_fields, kinds)
+            return config_class
+
+        @benchmark(f"config.instantiate[fields={n_fields},{label},env]")
+        def bench_instantiate_env(n_fields=n_fields, kinds=kinds, label=label):
+            """Instantiate a config whose fields are all cast from the environment."""
+            config_class = make_config_class(f"InstEnv{label.title()}{n_fields}", n_fields, kinds)
+            with set_env(config_class, kinds):
+                yield config_class
+
+
+for label, the_type in (
+    ("str", str),
+    ("bool", bool),
+    ("optional", Optional[int]),
+    ("tuple[int]", tuple[int]),
+    ("tuple", tuple),
+    ("tuple[bool]", tuple[bool]),
+):
+
+    @benchmark(f"casting.get_casting_type[{label}]")
+    def bench_get_casting_type(the_type=the_type):
+        """Derive a caster from a type annotation."""
+        return lambda: get_casting_type("BENCH", the_type)
+
+
+for size in (100, 10_000):
+    for label, inner, item in (("int", int, "12345"), ("bool", strtobool, "true"), ("str", str, " value ")):
+
+        @benchmark(f"casting.sequence_parser[{label},n={size}]")
+        def bench_sequence_parser(inner=inner, item=item, size=size):
+            """Parse a long comma-separated value."""
+            parse = get_sequence_parser(inner, tuple)
+            value = ",".join([item] * size)
+            return lambda: parse(value)
+
+
+for n_fields in (10, 50, 200):
+
+    @benchmark(f"config.from_config[fields={n_fields}]")
+    def bench_from_config(n_fields=n_fields):
+        """Derive a config from another configuration."""
+        config_class = make_config_class(f"From{n_fields}", n_fields, tuple(FIELD_KINDS))
+        source = config_class()
+        return lambda: config_class.from_config(source)
+
+
+for count in (100, 500):
+
+    @benchmark(f"config.gather_settings[classes={count}]")
+    def bench_gather_settings(count=count):
+        """Gather settings from many loaded config classes."""
+        classes = make_config_classes(f"Gather{count}x", count)
+
+        def gather(classes=classes):  # The registry is weak; keep the classes alive.
+            return BaseConfig.gather_settings()
+
+        return gather
+
+    @benchmark(f"config.generate_dot_env[classes={count}]")
+    def bench_generate_dot_env(count=count):
+        """Render a .env file for many config classes."""
+        classes = make_config_classes(f"DotEnv{count}x", count)
+        settings = BaseConfig.gather_settings()
+        del classes
+        return lambda: generate_dot_env(settings, generate_secrets=False)
@@ -0,0 +1,137 @@
+"""A small, dependency-free benchmark harness built on `timeit`"""
+from __future__ import annotations
+
+import inspect
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import time
+import timeit
+from contextlib import contextmanager, nullcontext
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Callable, Iterator, Optional, Union
+
+Setup = Callable[[], Union[Callable[[], object], Iterator[Callable[[], object]]]]
+
+BENCHMARKS: dict[str, Setup] = {}
+
+
+def benchmark(name: str):
+    """Register a benchmark setup function under the given name.
+
+    The decorated function performs any (untimed) setup and returns a
+    zero-argument callable, which is the code that gets timed. To clean
+    up once timing is done, the function may instead yield the callable.
+    """
+
+    def decorator(setup: Setup) -> Setup:
+        if name in BENCHMARKS:
+            raise ValueError(f"Duplicate benchmark name {name!r}")
+        BENCHMARKS[name] = setup
+        return setup
+
+    return decorator
+
+
+@dataclass
+class Result:
+    """Per-call timings for a single benchmark, in seconds."""
+
+    loops: int
+    repeat: int
+    min: float
+    median: float
+    mean: float
+    stdev: float
+
+
+def measure(setup: Setup, repeat: int = 5, min_time: float = 0.2) -> Result:
+    """Time the callable produced by `setup`.
+
+    The number of loops per repeat is calibrated so that each repeat
+    takes at least `min_time` seconds. Garbage collection is disabled
+    while timing, as with `timeit`.
+    """
+    with contextmanager(setup)() if inspect.isgeneratorfunction(setup) else nullcontext(setup()) as func:
+        timer = timeit.Timer(func)
+        loops = 1
+        while True:
+            if timer.timeit(loops) >= min_time:
+                break
+            loops *= 2
+        timings = [t / loops for t in timer.repeat(repeat=repeat, number=loops)]
+    return Result(
+        loops=loops,
+        repeat=repeat,
+        min=min(timings),
+        median=statistics.median(timings),
+        mean=statistics.fmean(timings),
+        stdev=statistics.stdev(timings) if len(timings) > 1 else 0.0,
+    )
+
+
+def get_commit() -> Optional[str]:
+    """Return the current git commit, if any."""
+    try:
+        out = subprocess.run(["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True)
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return out.stdout.strip()
+
+
+def run(names: Optional[list[str]] = None, repeat: int = 5, min_time: float = 0.2, echo=print) -> dict:
+    """Run the selected benchmarks (default: all) and return a JSON-ready report."""
+    selected = names or list(BENCHMARKS)
+    results = {}
+    for name in selected:
+        result = results[name] = measure(BENCHMARKS[name], repeat=repeat, min_time=min_time)
+        echo(f"{name:<50} {format_time(result.median):>12}  (±{format_time(result.stdev)})")
+
+    return {
+        "meta": {
+            "commit": get_commit(),
+            "python": sys.version,
+            "implementation": platform.python_implementation(),
+            "platform": platform.platform(),
+            "timestamp": time.time(),
+        },
+        "benchmarks": {name: asdict(result) for name, result in results.items()},
+    }
+
+
+def compare(baseline: dict, current: dict, threshold: float) -> list[tuple[str, float]]:
+    """Compare median timings between two reports.
+
+    Return a list of `(name, ratio)` for benchmarks whose median
+    slowed down by more than `threshold` (e.g. `1.25` for 25%).
+    Benchmarks missing from either report are ignored.
+    """
+    regressions = []
+    for name, result in current["benchmarks"].items():
+        if (old := baseline["benchmarks"].get(name)) is None:
+            continue
+        ratio = result["median"] / old["median"]
+        if ratio > threshold:
+            regressions.append((name, ratio))
+    return regressions
+
+
+def load(path: Path) -> dict:
+    """Load a report previously written by `dump`."""
+    return json.loads(Path(path).read_text())
+
+
+def dump(report: dict, path: Path) -> None:
+    """Write a report as JSON."""
+    Path(path).write_text(json.dumps(report, indent=2, sort_keys=True) + "\n")
+
+
+def format_time(seconds: float) -> str:
+    """Format a duration with a human-friendly unit."""
+    for unit, scale in (("s", 1), ("ms", 1e-3), ("µs", 1e-6)):
+        if seconds >= scale:
+            return f"{seconds / scale:.3f} {unit}"
+    return f"{seconds / 1e-9:.1f} ns"
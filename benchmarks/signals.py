@@ -0,0 +1,81 @@
+"""Benchmarks for sending signals"""
+from __future__ import annotations
+
+import asyncio
+import atexit
+
+from benchmarks.runner import benchmark
+from convoke.bases import HQ
+from convoke.signals import Signal
+
+
+SENDS = 100
+
+loop = asyncio.new_event_loop()
+atexit.register(loop.close)
+
+
+class BenchSendSignal(Signal):
+    """A signal for synthetic receivers to receive."""
+
+
+def make_sender(n_receivers: int, kind: str):
+    """Connect synthetic receivers to a fresh HQ, and return a function that sends `SENDS` messages.
+
+    Sending in batches keeps event loop overhead out of the timings.
+    """
+    hq = HQ()
+    for _ in range(n_receivers):
+        if kind == "sync":
+
+            def receiver(msg):
+                pass
+
+        else:
+
+            async def receiver(msg):
+                pass
+
+        hq.connect_signal_receiver(BenchSendSignal, receiver)
+
+    msg = BenchSendSignal.Message(value="bench")
+
+    async def send():
+        for _ in range(SENDS):
+            await hq.send_signal(BenchSendSignal, msg)
+
+    return lambda: loop.run_until_complete(send())
+
+
+for n_receivers in (1, 10, 100):
+    for kind in ("sync", "async"):
+
+        @benchmark(f"signal.send[receivers={n_receivers},{kind},x{SENDS}]")
+        def bench_send(n_receivers=n_receivers, kind=kind):
+            """Send a message to many receivers."""
+            return make_sender(n_receivers, kind)
+
+
+def make_signal_sender(n_receivers: int):
+    """Like `make_sender`, but sending through `Signal.send`, including message construction."""
+    hq = HQ()
+    for _ in range(n_receivers):
+
+        def receiver(msg):
+            pass
+
+        hq.connect_signal_receiver(BenchSendSignal, receiver)
+
+    async def send():
+        for _ in range(SENDS):
+            await BenchSendSignal.send(value="bench", using=hq)
+
+    return lambda: loop.run_until_complete(send())
+
+
+for n_receivers in (0, 1, 10):
+
+    @benchmark(f"signal.Signal.send[receivers={n_receivers},x{SENDS}]")
+    def bench_signal_send(n_receivers=n_receivers):
+        """Send messages through the public API."""
+        return make_signal_sender(n_receivers)
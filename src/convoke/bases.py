@@ -18,23 +18,48 @@ separation of initialization and execution.
 """
 from __future__ import annotations
 
+import asyncio
 import importlib
 import inspect
 import logging
+import operator
+import sys
+import time
 from collections import defaultdict
 from collections.abc import Sequence
-from contextvars import ContextVar
-from dataclasses import dataclass, field
+from concurrent.futures import FIRST_COMPLETED, Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from contextlib import contextmanager, nullcontext
+from contextvars import ContextVar, copy_context
+from dataclasses import dataclass, field, replace
+from functools import partial
 from pathlib import Path
-from typing import ClassVar, Optional, Type, Union
+from types import MethodType
+from typing import Awaitable, Callable, ClassVar, ContextManager, Hashable, Iterator, Optional, Type, Union
+from weakref import WeakMethod, ref
 
 from convoke.configs import BaseConfig
+from convoke.graphs import DependencyGraph
 from convoke.inspectors import is_async_callable
+from convoke.metrics import SignalMetrics
 from convoke.mountpoints import Mountpoint, MountpointDict
-from convoke.signals import Receiver, Signal
+from convoke.profiling import (
+    ImportProfiler,
+    StartupProfiler,
+    current_import_profiler,
+    current_profiler,
+    profile_phase,
+)
+from convoke.queues import SignalQueue
+from convoke.rates import RateLimiter
+from convoke.recording import SignalRecorder
+from convoke.signals import Connection, Receiver, Signal, receiver_key
+from convoke.transports import Transport
 
 PATH = Path(__file__).absolute().parent
 
+_defer_initialization: ContextVar[bool] = ContextVar("_defer_initialization", default=False)
+_preset_config: ContextVar[Optional[BaseConfig]] = ContextVar("_preset_config", default=None)
+
 
 @dataclass
 class HQ:
@@ -44,12 +69,76 @@ class HQ:
     discovered by the dependency loader.
 
         hq = HQ(config=MyConfig(), dependencies=['foo'])
+
+    To profile startup, provide a
+    [`StartupProfiler`][convoke.profiling.StartupProfiler]:
+
+        hq = HQ(config=MyConfig(), profiler=StartupProfiler())
+
+    To attribute import time (and memory) to each dependency, provide an
+    [`ImportProfiler`][convoke.profiling.ImportProfiler]:
+
+        hq = HQ(config=MyConfig(), import_profiler=ImportProfiler())
+
+    To measure signal dispatch, provide
+    [`SignalMetrics`][convoke.metrics.SignalMetrics]:
+
+        hq = HQ(config=MyConfig(), metrics=SignalMetrics(slow_threshold=0.05))
+
+    To record signal traffic, for replay in load tests, provide a
+    [`SignalRecorder`][convoke.recording.SignalRecorder]:
+
+        hq = HQ(config=MyConfig(), recorder=SignalRecorder())
+
+    Signals may be sent from threads other than the event loop's via
+    `Signal.send_threadsafe()`, which schedules sends on `hq.loop`. Set
+    it when instantiating the HQ, or let
+    [`aload_dependencies`][convoke.bases.HQ.aload_dependencies] record
+    the running loop.
+
+    To broadcast signals to sibling processes, provide a
+    [`Transport`][convoke.transports.Transport]. It starts on `hq.loop`
+    when dependencies are loaded with `aload_dependencies()`, and stops
+    on `shutdown()`:
+
+        hq = HQ(config=MyConfig(), transport=UnixSocketTransport('/run/myapp/signals'))
+
+    Once dependencies are loaded, `hq.graph` holds the
+    [`DependencyGraph`][convoke.graphs.DependencyGraph].
+
+    In lazy mode, loading dependencies only records them. Each Base
+    (along with its own dependencies) is imported, instantiated and
+    made ready the first time it is looked up in `hq.bases`, or when a
+    signal it responds to is sent, or a mountpoint it registers with is
+    looked up:
+
+        hq = HQ(config=MyConfig(), lazy=True)
+        hq.load_dependencies(['foo', 'bar'])  # Nothing imported yet
+        hq.bases['foo']  # Imports and loads foo and its dependencies
+
+    Note that in lazy mode, signals and mountpoints can only load
+    pending Bases whose modules have already been imported (e.g. by the
+    module sending the signal).
     """
 
     config: BaseConfig = field(default_factory=BaseConfig, repr=False)
-
-    bases: dict[str, Base] = field(init=False, default_factory=dict, repr=False)
-    signal_receivers: dict[Type[Signal], set[Receiver]] = field(init=False, default_factory=lambda: defaultdict(set))
+    profiler: Optional[StartupProfiler] = field(default=None, repr=False)
+    import_profiler: Optional[ImportProfiler] = field(default=None, repr=False)
+    metrics: Optional[SignalMetrics] = field(default=None, repr=False)
+    recorder: Optional[SignalRecorder] = field(default=None, repr=False)
+    lazy: bool = field(default=False, repr=False)
+    signal_queue: SignalQueue = field(default_factory=SignalQueue, repr=False)
+    loop: Optional[asyncio.AbstractEventLoop] = field(default=None, repr=False)
+    transport: Optional[Transport] = field(default=None, repr=False)
+
+    bases: BaseDict[str, Base] = field(init=False, repr=False)
+    graph: DependencyGraph = field(init=False, default_factory=DependencyGraph, repr=False)
+    background_tasks: set[asyncio.Task] = field(init=False, default_factory=set, repr=False)
+    signal_receivers: dict[Type[Signal], dict[Hashable, Connection]] = field(
+        init=False, default_factory=lambda: defaultdict(dict)
+    )
+    dispatch_tables: dict[Type[Signal], tuple[Connection, ...]] = field(init=False, default_factory=dict, repr=False)
+    rate_limiters: dict[Type[Signal], RateLimiter] = field(init=False, default_factory=dict, repr=False)
     mountpoints: MountpointDict[Type[Mountpoint], Mountpoint] = field(init=False, default_factory=MountpointDict)
 
     hq: HQ = field(init=False)
@@ -58,6 +147,12 @@ class HQ:
 
     def __post_init__(self):
         self.hq = self
+        self.bases = BaseDict(self)
+        self.signal_queue.hq = self
+        if self.transport is not None:
+            self.transport.hq = self
+        if self.lazy:
+            self.mountpoints = LazyMountpointDict(self)
         self.current_instance.set(self)
 
     @classmethod
@@ -65,40 +160,462 @@ class HQ:
         """Return the instance of HQ for the current context."""
         return cls.current_instance.get()
 
-    def reset(self):
+    def reset(self, force: bool = False) -> list[str]:
         """Reset this HQ and its associated Bases.
 
-        Primarily, this re-establishes this instance as the current HQ
-        instance, and re-initializes bases.
+        Primarily, this re-establishes this instance (and each Base) as
+        the current instance, and re-initializes Bases.
+
+        Each Base's config is derived anew, and only Bases whose derived
+        config has changed are re-initialized, unless `force` is given.
 
+        :param bool force: re-initialize all Bases, even if their configs are unchanged
+        :return: the names of the Bases that were re-initialized
         """
         self.current_instance.set(self)
+        changed = self._changed_configs(force)
+        for name, base in self.bases.items():
+            if name in changed:
+                base.reset(config=changed[name])
+            else:
+                base.current_instance.set(base)
+        return list(changed)
+
+    def make_current(self):
+        """Establish this HQ, and each of its Bases, as the current instance in this context."""
+        self.current_instance.set(self)
+        for base in self.bases.values():
+            base.current_instance.set(base)
+
+    def clone(self) -> HQ:
+        """Return an independent copy of this HQ, without reloading dependencies.
+
+        The clone shares this HQ's config, dependency graph and modules,
+        but has its own Bases. Each new Base is created from the already-
+        derived config of its counterpart, then initialized (`on_init`),
+        registered and made ready (`on_ready`) as usual. Only receivers
+        and mounted functions declared on the Bases (such as with
+        `Base.responds`) are registered; anything else connected to this
+        HQ, whether by `on_init` or from outside, is not copied.
+
+        The clone has no metrics, recorder, transport, profilers or event
+        loop of its own, and doesn't share this HQ's, so that its traffic
+        isn't mixed up with this HQ's.
+
+        The clone becomes the current HQ, and its Bases the current Bases.
+
+        Bases with async lifecycle hooks are not supported.
+        """
+        if names := [name for name, base in self.bases.items() if base.has_async_lifecycle()]:
+            raise TypeError(f"Cannot clone Bases with async lifecycle hooks: {names}")
+
+        clone = HQ(config=self.config, lazy=self.lazy, signal_queue=replace(self.signal_queue, hq=None))
+        clone.graph.update(self.graph.roots, self.graph.edges)
+        clone.bases.pending.update(self.bases.pending)
+
+        counterparts: dict[int, Base] = {}
+        defer_token = _defer_initialization.set(True)
+        try:
+            for name, base in self.bases.items():
+                preset_token = _preset_config.set(base.config)
+                try:
+                    clone.bases[name] = counterparts[id(base)] = type(base)(hq=clone)
+                finally:
+                    _preset_config.reset(preset_token)
+        finally:
+            _defer_initialization.reset(defer_token)
+
         for base in self.bases.values():
-            base.reset()
+            counterparts[id(base)].bases.update((name, clone.bases[name]) for name in base.bases)
+
+        for base in clone.bases.values():
+            base.on_init()
+            base._register_special_methods()
+        for base in clone.bases.values():
+            base.ready()
+        return clone
+
+    async def areset(self, force: bool = False) -> list[str]:
+        """Reset this HQ and its associated Bases, awaiting async initialization.
+
+        As with [`reset`][convoke.bases.HQ.reset], only Bases whose
+        derived config has changed are re-initialized, unless `force` is
+        given. Bases are re-initialized concurrently, except that each
+        Base waits for the Bases it depends on.
 
-    def load_dependencies(self, dependencies: Sequence[str]):
+        :param bool force: re-initialize all Bases, even if their configs are unchanged
+        :return: the names of the Bases that were re-initialized
+        """
+        self.current_instance.set(self)
+        changed = self._changed_configs(force)
+
+        async def reset_base(name: str):
+            # Unchanged Bases are skipped, but still scheduled, so that order is kept through them.
+            if name in changed:
+                await self.bases[name].areset(config=changed[name])
+
+        await self._run_in_dependency_order(list(self.bases), reset_base)
+        for base in self.bases.values():
+            # Context changes made within tasks don't propagate back to us.
+            base.current_instance.set(base)
+        return list(changed)
+
+    def _changed_configs(self, force: bool) -> dict[str, BaseConfig]:
+        """Derive each Base's config, returning those that differ from the current ones."""
+        changed = {}
+        for name, base in self.bases.items():
+            config = base.config_class.from_config(self.config)
+            if force or config != base.config:
+                changed[name] = config
+        return changed
+
+    def load_dependencies(
+        self,
+        dependencies: Sequence[str],
+        max_workers: Optional[int] = None,
+        graph_cache: Union[str, Path, None] = None,
+    ):
         """Load peripheral Base dependencies.
 
+        Loading happens in two phases. First, dependency modules are
+        imported and the dependency graph is discovered (see
+        [`discover_dependencies`][convoke.bases.discover_dependencies]).
+        Then Bases are instantiated in depth-first, left-to-right order,
+        and finally made ready.
+
+        With a `graph_cache` path, the discovered graph is saved to that
+        file. On later loads with the same dependencies, discovery is
+        skipped, and modules are preloaded in topological order from the
+        cached graph. A stale or unreadable cache is rediscovered and
+        rewritten.
+
         :param Sequence[str] dependencies: a list of dotted paths to
             modules/packages that contain a Base subclass named `Main`.
+        :param int max_workers: import independent modules concurrently on
+            a pool of this many threads (default: import sequentially)
+        :param Path graph_cache: a file in which to cache the dependency graph
+            (ignored in lazy mode)
         """
-        load_dependencies(self, dependencies)
-        for base in self.bases.values():
-            base.ready()
-            logging.debug(f"{base.__module__} reports ready")
+        if self.lazy:
+            self.graph.update(dependencies, {})
+            self.bases.pending.update(dict.fromkeys(name for name in dependencies if name not in self.bases))
+            return
+
+        with self._profiling():
+            graph = self._discover_graph(dependencies, max_workers, graph_cache)
+            _check_sync_lifecycle(graph)
+            self.graph.update(graph.roots, graph.edges)
+            load_dependencies(self, dependencies)
+            for name, base in self.bases.items():
+                with self._profile("on_ready", name):
+                    base.ready()
+                logging.debug(f"{base.__module__} reports ready")
+
+    async def aload_dependencies(
+        self,
+        dependencies: Sequence[str],
+        max_workers: Optional[int] = None,
+        graph_cache: Union[str, Path, None] = None,
+    ):
+        """Load peripheral Base dependencies, awaiting async lifecycle hooks.
+
+        Bases may define `async def on_init()` and/or `async def
+        on_ready()`. Dependency modules are imported in a worker thread,
+        to avoid blocking the event loop, and Bases are instantiated as
+        with [`load_dependencies`][convoke.bases.HQ.load_dependencies].
+
+        Then, all Bases are initialized (`on_init`), and finally made
+        ready (`on_ready`). In each step, Bases with no dependency
+        relation run their hooks concurrently, while each Base waits for
+        the Bases it depends on to finish. Dependency cycles are broken
+        as in [`DependencyGraph.topological_order`][convoke.graphs.DependencyGraph.topological_order].
+
+        In lazy mode, this only records the dependencies.
+
+        Unless already set, the running event loop is recorded as
+        `hq.loop`, and the HQ's transport, if any, is started on it.
 
-    def connect_signal_receiver(self, signal_class: Type[Signal], receiver: Receiver):
+        :param Sequence[str] dependencies: a list of dotted paths to
+            modules/packages that contain a Base subclass named `Main`.
+        :param int max_workers: import independent modules concurrently on
+            a pool of this many threads (default: import sequentially)
+        :param Path graph_cache: a file in which to cache the dependency graph
+            (ignored in lazy mode)
+        """
+        if self.loop is None:
+            self.loop = asyncio.get_running_loop()
+        if self.transport is not None:
+            self.transport.start(self.loop)
+        if self.lazy:
+            self.load_dependencies(dependencies)
+            return
+
+        with self._profiling():
+            graph = await asyncio.to_thread(self._discover_graph, dependencies, max_workers, graph_cache)
+            self.graph.update(graph.roots, graph.edges)
+            defer_token = _defer_initialization.set(True)
+            try:
+                load_dependencies(self, dependencies)
+            finally:
+                _defer_initialization.reset(defer_token)
+
+            names = [name for name in self.bases if name in graph.edges]
+            await self._run_in_dependency_order(names, self._initialize_base)
+            await self._run_in_dependency_order(names, self._ready_base)
+
+    async def shutdown(self, timeout: Optional[float] = None) -> ShutdownReport:
+        """Shut down all Bases, calling their `on_shutdown` hooks.
+
+        Hooks run in reverse dependency order: each Base waits for the
+        Bases that depend on it to shut down first. Hooks with no
+        dependency relation run concurrently. Synchronous hooks run in a
+        worker thread, so that they can't block the event loop.
+
+        First, any messages posted and still queued, or held back by rate
+        policies, are delivered, and background deliveries (such as
+        async receivers scheduled by `send_signal_sync`, and messages
+        from sibling processes) are awaited, all within `timeout`.
+        Deliveries still unfinished then are cancelled, and counted in
+        the report as abandoned. Then the transport, if any, is stopped.
+
+        Each hook has its own deadline, either `timeout` or the Base's
+        `shutdown_timeout`. Hooks that miss their deadline, or fail, are
+        logged and reported rather than holding up the shutdown; Bases
+        that depend on them proceed regardless.
+
+        :param float timeout: the number of seconds to allow for delivering outstanding signals,
+            and the default number to allow each hook (default: no deadline)
+        :return: a report of which Bases shut down, timed out or failed.
+        """
+        report = ShutdownReport()
+        try:
+            async with asyncio.timeout(timeout):
+                await self.signal_queue.join()
+                await self._drain()
+        except TimeoutError:
+            logging.warning(f"Outstanding signals were not delivered within {timeout} seconds")
+        report.abandoned = await self._abandon_deliveries()
+        if self.transport is not None:
+            await self.transport.stop()
+
+        async def shutdown_base(name: str):
+            base = self.bases[name]
+            if type(base).on_shutdown is Base.on_shutdown:
+                # Nothing to do, but Bases beyond this one may still depend on its dependents.
+                return
+            deadline = base.shutdown_timeout if base.shutdown_timeout is not None else timeout
+            try:
+                await asyncio.wait_for(base.ashutdown(), deadline)
+            except TimeoutError:
+                logging.warning(f"{name} did not shut down within {deadline} seconds")
+                report.timed_out.append(name)
+            except Exception as exc:
+                logging.exception(f"Exception occurred while shutting down {name}")
+                report.failed[name] = exc
+            else:
+                report.completed.append(name)
+
+        await self._run_in_dependency_order(list(self.bases), shutdown_base, reverse=True)
+        return report
+
+    async def _drain(self):
+        """Wait for held and background deliveries, including any that they start in turn."""
+        while True:
+            for limiter in list(self.rate_limiters.values()):
+                await limiter.flush()
+            if not self.background_tasks:
+                return
+            # Receiver errors are already logged by the tasks themselves. Shielded, so that if
+            # shutdown times out, the tasks are left to `_abandon_deliveries()` to cancel and count.
+            await asyncio.gather(*map(asyncio.shield, self.background_tasks), return_exceptions=True)
+
+    async def _abandon_deliveries(self) -> int:
+        """Cancel whatever `_drain()` left unfinished, returning the number of deliveries abandoned."""
+        abandoned = await self.signal_queue.cancel()
+        for limiter in list(self.rate_limiters.values()):
+            abandoned += await limiter.cancel()
+        cancelled = [task for task in list(self.background_tasks) if task.cancel()]
+        await asyncio.gather(*cancelled, return_exceptions=True)
+        return abandoned + len(cancelled)
+
+    async def _initialize_base(self, name: str):
+        base = self.bases[name]
+        with self._profile("on_init", name):
+            await base._initialize()
+        with self._profile("register", name):
+            base._register_special_methods()
+
+    async def _ready_base(self, name: str):
+        base = self.bases[name]
+        with self._profile("on_ready", name):
+            await base.aready()
+        logging.debug(f"{base.__module__} reports ready")
+
+    async def _run_in_dependency_order(self, names: Sequence[str], func: Callable[[str], Awaitable], reverse=False):
+        """Await `func(name)` for each name, concurrently, except that each waits for its dependencies.
+
+        With `reverse`, each instead waits for its dependents.
+        Dependency cycles are broken as in `DependencyGraph.topological_order()`.
+        """
+        edges = self.graph.acyclic_edges(reverse=reverse)
+        tasks: dict[str, asyncio.Task] = {}
+
+        async def run(name: str):
+            if waits := [tasks[dep] for dep in edges.get(name, ()) if dep in tasks]:
+                await asyncio.wait(waits)
+                if any(task.cancelled() or task.exception() is not None for task in waits):  # pragma: nocover
+                    # The task group is already failing, and should have cancelled us; don't start anything new.
+                    return
+            await func(name)
+
+        try:
+            async with asyncio.TaskGroup() as group:
+                for name in names:
+                    tasks[name] = group.create_task(run(name))
+        except ExceptionGroup as errors:
+            if len(errors.exceptions) == 1:
+                raise errors.exceptions[0] from None
+            raise  # pragma: nocover
+
+    @contextmanager
+    def _profiling(self) -> Iterator[None]:
+        """Make this HQ's profilers current for the block, installing the import hook if needed."""
+        token = current_profiler.set(self.profiler)
+        import_token = current_import_profiler.set(self.import_profiler)
+        try:
+            with self.import_profiler.tracing() if self.import_profiler else nullcontext():
+                yield
+        finally:
+            current_import_profiler.reset(import_token)
+            current_profiler.reset(token)
+
+    def _profile(self, label: str, name: str) -> ContextManager:
+        """Time the block as a startup phase of the named dependency, if profiling."""
+        return self.profiler.phase(label, name) if self.profiler else nullcontext()
+
+    def load_base(self, name: str) -> Base:
+        """Load a pending Base, along with its dependencies, in lazy mode.
+
+        Bases are instantiated in depth-first, left-to-right order, as
+        with eager loading, and newly-loaded Bases are then made ready.
+        """
+        with self._profiling():
+            graph = discover_dependencies([name])
+            _check_sync_lifecycle(graph)
+            self.graph.update((), graph.edges)
+            for new_name in graph.nodes:
+                # No longer pending, even while loading, to avoid re-entrant loads.
+                self.bases.pending.pop(new_name, None)
+            loaded = set(self.bases)
+            load_dependencies(self, [name], seen=dict(self.bases))
+            for new_name, base in list(self.bases.items()):
+                if new_name not in loaded:
+                    with self._profile("on_ready", new_name):
+                        base.ready()
+                    logging.debug(f"{base.__module__} reports ready")
+        return self.bases[name]
+
+    def load_pending_responders(self, key: Union[Type[Signal], Type[Mountpoint]]) -> None:
+        """Load pending Bases that respond to the given Signal or register with the given Mountpoint.
+
+        Bases that respond to a hierarchical ancestor of the Signal are
+        loaded too. Only pending Bases whose modules have already been imported are
+        considered.
+        """
+        targets = key.dispatch_classes() if issubclass(key, Signal) else (key,)
+        for name in list(self.bases.pending):
+            if name in self.bases.pending and (mod := sys.modules.get(name)) is not None:
+                if not mod.Main.__special_targets__.isdisjoint(targets):
+                    self.load_base(name)
+
+    def _discover_graph(
+        self, dependencies: Sequence[str], max_workers: Optional[int], graph_cache: Union[str, Path, None]
+    ) -> DependencyGraph:
+        """Discover the dependency graph, or load and preload it from a cache file.
+
+        The cache is only an optimization: if it can't be read or written,
+        a warning is logged, and the graph is discovered as usual.
+        """
+        if graph_cache is not None and Path(graph_cache).exists():
+            try:
+                graph = DependencyGraph.load(graph_cache)
+            except (OSError, ValueError):
+                logging.warning(f"Ignoring unreadable dependency graph cache {graph_cache}", exc_info=True)
+            else:
+                try:
+                    if graph.roots == tuple(dependencies) and preload_dependencies(graph, max_workers=max_workers):
+                        return graph
+                except ImportError:
+                    # The cache names a module that no longer exists; rediscover.
+                    pass
+
+        graph = discover_dependencies(dependencies, max_workers=max_workers)
+        if graph_cache is not None:
+            try:
+                graph.dump(graph_cache)
+            except OSError:
+                logging.warning(f"Couldn't write dependency graph cache {graph_cache}", exc_info=True)
+        return graph
+
+    def connect_signal_receiver(
+        self,
+        signal_class: Type[Signal],
+        receiver: Receiver,
+        batch: bool = False,
+        executor: Union[Executor, bool, None] = None,
+        weak: bool = False,
+        timeout: Optional[float] = None,
+    ):
         """Connect a receiver function to the given Signal subclass.
 
         All connections are local to this HQ instance. Mostly used
         internally via the `Base.responds(SignalSubclass)` decorator.
+        Connecting an already-connected receiver replaces its options.
+
+        A blocking sync receiver may be run in an `executor`, so that it
+        doesn't stall the event loop. Receivers run in a thread pool see
+        the sender's context variables. Receivers run in a process pool
+        (and their messages) must be picklable, so only module-level
+        functions can be; Base methods are refused.
+
+        A `weak` connection holds only a weak reference to the receiver
+        (a `WeakMethod` for bound methods), so that it doesn't keep the
+        receiver, or its instance, alive. Once the receiver is garbage-
+        collected, its connection is discarded during the next send.
+
+        A receiver with a `timeout` is cancelled if a call takes longer,
+        and the timeout is logged as a warning. A sync receiver can only
+        time out if it runs in an executor, and even then, its thread
+        runs on; the send just stops waiting for it.
 
         :param Type[Signal] signal_class: The Signal subclass to connect to.
         :param Receiver receiver: a Callable that accepts a message of the type
             defined on the Signal subclass.
+        :param bool batch: call the receiver with a list of messages, rather than one at a time
+        :param Executor executor: run a sync receiver in this executor, rather than on the event loop
+            (`True` for the event loop's default thread pool)
+        :param bool weak: hold only a weak reference to the receiver
+        :param float timeout: the most seconds to allow each call to the receiver
 
         """
-        self.signal_receivers[signal_class].add(receiver)
+        is_async = is_async_callable(receiver)
+        if executor and is_async:
+            raise TypeError(f"Only sync receivers can run in an executor: {receiver!r}")
+        if timeout is not None and not (is_async or executor):
+            raise TypeError(f"Only async receivers, or sync receivers run in an executor, can time out: {receiver!r}")
+        if isinstance(executor, ProcessPoolExecutor) and isinstance(getattr(receiver, "__self__", None), Base):
+            raise TypeError(
+                f"Base methods can't run in a process pool; use a thread pool, "
+                f"or connect a module-level function with Signal.connect(): {receiver!r}"
+            )
+        if weak:
+            receiver = WeakMethod(receiver) if isinstance(receiver, MethodType) else ref(receiver)
+        receivers = self.signal_receivers[signal_class]
+        key = receiver_key(receiver() if weak else receiver)
+        connection = Connection(receiver, is_async, batch=batch, executor=executor, weak=weak, timeout=timeout)
+        if receivers.get(key) != connection:
+            receivers[key] = connection
+            self._rebuild_dispatch_table(signal_class)
 
     def disconnect_signal_receiver(self, signal_class: Type[Signal], receiver: Receiver):
         """Disconnect a receiver function previously connected to the given Signal subclass.
@@ -106,27 +623,656 @@ class HQ:
         :param Type[Signal] signal_class: The Signal subclass to disconnect from.
         :param Receiver receiver: a previously-connected Callable.
         """
-        self.signal_receivers[signal_class].discard(receiver)
+        if (receivers := self.signal_receivers.get(signal_class)) and receivers.pop(receiver_key(receiver), None):
+            self._rebuild_dispatch_table(signal_class)
+
+    def receivers(self, signal_class: Type[Signal]) -> list[Receiver]:
+        """Return the receivers connected to the given Signal subclass, in connection order.
+
+        Only receivers connected to the class itself are included, not
+        those of its hierarchical ancestors, nor weakly-connected
+        receivers that have been garbage-collected. (`signal_receivers`
+        holds each class's connections, keyed by
+        [`receiver_key`][convoke.signals.receiver_key].)
+
+        :param Type[Signal] signal_class: The Signal subclass whose receivers to return.
+        """
+        connections = self.signal_receivers.get(signal_class, {}).values()
+        return [receiver for connection in connections if (receiver := connection.resolve()) is not None]
+
+    def _discard_dead_receivers(self):
+        """Discard weak connections whose receivers have been garbage-collected."""
+        for signal_class, receivers in self.signal_receivers.items():
+            dead = [key for key, connection in receivers.items() if connection.resolve() is None]
+            for key in dead:
+                del receivers[key]
+            if dead:
+                self._rebuild_dispatch_table(signal_class)
+
+    def _rebuild_dispatch_table(self, signal_class: Type[Signal]):
+        """Rebuild the dispatch table for a Signal subclass, and forget those of its subclasses.
+
+        Tables for subclasses (which may include this class's receivers,
+        with hierarchical dispatch) are rebuilt the next time they are sent.
+        """
+        for cached_class in list(self.dispatch_tables):
+            if cached_class is not signal_class and issubclass(cached_class, signal_class):
+                del self.dispatch_tables[cached_class]
+        self._build_dispatch_table(signal_class)
 
-    async def send_signal(self, signal_class: Type[Signal], msg):
+    def _build_dispatch_table(self, signal_class: Type[Signal]) -> tuple[Connection, ...]:
+        """Snapshot the connections that receive a Signal subclass, for sending.
+
+        Receivers of the class itself come first, then those of its
+        hierarchical ancestors, each in connection order.
+        """
+        connections = {}
+        for dispatch_class in signal_class.dispatch_classes():
+            for receiver, connection in self.signal_receivers.get(dispatch_class, {}).items():
+                connections.setdefault(receiver, connection)
+        table = self.dispatch_tables[signal_class] = tuple(connections.values())
+        return table
+
+    async def send_signal(
+        self,
+        signal_class: Type[Signal],
+        msg,
+        concurrent: Optional[bool] = None,
+        max_concurrency: Optional[int] = None,
+        deadline: Optional[float] = None,
+    ):
         """Send a Message to all receivers of the given Signal subclass.
 
+        Receivers are called in the order they were connected. Each send
+        uses the receivers connected at the start of the send; receivers
+        connected or disconnected while sending take effect from the next.
+        Batch receivers receive a list of one message.
+
+        By default, receivers are awaited one after another. When
+        `concurrent`, sync receivers are still called in turn, but async
+        receivers (and sync receivers run in an executor) run concurrently (at most `max_concurrency` at a
+        time), so that the send takes only as long as the slowest
+        receiver. Either way, an exception in one receiver is logged
+        without affecting the others.
+
+        With a `deadline`, receivers still running when it passes are
+        cancelled, and the rest are skipped. A missed deadline is logged
+        as a warning, rather than raised. Sync receivers can't be
+        interrupted, and don't let the event loop notice the deadline, so
+        it is also checked before calling each receiver: a slow sync
+        receiver may overrun the deadline, but no receiver starts after it.
+
+        Messages of `broadcast` Signals are also published on the HQ's
+        transport, if any, once local receivers have been sent them.
+        Messages that can't be serialized are logged, and not broadcast.
+
+        Messages of Signals with a `rate_policy` are held back by the
+        policy, and released later, from a background task (see
+        [`RatePolicy`][convoke.rates.RatePolicy]). Released messages are sent
+        with the Signal's own `concurrent`, `max_concurrency` and
+        `deadline`.
+
         :param Type[Signal] signal_class: The Signal subclass to send
         :param Any msg: An instance of signal_class.Message
+        :param bool concurrent: run async receivers concurrently (defaults to `signal_class.concurrent`)
+        :param int max_concurrency: the most async receivers to run at once
+            (defaults to `signal_class.max_concurrency`; `None` for no limit)
+        :param float deadline: the most seconds the send may take
+            (defaults to `signal_class.deadline`; `None` for no limit)
         """
-        for receiver in self.signal_receivers[signal_class]:
+        if self.recorder is not None:
+            self.recorder.record(signal_class, msg)
+        if signal_class.rate_policy is not None:
+            self._get_rate_limiter(signal_class).submit((msg,))
+        elif (
+            concurrent
+            or (concurrent is None and signal_class.concurrent)
+            or deadline is not None
+            or signal_class.deadline is not None
+            or self.metrics is not None
+            or self.bases.pending
+        ):
+            await self._send(signal_class, (msg,), concurrent, max_concurrency, deadline)
+        else:
+            # The common case, kept flat: a sequential send of one message.
+            if (connections := self.dispatch_tables.get(signal_class)) is None:
+                connections = self._build_dispatch_table(signal_class)
+            for connection in connections:
+                if connection.direct:
+                    try:
+                        if connection.is_async:
+                            await connection.receiver(msg)
+                        else:
+                            connection.receiver(msg)
+                    except Exception:
+                        self._log_receiver_error(signal_class, connection.receiver, msg)
+                else:
+                    await self._deliver_all(signal_class, connection, (msg,))
+        if signal_class.broadcast and self.transport is not None:
+            self._publish(signal_class, (msg,))
+
+    def _publish(self, signal_class: Type[Signal], msgs: Sequence) -> None:
+        """Publish messages of a broadcast Signal on the transport, logging any that can't be serialized."""
+        for msg in msgs:
             try:
-                if is_async_callable(receiver):
-                    await receiver(msg)
+                self.transport.publish(signal_class, msg)
+            except Exception:
+                logging.exception(f"Exception occurred while broadcasting {signal_class!r}:\n Message: {msg!r}")
+
+    def send_signal_sync(self, signal_class: Type[Signal], msg) -> None:
+        """Send a Message to all receivers of the given Signal subclass, synchronously.
+
+        Sync receivers are called in turn, in the calling thread (even
+        those connected with an executor, and regardless of any
+        `timeout`). Async receivers can't be awaited here, so they are
+        scheduled as tasks: on the running event loop, if called from
+        one, or else on `hq.loop`. Receiver exceptions are logged, as
+        with [`send_signal`][convoke.bases.HQ.send_signal].
+
+        While `hq.loop` runs in another thread, the HQ belongs to that
+        thread, and this only reads from it: sync receivers are still
+        called in the calling thread, but recording metrics and
+        discarding dead weak receivers are left to the loop. If the
+        Signal's dispatch table has yet to be built, or Bases are pending
+        (in lazy mode), the whole send is left to the loop, so that sync
+        receivers are called there, after this returns.
+
+        :param Type[Signal] signal_class: The Signal subclass to send
+        :param Any msg: An instance of signal_class.Message
+        :raises RuntimeError: if there are async receivers, but no event loop to run them on
+        """
+        if self.recorder is not None:
+            self.recorder.record(signal_class, msg)
+        if signal_class.rate_policy is not None:
+            try:
+                limiter = self._get_rate_limiter(signal_class)
+            except RuntimeError:  # Not called from an event loop
+                self._get_scheduler()(self._submit_rate_limited(signal_class, (msg,)))
+            else:
+                limiter.submit((msg,))
+        else:
+            self._send_sync(signal_class, msg)
+        if signal_class.broadcast and self.transport is not None:
+            self._publish(signal_class, (msg,))
+
+    def _send_sync(self, signal_class: Type[Signal], msg) -> None:
+        if (loop := self._get_owning_loop()) is not None:
+            if self.bases.pending or (connections := self.dispatch_tables.get(signal_class)) is None:
+                # Loading Bases, or building the dispatch table, would change the HQ; leave it all to the loop.
+                loop.call_soon_threadsafe(self._send_sync, signal_class, msg)
+                return
+            schedule = partial(asyncio.run_coroutine_threadsafe, loop=loop)
+            defer = loop.call_soon_threadsafe
+        else:
+            if self.bases.pending:
+                self.load_pending_responders(signal_class)
+            if (connections := self.dispatch_tables.get(signal_class)) is None:
+                connections = self._build_dispatch_table(signal_class)
+            schedule = self._get_scheduler() if any(connection.is_async for connection in connections) else None
+            defer = operator.call
+        metrics = self.metrics
+        start = time.perf_counter()
+        for connection in connections:
+            if connection.is_async:
+                schedule(self._deliver_all(signal_class, connection, (msg,)))
+            else:
+                self._call_sync(signal_class, connection, msg, defer)
+        if metrics is not None:
+            defer(metrics.record_send, signal_class, 1, time.perf_counter() - start)
+
+    def _get_owning_loop(self) -> Optional[asyncio.AbstractEventLoop]:
+        """Return `hq.loop` if it's running in another thread, which then owns this HQ."""
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            if self.loop is not None and self.loop.is_running():
+                return self.loop
+        return None
+
+    def _call_sync(self, signal_class: Type[Signal], connection: Connection, msg, defer: Callable) -> None:
+        """Call a sync receiver with a single message, in this thread.
+
+        The connection's `executor` and `timeout` don't apply: the
+        receiver is called directly, and can't be interrupted. Changes
+        to the HQ (discarding a dead receiver, recording metrics) are
+        made through `defer(func, *args)`.
+        """
+        if (receiver := connection.resolve()) is None:
+            defer(self._discard_dead_receivers)
+            return
+        metrics = self.metrics
+        start = time.perf_counter() if metrics is not None else 0.0
+        try:
+            receiver([msg] if connection.batch else msg)
+        except Exception:
+            self._log_receiver_error(signal_class, receiver, msg)
+            failed = True
+        else:
+            failed = False
+        if metrics is not None:
+            defer(partial(metrics.record_call, signal_class, receiver, time.perf_counter() - start, failed=failed))
+
+    def _get_scheduler(self) -> Callable[[Awaitable], None]:
+        """Return a function that runs a coroutine in the background, on the running loop or `hq.loop`."""
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            if self.loop is None or self.loop.is_closed():
+                raise RuntimeError("Async receivers need an event loop; set hq.loop, or send from a coroutine") from None
+            return partial(asyncio.run_coroutine_threadsafe, loop=self.loop)
+        return partial(self._spawn, loop=loop)
+
+    def _spawn(self, coro: Awaitable, loop: asyncio.AbstractEventLoop) -> asyncio.Task:
+        """Run a coroutine as a background task on the given loop, which `shutdown()` awaits."""
+        task = loop.create_task(coro)
+        # Keep a reference, so that the task isn't garbage-collected before it's done.
+        self.background_tasks.add(task)
+        task.add_done_callback(self.background_tasks.discard)
+        return task
+
+    def send_signal_threadsafe(self, signal_class: Type[Signal], msg) -> Future:
+        """Schedule a Message to be sent on `hq.loop`, from any thread.
+
+        Don't wait on the result from the loop's own thread, which would
+        deadlock.
+
+        :param Type[Signal] signal_class: The Signal subclass to send
+        :param Any msg: An instance of signal_class.Message
+        :return: a future that completes once the message has been sent to all receivers
+        :raises RuntimeError: if `hq.loop` is not set
+        """
+        if self.loop is None:
+            raise RuntimeError("No event loop to send on; set hq.loop, or load dependencies with aload_dependencies()")
+        return asyncio.run_coroutine_threadsafe(self.send_signal(signal_class, msg), self.loop)
+
+    def has_receivers(self, signal_class: Type[Signal]) -> bool:
+        """Return whether sending the given Signal subclass could have any effect.
+
+        This is `False` only if nothing receives the Signal, no Bases
+        are pending (in lazy mode), no metrics or signals are being
+        recorded, and the Signal isn't broadcast to sibling processes.
+        Called from a thread other than the one running `hq.loop`, before
+        the Signal has been sent on the loop, this is always `True`.
+        """
+        if (connections := self.dispatch_tables.get(signal_class)) is None:
+            if self._get_owning_loop() is not None:
+                # Building the dispatch table would change the HQ from the wrong thread.
+                return True
+            connections = self._build_dispatch_table(signal_class)
+        return bool(
+            connections
+            or self.bases.pending
+            or self.metrics is not None
+            or self.recorder is not None
+            or (signal_class.broadcast and self.transport is not None)
+        )
+
+    async def send_signal_many(
+        self,
+        signal_class: Type[Signal],
+        msgs: Sequence,
+        concurrent: Optional[bool] = None,
+        max_concurrency: Optional[int] = None,
+        deadline: Optional[float] = None,
+        local: bool = False,
+    ):
+        """Send several Messages to all receivers of the given Signal subclass.
+
+        Batch receivers are called once, with a list of all the
+        messages. Other receivers are called once per message, in order.
+        Otherwise, this behaves as
+        [`send_signal`][convoke.bases.HQ.send_signal].
+
+        :param Type[Signal] signal_class: The Signal subclass to send
+        :param Sequence msgs: instances of signal_class.Message
+        :param bool concurrent: run async receivers concurrently (defaults to `signal_class.concurrent`)
+        :param int max_concurrency: the most async receivers to run at once
+            (defaults to `signal_class.max_concurrency`; `None` for no limit)
+        :param float deadline: the most seconds the send may take
+            (defaults to `signal_class.deadline`; `None` for no limit)
+        :param bool local: only send to receivers in this process, even if the Signal is broadcast,
+            and don't record the messages (as for messages from sibling processes, already recorded where they were sent)
+        """
+        if msgs := tuple(msgs):
+            if self.recorder is not None and not local:
+                self.recorder.record_many(signal_class, msgs)
+            if signal_class.rate_policy is not None:
+                self._get_rate_limiter(signal_class).submit(msgs)
+            else:
+                await self._send(signal_class, msgs, concurrent, max_concurrency, deadline)
+            if signal_class.broadcast and self.transport is not None and not local:
+                self._publish(signal_class, msgs)
+
+    def _get_rate_limiter(self, signal_class: Type[Signal]) -> RateLimiter:
+        """Return this HQ's limiter for a Signal subclass with a rate policy, on the running loop."""
+        loop = asyncio.get_running_loop()
+        if (limiter := self.rate_limiters.get(signal_class)) is None or limiter.loop is not loop:
+            # Released messages are sent with the Signal's own defaults.
+            deliver = partial(self._send, signal_class, concurrent=None, max_concurrency=None)
+            limiter = self.rate_limiters[signal_class] = signal_class.rate_policy.limiter(deliver, loop)
+        return limiter
+
+    async def _submit_rate_limited(self, signal_class: Type[Signal], msgs: tuple) -> None:
+        self._get_rate_limiter(signal_class).submit(msgs)
+
+    async def _send(
+        self,
+        signal_class: Type[Signal],
+        msgs: tuple,
+        concurrent: Optional[bool],
+        max_concurrency: Optional[int],
+        deadline: Optional[float] = None,
+    ):
+        if deadline is None:
+            deadline = signal_class.deadline
+        start = time.perf_counter()
+        overdue = False
+        if deadline is None:
+            await self._dispatch(signal_class, msgs, concurrent, max_concurrency)
+        else:
+            try:
+                async with asyncio.timeout(deadline) as timeout:
+                    await self._dispatch(signal_class, msgs, concurrent, max_concurrency, timeout.when())
+            except TimeoutError:
+                logging.warning(f"Sending {signal_class!r} missed its deadline of {deadline} seconds")
+                overdue = True
+        if self.metrics is not None:
+            self.metrics.record_send(signal_class, len(msgs), time.perf_counter() - start, overdue=overdue)
+
+    async def _dispatch(
+        self,
+        signal_class: Type[Signal],
+        msgs: tuple,
+        concurrent: Optional[bool],
+        max_concurrency: Optional[int],
+        expires: Optional[float] = None,
+    ):
+        """Deliver messages to each receiver, raising `TimeoutError` rather than start one after `expires`.
+
+        `expires` is an event loop time. The caller's `asyncio.timeout`
+        only fires when the loop regains control, which sync receivers
+        never give it, so it is checked here too.
+        """
+        if self.bases.pending:
+            self.load_pending_responders(signal_class)
+        if (connections := self.dispatch_tables.get(signal_class)) is None:
+            connections = self._build_dispatch_table(signal_class)
+        if concurrent is None:
+            concurrent = signal_class.concurrent
+        if not concurrent:
+            loop = asyncio.get_running_loop()
+            for connection in connections:
+                if expires is not None and loop.time() >= expires:
+                    raise TimeoutError
+                await self._deliver_all(signal_class, connection, msgs)
+        else:
+            await self._dispatch_concurrently(signal_class, connections, msgs, max_concurrency, expires)
+
+    async def _dispatch_concurrently(
+        self,
+        signal_class: Type[Signal],
+        connections: tuple[Connection, ...],
+        msgs: tuple,
+        max_concurrency: Optional[int],
+        expires: Optional[float],
+    ):
+        loop = asyncio.get_running_loop()
+        if max_concurrency is None:
+            max_concurrency = signal_class.max_concurrency
+        limit = asyncio.Semaphore(max_concurrency) if max_concurrency is not None else nullcontext()
+
+        async def deliver_limited(connection: Connection):
+            async with limit:
+                await self._deliver_all(signal_class, connection, msgs)
+
+        overdue = False
+        async with asyncio.TaskGroup() as group:
+            for connection in connections:
+                if connection.is_async or connection.executor:
+                    group.create_task(deliver_limited(connection))
+                elif expires is not None and loop.time() >= expires:
+                    # Raising here would wrap the error in an ExceptionGroup; raise once the group is done.
+                    overdue = True
+                    break
                 else:
-                    receiver(msg)
-            except Exception:  # pragma: nocover
-                # It's important that we swallow the exception, log
-                # it, and soldier on. We don't need to cover this
-                # branch though.
-                logging.exception(
-                    f"Exception occurred while sending {signal_class!r}:\nReceiver {receiver!r}\n Message: {msg!r}"
-                )
+                    await self._deliver_all(signal_class, connection, msgs)
+        if overdue:
+            raise TimeoutError
+
+    async def post_signal(self, signal_class: Type[Signal], msg) -> bool:
+        """Enqueue a Message for background delivery to all receivers of the given Signal subclass.
+
+        See [`SignalQueue`][convoke.queues.SignalQueue].
+
+        :param Type[Signal] signal_class: The Signal subclass to send
+        :param Any msg: An instance of signal_class.Message
+        :return: whether the message was accepted, or dropped due to overflow
+        """
+        return await self.signal_queue.post(signal_class, msg)
+
+    async def _run_in_executor(self, connection: Connection, receiver: Receiver, msg) -> None:
+        """Run a sync receiver in its executor, without blocking the event loop."""
+        executor = None if connection.executor is True else connection.executor
+        if isinstance(executor, ProcessPoolExecutor):
+            call = partial(receiver, msg)
+        else:
+            call = partial(copy_context().run, receiver, msg)
+        await asyncio.get_running_loop().run_in_executor(executor, call)
+
+    async def _deliver_all(self, signal_class: Type[Signal], connection: Connection, msgs: tuple) -> None:
+        """Deliver messages to a single receiver, as a batch if it accepts one."""
+        if (receiver := connection.resolve()) is None:
+            self._discard_dead_receivers()
+            return
+
+        metrics = self.metrics
+        for msg in (list(msgs),) if connection.batch else msgs:
+            if metrics is None:
+                await self._deliver(signal_class, connection, receiver, msg)
+            else:
+                start = time.perf_counter()
+                ok = await self._deliver(signal_class, connection, receiver, msg)
+                metrics.record_call(signal_class, receiver, time.perf_counter() - start, failed=not ok)
+
+    async def _deliver(self, signal_class: Type[Signal], connection: Connection, receiver: Receiver, msg) -> bool:
+        """Call a single receiver, logging (rather than raising) any exception.
+
+        :return: whether the receiver succeeded
+        """
+        try:
+            if connection.timeout is not None:
+                async with asyncio.timeout(connection.timeout) as timeout:
+                    await self._call(connection, receiver, msg)
+            elif connection.is_async:
+                await receiver(msg)
+            elif connection.executor:
+                await self._run_in_executor(connection, receiver, msg)
+            else:
+                receiver(msg)
+        except TimeoutError:
+            if connection.timeout is None or not timeout.expired():
+                # Raised by the receiver itself, rather than by its timeout.
+                self._log_receiver_error(signal_class, receiver, msg)
+                return False
+            logging.warning(f"Receiver {receiver!r} of {signal_class!r} timed out after {connection.timeout} seconds")
+            if self.metrics is not None:
+                self.metrics.record_timeout(signal_class, receiver)
+            return False
+        except Exception:
+            self._log_receiver_error(signal_class, receiver, msg)
+            return False
+        return True
+
+    async def _call(self, connection: Connection, receiver: Receiver, msg) -> None:
+        """Call an async receiver, or run a sync receiver in its executor."""
+        if connection.is_async:
+            await receiver(msg)
+        else:
+            await self._run_in_executor(connection, receiver, msg)
+
+    def _log_receiver_error(self, signal_class: Type[Signal], receiver: Receiver, msg) -> None:
+        # It's important that we swallow the exception, log
+        # it, and soldier on.
+        logging.exception(f"Exception occurred while sending {signal_class!r}:\nReceiver {receiver!r}\n Message: {msg!r}")
+
+
+@dataclass
+class ShutdownReport:
+    """The outcome of [`HQ.shutdown`][convoke.bases.HQ.shutdown].
+
+    :param list completed: Bases whose `on_shutdown` hooks completed, in order of completion
+    :param list timed_out: Bases whose hooks missed their deadline
+    :param dict failed: Bases whose hooks raised an exception, with the exception
+    :param int abandoned: signal deliveries (posted, held back by rate policies, or running in the
+        background) cancelled because they didn't finish in time
+    """
+
+    completed: list[str] = field(default_factory=list)
+    timed_out: list[str] = field(default_factory=list)
+    failed: dict[str, Exception] = field(default_factory=dict)
+    abandoned: int = 0
+
+    @property
+    def ok(self) -> bool:
+        """Did every hook, and every outstanding signal delivery, complete in time?"""
+        return not (self.timed_out or self.failed or self.abandoned)
+
+
+def _check_sync_lifecycle(graph: DependencyGraph):
+    """Ensure that no Bases in the graph have async lifecycle hooks."""
+    if names := [name for name in graph.nodes if sys.modules[name].Main.has_async_lifecycle()]:
+        raise TypeError(
+            f"Bases with async lifecycle hooks must be loaded with `await hq.aload_dependencies(...)`: {names}"
+        )
+
+
+class BaseDict(dict):
+    """A dictionary of loaded Bases, which loads pending Bases on first lookup.
+
+    Pending Bases are dependencies recorded by an HQ in lazy mode that
+    have not yet been loaded. Only lookups by key (`bases[name]`) load
+    pending Bases; iteration, `in` and `get()` only see loaded Bases.
+    """
+
+    def __init__(self, hq: HQ):
+        super().__init__()
+        self.hq = hq
+        self.pending: dict[str, None] = {}
+
+    def __missing__(self, name: str) -> Base:
+        if name not in self.pending:
+            raise KeyError(name)
+        return self.hq.load_base(name)
+
+
+class LazyMountpointDict(MountpointDict):
+    """A MountpointDict that loads pending Bases registering with a Mountpoint when it is looked up."""
+
+    def __init__(self, hq: HQ):
+        super().__init__()
+        self.hq = hq
+
+    def __getitem__(self, key: Type[Mountpoint]) -> Mountpoint:
+        if self.hq.bases.pending:
+            self.hq.load_pending_responders(key)
+        return super().__getitem__(key)
+
+
+def discover_dependencies(dependencies: Sequence[str], max_workers: Optional[int] = None) -> DependencyGraph:
+    """Import dependency modules and discover the dependency graph.
+
+    Each module is imported, and the dependencies declared on its
+    `Main` Base subclass are followed in turn. No Bases are
+    instantiated.
+
+    By default, modules are imported sequentially, in the same
+    depth-first, left-to-right order in which Bases are later
+    instantiated. With `max_workers` greater than one, modules are
+    imported concurrently on a thread pool as soon as they are
+    discovered, which overlaps slow import-time work in independent
+    branches of the graph.
+
+    :param Sequence[str] dependencies: dotted paths to modules/packages containing a `Main` Base.
+    :param int max_workers: the size of the import thread pool, if any
+    """
+    profiler = current_profiler.get()
+    declared: dict[str, tuple[str, ...]] = {}
+    if max_workers is not None and max_workers > 1:
+        _import_concurrently(dependencies, declared, max_workers, profiler)
+
+    graph = {}
+
+    def visit(names: Sequence[str]):
+        for name in names:
+            if name not in graph:
+                if name not in declared:
+                    declared[name] = _import_dependency(name, profiler)
+                graph[name] = declared[name]
+                visit(graph[name])
+
+    visit(dependencies)
+    return DependencyGraph(roots=tuple(dependencies), edges=graph)
+
+
+def preload_dependencies(graph: DependencyGraph, max_workers: Optional[int] = None) -> bool:
+    """Import the modules of a known dependency graph, in topological order.
+
+    With `max_workers` greater than one, all modules are imported
+    concurrently on a thread pool.
+
+    :param DependencyGraph graph: a previously-discovered graph, e.g. loaded from a cache file
+    :param int max_workers: the size of the import thread pool, if any
+    :return: whether the graph still matches the dependencies declared by the imported Bases
+    """
+    profiler = current_profiler.get()
+    order = graph.topological_order()
+    declared: dict[str, tuple[str, ...]] = {}
+    if max_workers is not None and max_workers > 1:
+        _import_concurrently(order, declared, max_workers, profiler)
+    else:
+        for name in order:
+            declared[name] = _import_dependency(name, profiler)
+    return declared == graph.edges
+
+
+def _import_dependency(name: str, profiler: Optional[StartupProfiler]) -> tuple[str, ...]:
+    """Import a dependency module, returning the dependencies declared by its Base."""
+    import_profiler = current_import_profiler.get()
+    with profiler.phase("import", name) if profiler else nullcontext():
+        with import_profiler.dependency(name) if import_profiler else nullcontext():
+            mod = importlib.import_module(name)
+    return tuple(mod.Main.dependencies)
+
+
+def _import_concurrently(
+    dependencies: Sequence[str],
+    declared: dict[str, tuple[str, ...]],
+    max_workers: int,
+    profiler: Optional[StartupProfiler],
+) -> None:
+    """Import dependency modules on a thread pool, following declared dependencies as they are found."""
+    submitted = set()
+    futures = {}
+    executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="convoke-import")
+
+    def submit(names: Sequence[str]):
+        for name in names:
+            if name not in submitted:
+                submitted.add(name)
+                # Each import runs in a copy of the caller's context, so that
+                # context variables (e.g. the current HQ) remain visible.
+                futures[executor.submit(copy_context().run, _import_dependency, name, profiler)] = name
+
+    try:
+        submit(dependencies)
+        while futures:
+            done, _ = wait(futures, return_when=FIRST_COMPLETED)
+            for future in done:
+                name = futures.pop(future)
+                declared[name] = future.result()
+                submit(declared[name])
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
 
 
 def load_dependencies(
@@ -142,22 +1288,43 @@ def load_dependencies(
     if seen is None:
         seen = {}
 
+    profiler = current_profiler.get()
     for name in dependencies:
         if name in seen:
             subject.hq.bases[name] = subject.bases[name] = seen[name]
 
         else:
-            mod = importlib.import_module(name)
-            base = subject.hq.bases[name] = seen[name] = subject.bases[name] = mod.Main(hq=subject.hq)
-            load_dependencies(base, base.dependencies, seen)
-
-
-def responds(signal: Type[Signal]):
-    """Decorate a Base method as a signal handler."""
+            with profiler.dependency(name) if profiler else nullcontext():
+                mod = importlib.import_module(name)
+                base = subject.hq.bases[name] = seen[name] = subject.bases[name] = mod.Main(hq=subject.hq)
+                load_dependencies(base, base.dependencies, seen)
+
+
+def responds(
+    signal: Type[Signal],
+    batch: bool = False,
+    executor: Union[Executor, bool, None] = None,
+    weak: bool = False,
+    timeout: Optional[float] = None,
+):
+    """Decorate a Base method as a signal handler.
+
+    :param Type[Signal] signal: the Signal subclass to respond to
+    :param bool batch: receive a list of messages, rather than one at a time
+        (see [`HQ.send_signal_many`][convoke.bases.HQ.send_signal_many])
+    :param Executor executor: run a sync handler in this executor, rather than on the event loop
+        (`True` for the event loop's default thread pool; process pools can't run Base methods)
+    :param bool weak: connect the handler weakly, so that the connection doesn't keep the Base alive
+    :param float timeout: cancel each call to the handler that takes longer than this many seconds
+        (see [`HQ.connect_signal_receiver`][convoke.bases.HQ.connect_signal_receiver])
+    """
+    options = {name: value for name, value in (("batch", batch), ("executor", executor), ("weak", weak)) if value}
+    if timeout is not None:
+        options["timeout"] = timeout
 
     def decorator(the_func: Receiver):
         signals = getattr(the_func, "__signals__", [])
-        signals.append(signal)
+        signals.append((signal, options))
         the_func.__signals__ = signals
         return the_func
 
@@ -169,11 +1336,34 @@ class BaseMeta(type):
 
     This does not appear to work when performed in
     Base.__init_subclass__(). ¯\\_(ツ)_//¯
+
+    BaseMeta also builds a table of specially-decorated methods once,
+    at class creation, so that resetting a Base need not inspect its
+    class:
+
+    - `__special_methods__`: a tuple of `(function, signals, mountpoints)`
+      for each method that responds to a Signal or registers with a
+      Mountpoint, where `signals` holds `(signal, connection options)` pairs
+    - `__special_targets__`: a frozenset of all those Signals and Mountpoints
+
+    Methods decorated after class creation are not included.
     """
 
     def __init__(cls, name, bases, attrs):
         super().__init__(name, bases, attrs)
         dataclass(cls)
+        special_methods = []
+        for attr, func in inspect.getmembers(cls, inspect.isfunction):
+            signals = tuple(getattr(func, "__signals__", ()))
+            mountpoints = tuple(getattr(func, "__mountpoints__", ()))
+            # Static methods can't be bound to an instance:
+            if (signals or mountpoints) and not isinstance(inspect.getattr_static(cls, attr), staticmethod):
+                special_methods.append((func, signals, mountpoints))
+        cls.__special_methods__ = tuple(special_methods)
+        cls.__special_targets__ = frozenset(
+            [signal for _, signals, _ in cls.__special_methods__ for signal, _ in signals]
+            + [mountpoint for _, _, mountpoints in cls.__special_methods__ for mountpoint in mountpoints]
+        )
 
 
 class Base(metaclass=BaseMeta):
@@ -189,6 +1379,12 @@ class Base(metaclass=BaseMeta):
             # Main subclass:
             dependencies = ['foo', 'foo.bar']
 
+    Instantiating a Base initializes it (`on_init`) and registers its
+    receivers. A Base with an async `on_init` can't be initialized
+    while instantiating it, though, so it is only configured; load it
+    with `HQ.aload_dependencies()`, or instantiate it and then
+    `await base.areset()` to complete initialization.
+
     Base is similar in concept to Django's `AppConfig`.
     """
 
@@ -200,56 +1396,122 @@ class Base(metaclass=BaseMeta):
 
     dependencies: ClassVar[Sequence[str]] = ()
     config_class: ClassVar[Type[BaseConfig]] = BaseConfig
+    shutdown_timeout: ClassVar[Optional[float]] = None
     current_instance: ClassVar[ContextVar]
 
     def __init_subclass__(cls):
         cls.current_instance = ContextVar("current_instance")
 
     def __post_init__(self):
-        self.reset()
+        if _defer_initialization.get() or is_async_callable(self.on_init):
+            # Initialization will be completed by `HQ.aload_dependencies()` or `Base.areset()`
+            self._reset_config()
+            self.current_instance.set(self)
+        else:
+            self.reset()
 
     def ready(self):
         """Make the base ready for action."""
+        if is_async_callable(self.on_ready):
+            raise TypeError(f"{type(self).__qualname__} has an async on_ready; use `await base.aready()`")
         self.on_ready()
 
+    async def aready(self):
+        """Make the base ready for action, awaiting `on_ready` if it is async."""
+        if is_async_callable(self.on_ready):
+            await self.on_ready()
+        else:
+            self.on_ready()
+
     field = field
     responds = responds
 
-    def reset(self):
-        """Reset the base, reloading configuration and initialization."""
-        self.config = self.config_class.from_config(self.hq.config)
-        self.on_init()
+    @classmethod
+    def has_async_lifecycle(cls) -> bool:
+        """Does this Base define async lifecycle hooks?"""
+        return is_async_callable(cls.on_init) or is_async_callable(cls.on_ready)
+
+    def reset(self, config: Optional[BaseConfig] = None):
+        """Reset the base, reloading configuration and initialization.
+
+        Re-registering signal receivers and mountpoints is idempotent.
+
+        :param BaseConfig config: an already-derived config to use, instead of deriving one from the HQ's config
+        """
+        if is_async_callable(self.on_init):
+            raise TypeError(f"{type(self).__qualname__} has an async on_init; use `await base.areset()`")
+        self._reset_config(config)
+        with profile_phase("on_init"):
+            self.on_init()
+        with profile_phase("register"):
+            self._register_special_methods()
+        self.current_instance.set(self)
+
+    async def areset(self, config: Optional[BaseConfig] = None):
+        """Reset the base, reloading configuration and awaiting initialization.
+
+        :param BaseConfig config: an already-derived config to use, instead of deriving one from the HQ's config
+        """
+        self._reset_config(config)
+        await self._initialize()
         self._register_special_methods()
         self.current_instance.set(self)
 
+    def _reset_config(self, config: Optional[BaseConfig] = None):
+        if config is None:
+            config = _preset_config.get()
+        if config is None:
+            with profile_phase("config"):
+                config = self.config_class.from_config(self.hq.config)
+        self.config = config
+
+    async def _initialize(self):
+        if is_async_callable(self.on_init):
+            await self.on_init()
+        else:
+            self.on_init()
+
     def on_init(self):
-        """Subclass-overridable method to call at the end of initialization"""
+        """Subclass-overridable method to call at the end of initialization
+
+        May be overridden with an `async def`, in which case the Base must be
+        loaded with [`HQ.aload_dependencies`][convoke.bases.HQ.aload_dependencies].
+        """
         pass
 
     def on_ready(self):
-        """Subclass-overridable method to call after all Bases ready"""
+        """Subclass-overridable method to call after all Bases ready
+
+        May be overridden with an `async def`, in which case the Base must be
+        loaded with [`HQ.aload_dependencies`][convoke.bases.HQ.aload_dependencies].
+        """
+        pass
+
+    def on_shutdown(self):
+        """Subclass-overridable method to call on [`HQ.shutdown`][convoke.bases.HQ.shutdown]
+
+        May be overridden with an `async def`. Synchronous hooks are run
+        in a worker thread.
+        """
         pass
 
+    async def ashutdown(self):
+        """Shut down the base, awaiting `on_shutdown`."""
+        if is_async_callable(self.on_shutdown):
+            await self.on_shutdown()
+        else:
+            await asyncio.to_thread(self.on_shutdown)
+
     @classmethod
     def get_current(cls):
         """Return the current instance of this Base for the current context."""
         return cls.current_instance.get()
 
     def _register_special_methods(self):
-        """Look for and register specially-decorated Base methods."""
-        # We need to inspect members of the class, not the instance,
-        # to avoid tripping over any descriptors before we're ready.
-        for name, func in inspect.getmembers(self.__class__, inspect.isfunction):
-            if inspect.ismethod(method := getattr(self, name)):
-                # Register signals
-                signals = getattr(func, "__signals__", ())
-                for signal in signals:
-                    self.hq.connect_signal_receiver(signal, method)
-
-                # Register mountpoints
-                mountpoints = getattr(method.__func__, "__mountpoints__", ())
-                for mountpoint in mountpoints:
-                    self.hq.mountpoints[mountpoint].mount(method)
-            else:  # pragma: nocover
-                pass
-                # Some days, branch coverage makes us do silly things to get to 100%.
+        """Register specially-decorated Base methods, as found by `BaseMeta`."""
+        for func, signals, mountpoints in self.__special_methods__:
+            method = MethodType(func, self)
+            for signal, options in signals:
+                self.hq.connect_signal_receiver(signal, method, **options)
+            for mountpoint in mountpoints:
+                self.hq.mountpoints[mountpoint].mount(method)
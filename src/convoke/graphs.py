@@ -0,0 +1,176 @@
+"""Tools for working with the Base dependency graph
+
+The graph maps each dependency (a dotted path to a module containing a
+`Main` Base subclass) to the dependencies declared by its Base. Cycles
+are legitimate: Bases may depend on one another.
+"""
+from __future__ import annotations
+
+import json
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Union
+
+GRAPH_CACHE_VERSION = 1
+
+
+@dataclass
+class DependencyGraph:
+    """An explicit dependency graph.
+
+    :param tuple roots: the dependencies requested directly by the HQ, in order
+    :param dict edges: a mapping of each node to the dependencies declared by its Base,
+        in depth-first, left-to-right discovery order
+    """
+
+    roots: tuple[str, ...] = ()
+    edges: dict[str, tuple[str, ...]] = field(default_factory=dict)
+
+    @property
+    def nodes(self) -> tuple[str, ...]:
+        """All nodes, in depth-first, left-to-right discovery order."""
+        return tuple(self.edges)
+
+    def update(self, roots: Sequence[str], edges: dict[str, Sequence[str]]) -> None:
+        """Add roots and edges to this graph."""
+        self.roots += tuple(root for root in roots if root not in self.roots)
+        self.edges.update((name, tuple(deps)) for name, deps in edges.items())
+
+    def dependents(self, name: str) -> tuple[str, ...]:
+        """Return the nodes that directly depend on the named node."""
+        return tuple(node for node, deps in self.edges.items() if name in deps)
+
+    def topological_order(self) -> tuple[str, ...]:
+        """Return all nodes, each ordered after the nodes it depends on.
+
+        Cycles are broken deterministically: the graph is walked
+        depth-first, left-to-right from the roots, and a dependency on a
+        node that is still being walked (i.e. the edge that closes a
+        cycle) is ignored. See
+        [`broken_edges`][convoke.graphs.DependencyGraph.broken_edges].
+        """
+        return self._walk()[0]
+
+    def broken_edges(self) -> tuple[tuple[str, str], ...]:
+        """Return the `(node, dependency)` edges ignored to break cycles in the topological order."""
+        return self._walk()[1]
+
+    def acyclic_edges(self, reverse: bool = False) -> dict[str, tuple[str, ...]]:
+        """Return the edges with cycles broken as in `topological_order()`.
+
+        With `reverse`, map each node to its dependents instead.
+        """
+        broken = set(self.broken_edges())
+        edges = {name: tuple(dep for dep in deps if (name, dep) not in broken) for name, deps in self.edges.items()}
+        if reverse:
+            reversed_edges = {name: [] for name in edges}
+            for name, deps in edges.items():
+                for dep in deps:
+                    reversed_edges.setdefault(dep, []).append(name)
+            edges = {name: tuple(dependents) for name, dependents in reversed_edges.items()}
+        return edges
+
+    def _walk(self) -> tuple[tuple[str, ...], tuple[tuple[str, str], ...]]:
+        order = []
+        broken = []
+        done = set()
+        walking = set()
+
+        def visit(name: str):
+            walking.add(name)
+            for dep in self.edges.get(name, ()):
+                if dep in walking:
+                    broken.append((name, dep))
+                elif dep not in done:
+                    visit(dep)
+            walking.discard(name)
+            done.add(name)
+            order.append(name)
+
+        for name in self.roots + self.nodes:
+            if name not in done:
+                visit(name)
+
+        return tuple(order), tuple(broken)
+
+    def cycles(self) -> list[tuple[str, ...]]:
+        """Return each cycle (strongly-connected component) in the graph.
+
+        Nodes within each cycle, and the cycles themselves, are listed in
+        discovery order.
+        """
+        index = {name: i for i, name in enumerate(self.nodes)}
+        cycles = [
+            tuple(sorted(component, key=index.__getitem__))
+            for component in _strongly_connected_components(self.edges)
+            if len(component) > 1 or component[0] in self.edges.get(component[0], ())
+        ]
+        return sorted(cycles, key=lambda cycle: index[cycle[0]])
+
+    def asdict(self) -> dict:
+        """Return a JSON-friendly representation of the graph."""
+        return {
+            "version": GRAPH_CACHE_VERSION,
+            "roots": list(self.roots),
+            "edges": {name: list(deps) for name, deps in self.edges.items()},
+        }
+
+    @classmethod
+    def fromdict(cls, data: dict) -> DependencyGraph:
+        """Build a graph from a representation produced by `asdict()`.
+
+        :raises ValueError: if the representation is of another version, or malformed
+        """
+        if not isinstance(data, dict):
+            raise ValueError(f"Malformed dependency graph: {data!r}")
+        if data.get("version") != GRAPH_CACHE_VERSION:
+            raise ValueError(f"Unsupported dependency graph version: {data.get('version')!r}")
+        try:
+            return cls(roots=tuple(data["roots"]), edges={name: tuple(deps) for name, deps in data["edges"].items()})
+        except (KeyError, TypeError, AttributeError) as exc:
+            raise ValueError(f"Malformed dependency graph: {exc!r}") from exc
+
+    def dump(self, path: Union[str, Path]) -> None:
+        """Write the graph to a JSON cache file."""
+        Path(path).write_text(json.dumps(self.asdict(), indent=2) + "\n")
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> DependencyGraph:
+        """Read a graph from a JSON cache file written by `dump()`."""
+        return cls.fromdict(json.loads(Path(path).read_text()))
+
+
+def _strongly_connected_components(edges: dict[str, tuple[str, ...]]) -> list[list[str]]:
+    """Find strongly-connected components using Tarjan's algorithm."""
+    lowlinks = {}
+    indices = {}
+    stack = []
+    on_stack = set()
+    components = []
+
+    def connect(name: str):
+        indices[name] = lowlinks[name] = len(indices)
+        stack.append(name)
+        on_stack.add(name)
+        for dep in edges.get(name, ()):
+            if dep not in indices:
+                connect(dep)
+                lowlinks[name] = min(lowlinks[name], lowlinks[dep])
+            elif dep in on_stack:
+                lowlinks[name] = min(lowlinks[name], indices[dep])
+
+        if lowlinks[name] == indices[name]:
+            component = []
+            while (member := stack.pop()) != name:
+                on_stack.discard(member)
+                component.append(member)
+            on_stack.discard(name)
+            component.append(name)
+            components.append(component)
+
+    for name in edges:
+        if name not in indices:
+            connect(name)
+
+    return components
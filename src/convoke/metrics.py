@@ -0,0 +1,201 @@
+"""Tools for measuring signal dispatch
+
+Metrics are opt-in: provide a [`SignalMetrics`][convoke.metrics.SignalMetrics]
+when instantiating the HQ, and take snapshots as it runs:
+
+    metrics = SignalMetrics(slow_threshold=0.05)
+    hq = HQ(config=MyConfig(), metrics=metrics)
+    ...
+    print(json.dumps(metrics.snapshot(), indent=2))
+
+Without metrics, sending a signal costs a single `is None` check extra.
+"""
+from __future__ import annotations
+
+import logging
+from bisect import bisect_left
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Optional
+
+if TYPE_CHECKING:  # pragma: nocover
+    from convoke.signals import Receiver, Signal
+
+# Upper bounds, in seconds, of each latency bucket. Anything slower lands in a final overflow bucket.
+DEFAULT_BUCKETS = (0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0)
+
+
+@dataclass
+class LatencyHistogram:
+    """A histogram of latencies, in seconds.
+
+    :param tuple bounds: the upper bound of each bucket
+    """
+
+    bounds: tuple[float, ...] = DEFAULT_BUCKETS
+    buckets: list[int] = field(init=False)
+    count: int = field(init=False, default=0)
+    total: float = field(init=False, default=0.0)
+    max: float = field(init=False, default=0.0)
+
+    def __post_init__(self):
+        self.buckets = [0] * (len(self.bounds) + 1)
+
+    def record(self, seconds: float) -> None:
+        """Count a single latency."""
+        self.buckets[bisect_left(self.bounds, seconds)] += 1
+        self.count += 1
+        self.total += seconds
+        if seconds > self.max:
+            self.max = seconds
+
+    @property
+    def mean(self) -> float:
+        """The mean latency recorded."""
+        return self.total / self.count if self.count else 0.0
+
+    def asdict(self) -> dict:
+        """Return a JSON-friendly representation of the histogram."""
+        return {
+            "count": self.count,
+            "total": self.total,
+            "mean": self.mean,
+            "max": self.max,
+            "buckets": {
+                **{f"le_{bound:g}": count for bound, count in zip(self.bounds, self.buckets)},
+                "inf": self.buckets[-1],
+            },
+        }
+
+
+@dataclass
+class ReceiverStats:
+    """Metrics for a single receiver of a single Signal.
+
+    :param int calls: the number of times the receiver was called
+    :param int errors: the number of calls that raised an exception, or timed out
+    :param int timeouts: the number of calls cancelled for exceeding the receiver's timeout
+    :param int slow: the number of calls slower than the slow threshold
+    :param LatencyHistogram latency: the latency of each call
+    """
+
+    calls: int = 0
+    errors: int = 0
+    timeouts: int = 0
+    slow: int = 0
+    latency: LatencyHistogram = field(default_factory=LatencyHistogram)
+
+    def asdict(self) -> dict:
+        """Return a JSON-friendly representation of these stats."""
+        return {
+            "calls": self.calls,
+            "errors": self.errors,
+            "timeouts": self.timeouts,
+            "slow": self.slow,
+            "latency": self.latency.asdict(),
+        }
+
+
+@dataclass
+class SendStats:
+    """Metrics for sends of a single Signal.
+
+    :param int sends: the number of sends (each `send()` or `send_many()` call)
+    :param int messages: the number of messages sent
+    :param int overdue: the number of sends cut short by their deadline
+    :param LatencyHistogram latency: the time taken to dispatch each send to all receivers
+    """
+
+    sends: int = 0
+    messages: int = 0
+    overdue: int = 0
+    latency: LatencyHistogram = field(default_factory=LatencyHistogram)
+
+    def asdict(self) -> dict:
+        """Return a JSON-friendly representation of these stats."""
+        return {"sends": self.sends, "messages": self.messages, "overdue": self.overdue, "latency": self.latency.asdict()}
+
+
+@dataclass
+class SignalMetrics:
+    """Record send counts, per-receiver call counts, latencies and errors.
+
+    Receivers are identified by their qualified name, so that metrics
+    don't keep receivers alive. Calls to a method of several instances
+    are counted together.
+
+    :param float slow_threshold: log a warning for receiver calls slower than this many seconds
+    :param tuple buckets: the upper bounds, in seconds, of each latency histogram bucket
+    """
+
+    slow_threshold: Optional[float] = None
+    buckets: tuple[float, ...] = DEFAULT_BUCKETS
+
+    signals: dict[str, SendStats] = field(init=False, default_factory=dict)
+    receivers: dict[str, dict[str, ReceiverStats]] = field(init=False, default_factory=dict)
+
+    def record_send(self, signal_class: type[Signal], messages: int, seconds: float, overdue: bool = False) -> None:
+        """Record a send of one or more messages, how long it took to dispatch, and whether it missed its deadline."""
+        name = get_name(signal_class)
+        if (stats := self.signals.get(name)) is None:
+            stats = self.signals[name] = SendStats(latency=LatencyHistogram(self.buckets))
+        stats.sends += 1
+        stats.messages += messages
+        if overdue:
+            stats.overdue += 1
+        stats.latency.record(seconds)
+
+    def record_call(self, signal_class: type[Signal], receiver: Receiver, seconds: float, failed: bool) -> None:
+        """Record a single receiver call, and how long it took."""
+        signal_name = get_name(signal_class)
+        receiver_name = get_name(receiver)
+        stats = self._get_receiver_stats(signal_name, receiver_name)
+        stats.calls += 1
+        stats.latency.record(seconds)
+        if failed:
+            stats.errors += 1
+        if self.slow_threshold is not None and seconds > self.slow_threshold:
+            stats.slow += 1
+            logging.warning(f"Slow receiver {receiver_name} took {seconds * 1000:.1f} ms to handle {signal_name}")
+
+    def record_timeout(self, signal_class: type[Signal], receiver: Receiver) -> None:
+        """Record a receiver call cancelled for exceeding its timeout.
+
+        The call itself is recorded separately, with `record_call()`.
+        """
+        self._get_receiver_stats(get_name(signal_class), get_name(receiver)).timeouts += 1
+
+    def _get_receiver_stats(self, signal_name: str, receiver_name: str) -> ReceiverStats:
+        by_receiver = self.receivers.setdefault(signal_name, {})
+        if (stats := by_receiver.get(receiver_name)) is None:
+            stats = by_receiver[receiver_name] = ReceiverStats(latency=LatencyHistogram(self.buckets))
+        return stats
+
+    def snapshot(self) -> dict:
+        """Return a JSON-friendly copy of the metrics recorded so far."""
+        return {
+            "signals": {
+                name: {
+                    **stats.asdict(),
+                    "receivers": {
+                        receiver: receiver_stats.asdict()
+                        for receiver, receiver_stats in self.receivers.get(name, {}).items()
+                    },
+                }
+                for name, stats in self.signals.items()
+            }
+        }
+
+    def reset(self) -> None:
+        """Forget all metrics recorded so far."""
+        self.signals.clear()
+        self.receivers.clear()
+
+
+def get_name(obj: object) -> str:
+    """Return the qualified name of a Signal class or receiver, for reporting."""
+    func = getattr(obj, "func", obj)  # Unwrap partials
+    if (qualname := getattr(func, "__qualname__", None)) is None:
+        return repr(obj)
+    if (module := getattr(func, "__module__", None)) is None:  # e.g. methods of builtin types
+        return qualname
+    return f"{module}.{qualname}"
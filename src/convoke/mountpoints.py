@@ -32,8 +32,12 @@ class Mountpoint:
         return func
 
     def mount(self, func):
-        """Mount a registered function on this instance."""
-        self.mounted.append(func)
+        """Mount a registered function on this instance.
+
+        Mounting is idempotent: a function already mounted is not mounted again.
+        """
+        if func not in self.mounted:
+            self.mounted.append(func)
 
 
 class MountpointDict(dict):
@@ -0,0 +1,354 @@
+"""Tools for profiling HQ startup
+
+Profiling is opt-in: provide a [`StartupProfiler`][convoke.profiling.StartupProfiler]
+when instantiating the HQ, and inspect it after loading dependencies:
+
+    profiler = StartupProfiler()
+    hq = HQ(config=MyConfig(), profiler=profiler)
+    hq.load_dependencies(['foo', 'bar'])
+    print(profiler.report())
+
+To see which dependencies pull in heavy modules at import time, provide
+an [`ImportProfiler`][convoke.profiling.ImportProfiler]:
+
+    imports = ImportProfiler(trace_memory=True)
+    hq = HQ(config=MyConfig(), import_profiler=imports)
+    hq.load_dependencies(['foo', 'bar'])
+    imports.dump('imports.json')
+"""
+from __future__ import annotations
+
+import json
+import sys
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager, nullcontext
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from importlib.abc import MetaPathFinder
+from importlib.machinery import ModuleSpec
+from pathlib import Path
+from types import ModuleType
+from typing import Any, ContextManager, Iterator, Optional, Sequence, Union
+
+PHASES = ("import", "config", "on_init", "register", "on_ready")
+
+current_profiler: ContextVar[Optional[StartupProfiler]] = ContextVar("current_profiler", default=None)
+current_import_profiler: ContextVar[Optional[ImportProfiler]] = ContextVar("current_import_profiler", default=None)
+
+
+@dataclass
+class ProfileNode:
+    """Startup timings for a single dependency, and the dependencies it loaded.
+
+    :param str name: the dotted path of the dependency
+    :param dict phases: wall time, in seconds, spent in each startup phase
+    :param list children: nodes for the sub-dependencies first loaded by this dependency
+    """
+
+    name: str
+    phases: dict[str, float] = field(default_factory=dict)
+    children: list[ProfileNode] = field(default_factory=list)
+
+    @property
+    def self_time(self) -> float:
+        """Wall time spent on this dependency alone."""
+        return sum(self.phases.values())
+
+    @property
+    def total_time(self) -> float:
+        """Wall time spent on this dependency and everything it loaded."""
+        return self.self_time + sum(child.total_time for child in self.children)
+
+    def asdict(self) -> dict:
+        """Return a JSON-friendly representation of this node and its descendants."""
+        return {
+            "name": self.name,
+            "phases": dict(self.phases),
+            "self_time": self.self_time,
+            "total_time": self.total_time,
+            "children": [child.asdict() for child in self.children],
+        }
+
+
+@dataclass
+class StartupProfiler:
+    """Record wall time per dependency and per startup phase.
+
+    Phases are recorded as follows:
+
+    - `import`: importing the dependency's module
+    - `config`: deriving the Base's config (`BaseConfig.from_config`)
+    - `on_init`: running `Base.on_init`
+    - `register`: registering signal receivers and mountpoints
+    - `on_ready`: running `Base.on_ready`
+
+    Results form a tree, rooted at `StartupProfiler.root`, following the
+    order in which dependencies were loaded.
+    """
+
+    root: ProfileNode = field(default_factory=lambda: ProfileNode("HQ"))
+    nodes: dict[str, ProfileNode] = field(default_factory=dict)
+
+    _stack: list[ProfileNode] = field(default_factory=list, repr=False)
+
+    @contextmanager
+    def dependency(self, name: str) -> Iterator[ProfileNode]:
+        """Record phases within this block against the named dependency."""
+        parent = self._stack[-1] if self._stack else self.root
+        node = self._get_node(name)
+        parent.children.append(node)
+        self._stack.append(node)
+        try:
+            yield node
+        finally:
+            self._stack.pop()
+
+    @contextmanager
+    def phase(self, label: str, name: Optional[str] = None) -> Iterator[None]:
+        """Time the block as the given phase of a dependency.
+
+        :param str label: the phase name, e.g. `"on_init"`
+        :param str name: the dependency to record against (defaults to the innermost `dependency()` block)
+        """
+        node = self._get_node(name) if name is not None else self._stack[-1]
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            node.phases[label] = node.phases.get(label, 0.0) + time.perf_counter() - start
+
+    def _get_node(self, name: str) -> ProfileNode:
+        # Nodes may be created ahead of their place in the tree,
+        # e.g. when modules are imported before Bases are loaded.
+        if (node := self.nodes.get(name)) is None:
+            node = self.nodes.setdefault(name, ProfileNode(name))
+        return node
+
+    @property
+    def total_time(self) -> float:
+        """Total recorded wall time across all dependencies."""
+        return self.root.total_time
+
+    def slowest(self, count: int = 5) -> list[ProfileNode]:
+        """Return the dependencies with the most self time, slowest first."""
+        return sorted(self.nodes.values(), key=lambda node: node.self_time, reverse=True)[:count]
+
+    def asdict(self) -> dict:
+        """Return a JSON-friendly representation of the profile tree."""
+        return {
+            "total_time": self.total_time,
+            "tree": [child.asdict() for child in self.root.children],
+            "slowest": [node.name for node in self.slowest()],
+        }
+
+    def report(self, count: int = 5) -> str:
+        """Format the profile tree as text, highlighting the slowest dependencies."""
+        ranks = {node.name: rank for rank, node in enumerate(self.slowest(count), 1)}
+        lines = [f"HQ startup: {self.total_time * 1000:.1f} ms"]
+
+        def add_lines(node: ProfileNode, depth: int):
+            phases = ", ".join(f"{label} {node.phases[label] * 1000:.1f}" for label in PHASES if label in node.phases)
+            line = f"{'  ' * depth}{node.name}: {node.total_time * 1000:.1f} ms total, {node.self_time * 1000:.1f} ms self ({phases})"
+            if node.name in ranks:
+                line += f"  <-- slowest #{ranks[node.name]}"
+            lines.append(line)
+            for child in node.children:
+                add_lines(child, depth + 1)
+
+        for child in self.root.children:
+            add_lines(child, 1)
+        return "\n".join(lines)
+
+
+def profile_phase(label: str) -> ContextManager:
+    """Time the block as a startup phase, if a profiler is active in this context."""
+    profiler = current_profiler.get()
+    if profiler is None:
+        return nullcontext()
+    return profiler.phase(label)
+
+
+@dataclass
+class ImportNode:
+    """Import timings for a single module, and the modules first imported while executing it.
+
+    :param str name: the dotted path of the module (or, at the root, the dependency)
+    :param float cumulative_time: wall time, in seconds, spent importing the module and its imports
+    :param int cumulative_memory: net bytes allocated while importing the module and its imports
+        (only measured with `ImportProfiler(trace_memory=True)`)
+    :param list children: nodes for the modules first imported by this module
+    """
+
+    name: str
+    cumulative_time: float = 0.0
+    cumulative_memory: int = 0
+    children: list[ImportNode] = field(default_factory=list)
+
+    @property
+    def self_time(self) -> float:
+        """Wall time spent executing this module alone."""
+        return self.cumulative_time - sum(child.cumulative_time for child in self.children)
+
+    @property
+    def self_memory(self) -> int:
+        """Net bytes allocated by this module alone."""
+        return self.cumulative_memory - sum(child.cumulative_memory for child in self.children)
+
+    def walk(self) -> Iterator[ImportNode]:
+        """Iterate over this node and all its descendants, depth-first."""
+        yield self
+        for child in self.children:
+            yield from child.walk()
+
+    def asdict(self) -> dict:
+        """Return a JSON-friendly representation of this node and its descendants."""
+        return {
+            "name": self.name,
+            "cumulative_time": self.cumulative_time,
+            "self_time": self.self_time,
+            "cumulative_memory": self.cumulative_memory,
+            "self_memory": self.self_memory,
+            "children": [child.asdict() for child in self.children],
+        }
+
+
+@dataclass
+class ImportProfiler:
+    """Record import time (and optionally memory) for each dependency and its transitive imports.
+
+    While dependencies load, an import hook times the execution of every
+    module imported for the first time, much like `python -X
+    importtime`. Each import is attributed to the dependency whose
+    import pulled it in, forming a tree per dependency in
+    `ImportProfiler.dependencies`. Modules that were already imported
+    cost nothing, and so are not recorded.
+
+    With `trace_memory`, net memory allocated by each import is measured
+    with `tracemalloc`, which slows imports down considerably. When
+    dependencies are imported concurrently, memory is measured across
+    all threads, so memory figures are only approximate.
+
+    :param bool trace_memory: measure memory allocated by each import
+    """
+
+    trace_memory: bool = False
+    dependencies: dict[str, ImportNode] = field(default_factory=dict)
+
+    _local: threading.local = field(default_factory=threading.local, repr=False)
+    _finder: _ImportTimingFinder = field(init=False, repr=False)
+
+    def __post_init__(self):
+        self._finder = _ImportTimingFinder(self)
+
+    @contextmanager
+    def tracing(self) -> Iterator[None]:
+        """Install the import hook for the duration of the block."""
+        if self._finder in sys.meta_path:
+            yield
+            return
+
+        started = self.trace_memory and not tracemalloc.is_tracing()
+        if started:
+            tracemalloc.start()
+        sys.meta_path.insert(0, self._finder)
+        try:
+            yield
+        finally:
+            sys.meta_path.remove(self._finder)
+            if started:
+                tracemalloc.stop()
+
+    @contextmanager
+    def dependency(self, name: str) -> Iterator[ImportNode]:
+        """Attribute imports within this block (in this thread) to the named dependency."""
+        node = self.dependencies.setdefault(name, ImportNode(name))
+        with self._measure(node):
+            yield node
+
+    @property
+    def _stack(self) -> list[ImportNode]:
+        if (stack := getattr(self._local, "stack", None)) is None:
+            stack = self._local.stack = []
+        return stack
+
+    @contextmanager
+    def _measure(self, node: ImportNode) -> Iterator[None]:
+        stack = self._stack
+        memory = self._traced_memory()
+        start = time.perf_counter()
+        stack.append(node)
+        try:
+            yield
+        finally:
+            stack.pop()
+            node.cumulative_time += time.perf_counter() - start
+            node.cumulative_memory += self._traced_memory() - memory
+
+    def _traced_memory(self) -> int:
+        return tracemalloc.get_traced_memory()[0] if self.trace_memory and tracemalloc.is_tracing() else 0
+
+    def slowest(self, count: int = 5) -> list[ImportNode]:
+        """Return the imported modules with the most self time, slowest first."""
+        modules = [node for root in self.dependencies.values() for node in root.walk() if node is not root]
+        return sorted(modules, key=lambda node: node.self_time, reverse=True)[:count]
+
+    def asdict(self) -> dict:
+        """Return a JSON-friendly representation of the import trees."""
+        return {
+            "trace_memory": self.trace_memory,
+            "dependencies": [node.asdict() for node in self.dependencies.values()],
+            "slowest": [node.name for node in self.slowest()],
+        }
+
+    def dump(self, path: Union[str, Path]) -> None:
+        """Write the import trees to a JSON file."""
+        Path(path).write_text(json.dumps(self.asdict(), indent=2) + "\n")
+
+
+class _ImportTimingFinder(MetaPathFinder):
+    """Find specs with the rest of `sys.meta_path`, wrapping their loaders to time module execution."""
+
+    def __init__(self, profiler: ImportProfiler):
+        self.profiler = profiler
+
+    def find_spec(
+        self, fullname: str, path: Optional[Sequence[str]], target: Optional[ModuleType] = None
+    ) -> Optional[ModuleSpec]:
+        if not self.profiler._stack:
+            return None
+
+        for finder in sys.meta_path:
+            if finder is self or (find_spec := getattr(finder, "find_spec", None)) is None:
+                continue
+            if (spec := find_spec(fullname, path, target)) is not None:
+                if hasattr(spec.loader, "exec_module"):
+                    spec.loader = _ImportTimingLoader(spec.loader, self.profiler)
+                return spec
+        return None
+
+
+class _ImportTimingLoader:
+    """Time a loader's module execution, then step aside."""
+
+    def __init__(self, loader: Any, profiler: ImportProfiler):
+        self.loader = loader
+        self.profiler = profiler
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.loader, name)
+
+    def exec_module(self, module: ModuleType) -> None:
+        # Restore the original loader first, so that nothing sees this wrapper afterward.
+        module.__loader__ = module.__spec__.loader = self.loader
+        stack = self.profiler._stack
+        if not stack:  # pragma: nocover
+            # Found in a profiled import, but executed elsewhere (e.g. by a lazy loader).
+            self.loader.exec_module(module)
+            return
+
+        node = ImportNode(module.__name__)
+        stack[-1].children.append(node)
+        with self.profiler._measure(node):
+            self.loader.exec_module(module)
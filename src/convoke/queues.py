@@ -0,0 +1,154 @@
+"""A background queue for fire-and-forget signals
+
+[`Signal.post`][convoke.signals.Signal.post] enqueues a message on the
+HQ's [`SignalQueue`][convoke.queues.SignalQueue] and returns, leaving
+worker tasks to deliver it. The queue is bounded; when it is full, its
+overflow policy decides what happens:
+
+- `BLOCK`: wait for room (backpressure on the producer)
+- `DROP_OLDEST`: discard the oldest queued message to make room
+- `DROP_NEWEST`: discard the message being posted
+
+    hq = HQ(config=MyConfig(), signal_queue=SignalQueue(maxsize=100, overflow=DROP_OLDEST))
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Optional, Type
+
+if TYPE_CHECKING:  # pragma: nocover
+    from convoke.bases import HQ
+    from convoke.signals import Signal
+
+BLOCK = "block"
+DROP_OLDEST = "drop_oldest"
+DROP_NEWEST = "drop_newest"
+
+OVERFLOW_POLICIES = (BLOCK, DROP_OLDEST, DROP_NEWEST)
+
+
+@dataclass
+class QueueStats:
+    """Counters for a [`SignalQueue`][convoke.queues.SignalQueue].
+
+    :param int posted: messages accepted onto the queue
+    :param int delivered: messages sent to their receivers
+    :param int dropped: messages discarded due to overflow
+    :param int abandoned: messages left undelivered when the queue was cancelled
+    :param int high_water: the greatest queue depth seen
+    """
+
+    posted: int = 0
+    delivered: int = 0
+    dropped: int = 0
+    abandoned: int = 0
+    high_water: int = 0
+
+
+@dataclass
+class SignalQueue:
+    """A bounded queue of posted signals, drained by worker tasks.
+
+    Workers start on the running event loop when the first message is
+    posted. Each message is sent with
+    [`HQ.send_signal`][convoke.bases.HQ.send_signal], so receiver errors
+    are logged, as with `Signal.send`. Note that receivers run in the
+    workers' context, rather than the context of each `post()`.
+
+    :param int maxsize: the most messages to hold at once (`0` for no limit)
+    :param str overflow: what to do when the queue is full: `BLOCK`, `DROP_OLDEST` or `DROP_NEWEST`
+    :param int workers: the number of worker tasks delivering messages
+    """
+
+    maxsize: int = 1000
+    overflow: str = BLOCK
+    workers: int = 1
+
+    hq: Optional[HQ] = field(default=None, repr=False)
+    stats: QueueStats = field(init=False, default_factory=QueueStats)
+
+    _queue: Optional[asyncio.Queue] = field(init=False, default=None, repr=False)
+    _tasks: list[asyncio.Task] = field(init=False, default_factory=list, repr=False)
+    _loop: Optional[asyncio.AbstractEventLoop] = field(init=False, default=None, repr=False)
+
+    def __post_init__(self):
+        if self.overflow not in OVERFLOW_POLICIES:
+            raise ValueError(f"Unknown overflow policy {self.overflow!r}; expected one of {OVERFLOW_POLICIES}")
+
+    @property
+    def depth(self) -> int:
+        """The number of messages waiting to be delivered."""
+        return self._queue.qsize() if self._queue is not None else 0
+
+    async def post(self, signal_class: Type[Signal], msg: Any) -> bool:
+        """Enqueue a message for delivery, applying the overflow policy if the queue is full.
+
+        :param Type[Signal] signal_class: The Signal subclass to send
+        :param Any msg: An instance of signal_class.Message
+        :return: whether the message was accepted
+        """
+        queue = self._start()
+        if queue.full():
+            if self.overflow == DROP_NEWEST:
+                self.stats.dropped += 1
+                return False
+            elif self.overflow == DROP_OLDEST:
+                queue.get_nowait()
+                queue.task_done()
+                self.stats.dropped += 1
+
+        await queue.put((signal_class, msg))
+        self.stats.posted += 1
+        self.stats.high_water = max(self.stats.high_water, queue.qsize())
+        return True
+
+    async def join(self) -> None:
+        """Wait until every message posted so far has been delivered."""
+        if self._queue is not None:
+            await self._queue.join()
+
+    async def stop(self) -> None:
+        """Deliver every queued message, then stop the workers."""
+        await self.join()
+        await self.cancel()
+
+    async def cancel(self) -> int:
+        """Stop the workers at once, abandoning messages still queued or being delivered.
+
+        :return: the number of messages abandoned
+        """
+        abandoned = self.stats.abandoned
+        self.stats.abandoned += self.depth
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks.clear()
+        self._queue = self._loop = None
+        return self.stats.abandoned - abandoned
+
+    def _start(self) -> asyncio.Queue:
+        """Return the queue, first starting workers on the running loop if needed."""
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            # Never started, or started on a loop that has since gone away.
+            self._loop = loop
+            self._queue = asyncio.Queue(self.maxsize)
+            self._tasks = [loop.create_task(self._work()) for _ in range(self.workers)]
+        return self._queue
+
+    async def _work(self) -> None:
+        queue = self._queue
+        while True:
+            signal_class, msg = await queue.get()
+            try:
+                await self.hq.send_signal(signal_class, msg)
+            except asyncio.CancelledError:
+                self.stats.abandoned += 1
+                raise
+            except Exception:
+                logging.exception(f"Exception occurred while delivering posted {signal_class!r}:\n Message: {msg!r}")
+            finally:
+                queue.task_done()
+            self.stats.delivered += 1
@@ -0,0 +1,257 @@
+"""Rate policies for high-frequency signals
+
+Some signals fire in bursts, where receivers only need the latest
+message, or one message per key. Set a `rate_policy` on such a Signal,
+and the HQ holds messages back, delivering fewer of them:
+
+    class CONFIG_TOUCHED(Signal):
+        rate_policy = Debounce(wait=0.5)
+
+    class CACHE_DIRTIED(Signal):
+        rate_policy = Coalesce(key='key', wait=0.1)
+
+        @dataclass
+        class Message:
+            key: str
+
+- [`Debounce`][convoke.rates.Debounce]: deliver only the last message, once messages stop for a while
+- [`Throttle`][convoke.rates.Throttle]: deliver at most a number of messages per interval
+- [`Coalesce`][convoke.rates.Coalesce]: deliver one message per key, once per interval
+
+Held messages are delivered from a background task, after `send()`
+has returned. Messages released together are sent together, as with
+`send_many()`, so batch receivers receive them in a single call.
+"""
+from __future__ import annotations
+
+import asyncio
+from abc import ABC, abstractmethod
+from collections.abc import Hashable
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Optional
+
+Deliver = Callable[[tuple], Awaitable[None]]
+
+
+class RatePolicy(ABC):
+    """Base class for rate policies.
+
+    A policy is declared once, on a Signal subclass. Each HQ gets its
+    own [`RateLimiter`][convoke.rates.RateLimiter] from it, to hold that
+    HQ's messages.
+    """
+
+    @abstractmethod
+    def limiter(self, deliver: Deliver, loop: asyncio.AbstractEventLoop) -> RateLimiter:
+        """Return a new limiter, which releases messages by awaiting `deliver(msgs)`."""
+
+
+class RateLimiter(ABC):
+    """Hold messages for a single Signal on a single HQ, releasing them according to a policy.
+
+    Limiters run on one event loop, and aren't thread-safe.
+
+    :param Deliver deliver: an async callable that delivers a tuple of messages to receivers
+    :param AbstractEventLoop loop: the event loop to run timers on
+    """
+
+    def __init__(self, deliver: Deliver, loop: asyncio.AbstractEventLoop):
+        self.deliver = deliver
+        self.loop = loop
+        self.held = 0
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._tasks: set[asyncio.Task] = set()
+
+    @abstractmethod
+    def submit(self, msgs: tuple) -> None:
+        """Take messages sent over the Signal, releasing some now, and perhaps some later."""
+
+    @abstractmethod
+    def pending(self) -> list:
+        """Remove and return the messages being held back."""
+
+    async def flush(self) -> None:
+        """Release any messages being held back, and wait until all released messages have been delivered."""
+        self._cancel_timer()
+        if msgs := self.pending():
+            self._release(msgs)
+        while self._tasks:
+            # Shielded, so that a cancelled flush leaves the deliveries themselves to `cancel()`.
+            await asyncio.gather(*map(asyncio.shield, self._tasks))
+
+    async def cancel(self) -> int:
+        """Discard any messages being held back, and cancel deliveries of released messages.
+
+        :return: the number of messages discarded, plus the number of deliveries cancelled
+        """
+        self._cancel_timer()
+        discarded = len(self.pending())
+        cancelled = [task for task in self._tasks if task.cancel()]
+        await asyncio.gather(*cancelled, return_exceptions=True)
+        return discarded + len(cancelled)
+
+    def _release(self, msgs) -> None:
+        task = self.loop.create_task(self.deliver(tuple(msgs)))
+        # Keep a reference, so that the task isn't garbage-collected before it's done.
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    def _release_pending(self) -> None:
+        self._timer = None
+        self._release(self.pending())
+
+    def _set_timer(self, delay: float) -> None:
+        self._cancel_timer()
+        self._timer = self.loop.call_later(delay, self._release_pending)
+
+    def _cancel_timer(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+
+@dataclass(frozen=True)
+class Debounce(RatePolicy):
+    """Deliver only the last message of a burst, once no message has been sent for `wait` seconds.
+
+    :param float wait: the quiet period, in seconds
+    """
+
+    wait: float
+
+    def limiter(self, deliver: Deliver, loop: asyncio.AbstractEventLoop) -> RateLimiter:
+        """Return a new limiter for this policy."""
+        return DebounceLimiter(self, deliver, loop)
+
+
+class DebounceLimiter(RateLimiter):
+    """Hold the latest message, restarting the quiet period with each one."""
+
+    def __init__(self, policy: Debounce, deliver: Deliver, loop: asyncio.AbstractEventLoop):
+        super().__init__(deliver, loop)
+        self.policy = policy
+        self._latest: list = []
+
+    def submit(self, msgs: tuple) -> None:
+        """Hold the last of the messages, and restart the quiet period."""
+        self.held += len(msgs) + len(self._latest) - 1
+        self._latest = [msgs[-1]]
+        self._set_timer(self.policy.wait)
+
+    def pending(self) -> list:
+        """Remove and return the latest message, if any."""
+        latest, self._latest = self._latest, []
+        return latest
+
+
+@dataclass(frozen=True)
+class Throttle(RatePolicy):
+    """Deliver at most `limit` messages per `interval` seconds.
+
+    Messages within the limit are delivered at once. Of the messages
+    beyond it, only the latest is kept, and it's delivered at the start
+    of the next interval, so that receivers always see the last word.
+
+    :param int limit: the most messages to deliver per interval
+    :param float interval: the length of each interval, in seconds
+    """
+
+    limit: int
+    interval: float
+
+    def limiter(self, deliver: Deliver, loop: asyncio.AbstractEventLoop) -> RateLimiter:
+        """Return a new limiter for this policy."""
+        return ThrottleLimiter(self, deliver, loop)
+
+
+class ThrottleLimiter(RateLimiter):
+    """Count messages delivered in the current interval, holding the latest excess message."""
+
+    def __init__(self, policy: Throttle, deliver: Deliver, loop: asyncio.AbstractEventLoop):
+        super().__init__(deliver, loop)
+        self.policy = policy
+        self._window_start = float("-inf")
+        self._count = 0
+        self._latest: list = []
+
+    def submit(self, msgs: tuple) -> None:
+        """Deliver messages up to the limit, and hold the latest of the rest."""
+        now = self.loop.time()
+        if now - self._window_start >= self.policy.interval:
+            self._window_start = now
+            self._count = 0
+
+        allowed = msgs[: max(self.policy.limit - self._count, 0)]
+        if allowed:
+            self._count += len(allowed)
+            self._release(allowed)
+        if excess := msgs[len(allowed) :]:
+            self.held += len(excess) + len(self._latest) - 1
+            self._latest = [excess[-1]]
+            if self._timer is None:
+                self._set_timer(self._window_start + self.policy.interval - now)
+
+    def pending(self) -> list:
+        """Remove and return the latest excess message, if any."""
+        latest, self._latest = self._latest, []
+        return latest
+
+    def _release_pending(self) -> None:
+        # The held message opens the next interval.
+        self._window_start = self.loop.time()
+        self._count = len(self._latest)
+        super()._release_pending()
+
+
+@dataclass(frozen=True)
+class Coalesce(RatePolicy):
+    """Merge messages that share a key, delivering one per key every `wait` seconds.
+
+    The first message for a key starts the wait; messages for the same
+    key sent meanwhile replace it (or, with `merge`, are merged into it).
+    With the default `wait` of `0`, messages are coalesced until the
+    next turn of the event loop.
+
+    :param str key: the name of the Message field to coalesce by
+    :param float wait: how long to collect messages before delivering them, in seconds
+    :param Callable merge: a function `merge(held, new)` returning the message to hold
+        (default: hold the newest message)
+    """
+
+    key: str
+    wait: float = 0.0
+    merge: Optional[Callable[[Any, Any], Any]] = None
+
+    def limiter(self, deliver: Deliver, loop: asyncio.AbstractEventLoop) -> RateLimiter:
+        """Return a new limiter for this policy."""
+        return CoalesceLimiter(self, deliver, loop)
+
+
+class CoalesceLimiter(RateLimiter):
+    """Hold one message per key, in the order each key was first seen."""
+
+    def __init__(self, policy: Coalesce, deliver: Deliver, loop: asyncio.AbstractEventLoop):
+        super().__init__(deliver, loop)
+        self.policy = policy
+        self._by_key: dict[Hashable, Any] = {}
+
+    def submit(self, msgs: tuple) -> None:
+        """Hold the messages, merging those whose key is already held."""
+        by_key = self._by_key
+        key = self.policy.key
+        merge = self.policy.merge
+        for msg in msgs:
+            k = getattr(msg, key)
+            if k in by_key:
+                self.held += 1
+                by_key[k] = merge(by_key[k], msg) if merge is not None else msg
+            else:
+                by_key[k] = msg
+        if self._timer is None:
+            self._set_timer(self.policy.wait)
+
+    def pending(self) -> list:
+        """Remove and return the held messages."""
+        held = list(self._by_key.values())
+        self._by_key.clear()
+        return held
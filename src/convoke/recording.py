@@ -0,0 +1,211 @@
+"""Tools for recording signal traffic, and replaying it for load tests
+
+Recording is opt-in: provide a [`SignalRecorder`][convoke.recording.SignalRecorder]
+when instantiating the HQ, and dump what it records to a file:
+
+    recorder = SignalRecorder()
+    hq = HQ(config=MyConfig(), recorder=recorder)
+    ...
+    recorder.dump('signals.jsonl.gz')
+
+Later, and elsewhere, feed the recorded signals to another HQ, at their
+original rate, faster, or as fast as possible, and see how it copes:
+
+    recorder = SignalRecorder.load('signals.jsonl.gz')
+    report = await replay(recorder.records, hq, speed=None)
+    print(json.dumps(report.asdict(), indent=2))
+"""
+from __future__ import annotations
+
+import asyncio
+import dataclasses
+import gzip
+import json
+import time
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import IO, TYPE_CHECKING, Any, Optional, Type, Union
+
+from convoke import current_hq
+from convoke.metrics import LatencyHistogram
+from convoke.signals import Signal, resolve_signal, signal_name
+
+if TYPE_CHECKING:  # pragma: nocover
+    from convoke.bases import HQ
+
+
+@dataclass(slots=True)
+class RecordedSignal:
+    """A single recorded send.
+
+    :param Type[Signal] signal_class: the Signal subclass the message was sent over
+    :param Any msg: the message, or for a send of many messages at once, a tuple of them
+    :param float timestamp: seconds since recording started
+    :param bool many: whether the messages were sent at once, with
+        [`HQ.send_signal_many`][convoke.bases.HQ.send_signal_many]
+    """
+
+    signal_class: Type[Signal]
+    msg: Any
+    timestamp: float
+    many: bool = False
+
+
+@dataclass
+class SignalRecorder:
+    """Record each send through an HQ, and when.
+
+    Messages are kept in memory, and only serialized when dumped, so
+    recording costs little. Don't modify messages after sending them,
+    or the recording will show the modified version. When dumped, each
+    message is serialized as JSON (with `dataclasses.asdict`), so its
+    fields must be JSON-serializable.
+
+    Files are written as JSON lines, one send per line. Paths ending
+    in `.gz` are compressed.
+
+    :param int limit: the most sends to record (`None` for no limit); later sends are skipped
+    """
+
+    limit: Optional[int] = None
+    records: list[RecordedSignal] = field(default_factory=list)
+    skipped: int = 0
+
+    _start: Optional[float] = field(default=None, repr=False)
+
+    def record(self, signal_class: Type[Signal], msg: Any) -> None:
+        """Record a message sent over the given Signal subclass."""
+        self._record(signal_class, msg, False)
+
+    def record_many(self, signal_class: Type[Signal], msgs: Sequence) -> None:
+        """Record several messages sent at once over the given Signal subclass."""
+        self._record(signal_class, tuple(msgs), True)
+
+    def _record(self, signal_class: Type[Signal], msg: Any, many: bool) -> None:
+        now = time.perf_counter()
+        if self._start is None:
+            self._start = now
+        if self.limit is not None and len(self.records) >= self.limit:
+            self.skipped += 1
+        else:
+            self.records.append(RecordedSignal(signal_class, msg, now - self._start, many))
+
+    def dump(self, path: Union[str, Path]) -> None:
+        """Write the recorded sends to a file.
+
+        Each line holds the timestamp, the Signal's name, and the message's
+        fields, or for a send of many messages, a list of their fields.
+        """
+        with _open(path, "wt") as fh:
+            for record in self.records:
+                if record.many:
+                    fields = [dataclasses.asdict(msg) for msg in record.msg]
+                else:
+                    fields = dataclasses.asdict(record.msg)
+                line = [round(record.timestamp, 6), signal_name(record.signal_class), fields]
+                fh.write(json.dumps(line, separators=(",", ":")) + "\n")
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> SignalRecorder:
+        """Read recorded sends from a file written by `dump()`.
+
+        Each Signal's module is imported, if it hasn't been already.
+
+        :raises ValueError: if the file names something other than a Signal subclass
+        """
+        signal_classes: dict[str, Type[Signal]] = {}
+        records = []
+        with _open(path, "rt") as fh:
+            for line in fh:
+                timestamp, name, fields = json.loads(line)
+                if (signal_class := signal_classes.get(name)) is None:
+                    signal_class = signal_classes[name] = resolve_signal(name)
+                if isinstance(fields, list):
+                    msgs = tuple(signal_class.Message(**each) for each in fields)
+                    records.append(RecordedSignal(signal_class, msgs, timestamp, many=True))
+                else:
+                    records.append(RecordedSignal(signal_class, signal_class.Message(**fields), timestamp))
+        return cls(records=records)
+
+
+@dataclass
+class ReplayReport:
+    """The results of replaying recorded messages.
+
+    :param int messages: the number of messages sent
+    :param float elapsed: wall time, in seconds, taken to send them all
+    :param float lag: the furthest, in seconds, that sends fell behind schedule
+    :param LatencyHistogram latency: the time taken by each send, to all receivers
+    """
+
+    messages: int = 0
+    elapsed: float = 0.0
+    lag: float = 0.0
+    latency: LatencyHistogram = field(default_factory=LatencyHistogram)
+
+    @property
+    def throughput(self) -> float:
+        """Messages sent per second."""
+        return self.messages / self.elapsed if self.elapsed else 0.0
+
+    def asdict(self) -> dict:
+        """Return a JSON-friendly representation of the report."""
+        return {
+            "messages": self.messages,
+            "elapsed": self.elapsed,
+            "throughput": self.throughput,
+            "lag": self.lag,
+            "latency": self.latency.asdict(),
+        }
+
+
+async def replay(
+    records: Sequence[RecordedSignal],
+    hq: Optional[HQ] = None,
+    speed: Optional[float] = 1.0,
+) -> ReplayReport:
+    """Send recorded messages through an HQ, on their original schedule, or faster.
+
+    Each send is repeated with [`HQ.send_signal`][convoke.bases.HQ.send_signal],
+    or for messages sent at once, [`HQ.send_signal_many`][convoke.bases.HQ.send_signal_many],
+    and awaited before the next. If receivers can't keep up with
+    the schedule, the replay falls behind; see `ReplayReport.lag`.
+
+    :param Sequence[RecordedSignal] records: the sends to repeat, e.g. `SignalRecorder.load(path).records`
+    :param HQ hq: the [`HQ`][convoke.bases.HQ] instance to send to (defaults to `HQ.current_hq`)
+    :param float speed: how many times faster than recorded to send (`None` to send as fast as possible)
+    :return: a report of throughput and latency
+    """
+    if hq is None:
+        hq = current_hq.get()
+    if speed is not None and speed <= 0:
+        raise ValueError(f"Replay speed must be positive, or None: {speed!r}")
+
+    report = ReplayReport()
+    origin = records[0].timestamp if records else 0.0
+    start = time.perf_counter()
+    for record in records:
+        if speed is not None:
+            delay = (record.timestamp - origin) / speed - (time.perf_counter() - start)
+            if delay > 0:
+                await asyncio.sleep(delay)
+            else:
+                report.lag = max(report.lag, -delay)
+
+        sent = time.perf_counter()
+        if record.many:
+            await hq.send_signal_many(record.signal_class, record.msg)
+            report.messages += len(record.msg)
+        else:
+            await hq.send_signal(record.signal_class, record.msg)
+            report.messages += 1
+        report.latency.record(time.perf_counter() - sent)
+    report.elapsed = time.perf_counter() - start
+    return report
+
+
+def _open(path: Union[str, Path], mode: str) -> IO:
+    path = Path(path)
+    return gzip.open(path, mode) if path.suffix == ".gz" else path.open(mode)
+
@@ -1,10 +1,16 @@
 """Utilities for managing signals and signal handlers"""
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import TYPE_CHECKING, Callable
+import importlib
+import sys
+from concurrent.futures import Executor, Future
+from dataclasses import dataclass, field
+from types import BuiltinMethodType, MethodType
+from typing import TYPE_CHECKING, Any, Callable, ClassVar, Hashable, Iterable, Optional, Type, Union
+from weakref import ref
 
 from convoke import current_hq
+from convoke.rates import RatePolicy
 
 if TYPE_CHECKING:  # pragma: nocover
     from convoke.bases import HQ
@@ -12,19 +18,115 @@ if TYPE_CHECKING:  # pragma: nocover
 Receiver = Callable[..., None]
 
 
+@dataclass(frozen=True, slots=True)
+class Connection:
+    """A receiver connected to a signal, classified once, at connection time.
+
+    :param Receiver receiver: the connected callable (or, if `weak`, a weak reference to it)
+    :param bool is_async: whether calling the receiver returns an awaitable
+    :param bool batch: whether the receiver accepts a list of messages
+    :param Executor executor: an executor to run a sync receiver in (`True` for the event loop's default)
+    :param bool weak: whether `receiver` is a weak reference
+    :param float timeout: the most seconds to allow each call, before cancelling it
+    """
+
+    receiver: Union[Receiver, ref]
+    is_async: bool
+    batch: bool = False
+    executor: Union[Executor, bool, None] = None
+    weak: bool = False
+    timeout: Optional[float] = None
+    direct: bool = field(init=False, repr=False)
+
+    def __post_init__(self):
+        # Whether the receiver can simply be called with each message:
+        object.__setattr__(
+            self, "direct", not (self.batch or self.executor or self.weak or self.timeout is not None)
+        )
+
+    def resolve(self) -> Optional[Receiver]:
+        """Return the connected callable, or `None` if it was weakly referenced and has been garbage-collected."""
+        return self.receiver() if self.weak else self.receiver
+
+
+def receiver_key(receiver: Receiver) -> Hashable:
+    """Return a key identifying a receiver without referencing it.
+
+    Bound methods are created anew on each attribute access, so they are
+    identified by their instance and function.
+    """
+    if isinstance(receiver, MethodType):
+        return (id(receiver.__self__), id(receiver.__func__))
+    elif isinstance(receiver, BuiltinMethodType):
+        return (id(receiver.__self__), receiver.__name__)
+    return id(receiver)
+
+
 class Signal:
     """A Signal provides a typed interface for sending messages through the current HQ.
 
     To define a signal, subclass and provide a member class
     [`Message`][convoke.signals.Signal.Message], which defines the keyword
     arguments that may be sent through the signal.
+
+    By default, receivers are called one after another. Set `concurrent`
+    on a Signal subclass (or pass it to `send()`) to run async receivers
+    concurrently, optionally limited to `max_concurrency` at a time:
+
+        class FETCH(Signal):
+            concurrent = True
+            max_concurrency = 10
+
+    Receivers are normally connected to exactly one Signal subclass. Set
+    `hierarchical` on a Signal subclass so that its receivers also
+    receive messages sent over any of its subclasses:
+
+        class AUDIT(Signal):
+            hierarchical = True
+
+        class LOGIN(AUDIT):  # AUDIT receivers receive LOGIN messages too
+            pass
+
+    Set `deadline` on a Signal subclass (or pass it to `send()`) to
+    bound how long each send may take, in seconds. Receivers still
+    running at the deadline are cancelled:
+
+        class RENDER(Signal):
+            deadline = 0.2
+
+    Set `rate_policy` on a Signal subclass to deliver fewer messages
+    from bursts (see [`RatePolicy`][convoke.rates.RatePolicy]):
+
+        class CONFIG_TOUCHED(Signal):
+            rate_policy = Debounce(wait=0.5)
+
+    Set `broadcast` on a Signal subclass to send its messages to sibling
+    processes too, through the HQ's
+    [`Transport`][convoke.transports.Transport], if it has one.
     """
 
-    @dataclass
+    concurrent: ClassVar[bool] = False
+    max_concurrency: ClassVar[Optional[int]] = None
+    hierarchical: ClassVar[bool] = False
+    deadline: ClassVar[Optional[float]] = None
+    rate_policy: ClassVar[Optional[RatePolicy]] = None
+    broadcast: ClassVar[bool] = False
+
+    @classmethod
+    def dispatch_classes(cls) -> tuple[type[Signal], ...]:
+        """Return the Signal classes whose receivers receive this Signal's messages, most specific first."""
+        return (cls,) + tuple(
+            ancestor
+            for ancestor in cls.__mro__[1:]
+            if issubclass(ancestor, Signal) and ancestor.hierarchical
+        )
+
+    @dataclass(slots=True)
     class Message:
         """The default message type for signals.
 
-        Define your own Message dataclass on each Signal for type-safe signals.
+        Define your own Message dataclass on each Signal for type-safe
+        signals. Use `@dataclass(slots=True)` for smaller, faster messages.
 
         :param str value: a simple string to send as part of the message
         """
@@ -32,15 +134,31 @@ class Signal:
         value: str
 
     @classmethod
-    def connect(cls, receiver: Receiver, using: HQ | None = None):
+    def connect(
+        cls,
+        receiver: Receiver,
+        using: HQ | None = None,
+        batch: bool = False,
+        executor: Union[Executor, bool, None] = None,
+        weak: bool = False,
+        timeout: Optional[float] = None,
+    ):
         """Connect a callable to this signal.
 
         :param Receiver receiver: a callable that accepts a single argument of type `Signal.Message`
+            (or, with `batch`, a list of them)
         :param HQ using: the [`HQ`][convoke.bases.HQ] instance to connect on (defaults to `HQ.current_hq`)
+        :param bool batch: call the receiver with a list of messages, rather than one at a time
+        :param Executor executor: run a sync receiver in this executor, rather than on the event loop
+            (`True` for the event loop's default thread pool)
+        :param bool weak: hold only a weak reference to the receiver, so that the connection
+            doesn't keep it (or, for a bound method, its instance) alive
+        :param float timeout: cancel each call to an async receiver (or a sync receiver run in an executor)
+            that takes longer than this many seconds
         """
         if using is None:
             using = current_hq.get()
-        using.connect_signal_receiver(cls, receiver)
+        using.connect_signal_receiver(cls, receiver, batch=batch, executor=executor, weak=weak, timeout=timeout)
 
     @classmethod
     def disconnect(cls, receiver: Receiver, using: HQ | None = None):
@@ -54,17 +172,137 @@ class Signal:
         using.disconnect_signal_receiver(cls, receiver)
 
     @classmethod
-    async def send(cls, *, using: HQ | None = None, **kwargs):
+    async def send(
+        cls,
+        *,
+        using: HQ | None = None,
+        concurrent: Optional[bool] = None,
+        max_concurrency: Optional[int] = None,
+        deadline: Optional[float] = None,
+        **kwargs,
+    ):
         """Send a message over this Signal.
 
         Messages are sent asynchronously. Do not depend on side
         effects to happen immediately.
 
+        If nothing receives this Signal, this returns at once, without
+        constructing the message.
+
+        :param HQ using: the [`HQ`][convoke.bases.HQ] instance to send to (defaults to `HQ.current_hq`)
+        :param bool concurrent: run async receivers concurrently (defaults to `Signal.concurrent`)
+        :param int max_concurrency: the most async receivers to run at once (defaults to `Signal.max_concurrency`)
+        :param float deadline: the most seconds the send may take (defaults to `Signal.deadline`)
+        :param **kwargs: the keyword arguments to construct the `Signal.Message` with.
+
+        """
+        if using is None:
+            using = current_hq.get()
+        if using.has_receivers(cls):
+            await using.send_signal(
+                cls, cls.Message(**kwargs), concurrent=concurrent, max_concurrency=max_concurrency, deadline=deadline
+            )
+
+    @classmethod
+    def send_sync(cls, *, using: HQ | None = None, **kwargs) -> None:
+        """Send a message over this Signal from synchronous code.
+
+        Sync receivers are called before this returns; async receivers
+        are scheduled on the event loop (see
+        [`HQ.send_signal_sync`][convoke.bases.HQ.send_signal_sync]).
+
         :param HQ using: the [`HQ`][convoke.bases.HQ] instance to send to (defaults to `HQ.current_hq`)
         :param **kwargs: the keyword arguments to construct the `Signal.Message` with.
+        """
+        if using is None:
+            using = current_hq.get()
+        if using.has_receivers(cls):
+            using.send_signal_sync(cls, cls.Message(**kwargs))
 
+    @classmethod
+    def send_threadsafe(cls, *, using: HQ | None = None, **kwargs) -> Future:
+        """Send a message over this Signal from any thread, on the HQ's event loop.
+
+        The send is scheduled on `hq.loop` (see
+        [`HQ.send_signal_threadsafe`][convoke.bases.HQ.send_signal_threadsafe]).
+        Wait on the returned future to know when it's done.
+
+        :param HQ using: the [`HQ`][convoke.bases.HQ] instance to send to (defaults to `HQ.current_hq`)
+        :param **kwargs: the keyword arguments to construct the `Signal.Message` with.
+        :return: a `concurrent.futures.Future` that completes once the message has been sent
+        """
+        if using is None:
+            using = current_hq.get()
+        if using.has_receivers(cls):
+            return using.send_signal_threadsafe(cls, cls.Message(**kwargs))
+        future = Future()
+        future.set_result(None)
+        return future
+
+    @classmethod
+    async def send_many(
+        cls,
+        messages: Iterable[Signal.Message],
+        *,
+        using: HQ | None = None,
+        concurrent: Optional[bool] = None,
+        max_concurrency: Optional[int] = None,
+        deadline: Optional[float] = None,
+    ):
+        """Send several messages over this Signal at once.
+
+        Receivers connected with `batch=True` receive all the messages
+        in a single call; others receive them one at a time.
+
+        :param Iterable[Signal.Message] messages: instances of this Signal's `Message` class
+        :param HQ using: the [`HQ`][convoke.bases.HQ] instance to send to (defaults to `HQ.current_hq`)
+        :param bool concurrent: run async receivers concurrently (defaults to `Signal.concurrent`)
+        :param int max_concurrency: the most async receivers to run at once (defaults to `Signal.max_concurrency`)
+        :param float deadline: the most seconds the send may take (defaults to `Signal.deadline`)
+        """
+        if using is None:
+            using = current_hq.get()
+        await using.send_signal_many(
+            cls, tuple(messages), concurrent=concurrent, max_concurrency=max_concurrency, deadline=deadline
+        )
+
+    @classmethod
+    async def post(cls, *, using: HQ | None = None, **kwargs) -> bool:
+        """Post a message over this Signal, without waiting for receivers.
+
+        The message is queued on the HQ's
+        [`SignalQueue`][convoke.queues.SignalQueue] and delivered in the
+        background. If the queue is full, this may wait for room, or
+        drop a message, according to the queue's overflow policy.
+
+        :param HQ using: the [`HQ`][convoke.bases.HQ] instance to send to (defaults to `HQ.current_hq`)
+        :param **kwargs: the keyword arguments to construct the `Signal.Message` with.
+        :return: whether the message was accepted
         """
         msg = cls.Message(**kwargs)
         if using is None:
             using = current_hq.get()
-        await using.send_signal(cls, msg)
+        return await using.post_signal(cls, msg)
+
+
+def signal_name(signal_class: Type[Signal]) -> str:
+    """Return the name of a Signal subclass, as `module:QualName`, for finding it with `resolve_signal()`."""
+    return f"{signal_class.__module__}:{signal_class.__qualname__}"
+
+
+def resolve_signal(name: str, import_module: bool = True) -> Type[Signal]:
+    """Look up a Signal subclass by the name `signal_name()` gave it.
+
+    :param str name: the Signal's name
+    :param bool import_module: import the Signal's module if it hasn't been already
+        (otherwise, Signals in modules not yet imported aren't found)
+    :raises ValueError: if the name is not that of a Signal subclass
+    :raises ImportError: if the Signal's module can't be imported
+    """
+    module_name, _, qualname = name.partition(":")
+    obj: Any = importlib.import_module(module_name) if import_module else sys.modules.get(module_name)
+    for attr in qualname.split("."):
+        obj = getattr(obj, attr, None)
+    if not (isinstance(obj, type) and issubclass(obj, Signal)):
+        raise ValueError(f"Not a Signal subclass: {name}")
+    return obj
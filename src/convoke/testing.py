@@ -0,0 +1,70 @@
+"""Tools for testing with an HQ
+
+Building an HQ and loading its dependencies for every test costs as
+much as a cold start. Instead, build one template HQ, and give each test
+a cheap clone of it (see [`HQ.clone`][convoke.bases.HQ.clone]):
+
+    # conftest.py
+    from convoke.testing import hq_fixture
+
+    hq = hq_fixture(['foo', 'bar'])
+
+Each test requesting the `hq` fixture then receives its own clone of a
+template HQ that is built once per session.
+"""
+from __future__ import annotations
+
+from collections.abc import Sequence
+from contextlib import contextmanager
+from typing import Callable, Iterator
+
+from convoke import current_hq
+from convoke.bases import HQ
+from convoke.configs import BaseConfig
+
+
+@contextmanager
+def isolated_hq(template: HQ) -> Iterator[HQ]:
+    """Run the block with a clone of the template HQ as the current HQ.
+
+    Afterward, the template and its Bases are re-established as current.
+    """
+    hq = template.clone()
+    token = current_hq.set(hq)
+    try:
+        yield hq
+    finally:
+        current_hq.reset(token)
+        template.make_current()
+
+
+def hq_fixture(
+    dependencies: Sequence[str],
+    config_factory: Callable[[], BaseConfig] = BaseConfig,
+    scope: str = "function",
+):
+    """Build a pytest fixture that provides an isolated clone of a template HQ.
+
+    The template HQ is built, and its dependencies loaded, the first
+    time the fixture is used, and then reused for the rest of the
+    session. Requires pytest.
+
+    :param Sequence[str] dependencies: the dependencies for the template HQ to load
+    :param Callable config_factory: a callable that returns the template HQ's config
+    :param str scope: the scope of the fixture (each instance gets a fresh clone)
+    """
+    import pytest
+
+    templates: list[HQ] = []
+
+    @pytest.fixture(scope=scope)
+    def fixture() -> Iterator[HQ]:
+        if not templates:
+            template = HQ(config=config_factory())
+            template.load_dependencies(dependencies)
+            templates.append(template)
+
+        with isolated_hq(templates[0]) as hq:
+            yield hq
+
+    return fixture
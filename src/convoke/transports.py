@@ -0,0 +1,302 @@
+"""Transports for broadcasting signals to sibling processes
+
+Signals are normally delivered only within one HQ. To deliver a Signal
+to every process in a multi-process deployment (say, to invalidate
+caches in each worker), set `broadcast` on it, and give each process's
+HQ a [`Transport`][convoke.transports.Transport]:
+
+    class INVALIDATE(Signal):
+        broadcast = True
+
+    hq = HQ(config=MyConfig(), transport=UnixSocketTransport('/run/myapp/signals'))
+
+Messages are still delivered to local receivers first, as usual. Each
+broadcast message is also serialized and buffered, and buffered
+messages are sent to sibling processes in batches. Siblings deliver
+the messages to their own local receivers, without broadcasting them
+again.
+"""
+from __future__ import annotations
+
+import dataclasses
+import json
+import logging
+import os
+import socket
+import time
+from abc import ABC, abstractmethod
+from collections import deque
+from dataclasses import KW_ONLY, dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Optional, Type, Union
+
+from convoke.signals import Signal, resolve_signal, signal_name
+
+if TYPE_CHECKING:  # pragma: nocover
+    import asyncio
+
+    from convoke.bases import HQ
+
+# The largest datagram read at once. Batches larger than this are truncated, so keep batches small enough to fit.
+MAX_DATAGRAM = 2**18
+
+# The default size limit of a single batch, comfortably below both MAX_DATAGRAM and Linux's default socket buffer.
+MAX_BATCH_BYTES = 2**16
+
+
+@dataclass
+class TransportStats:
+    """Counters for a [`Transport`][convoke.transports.Transport].
+
+    :param int published: messages buffered for broadcast
+    :param int dropped: messages discarded because the buffer was full, they were too large
+        to send, or a sibling couldn't keep up
+    :param int batches: batches sent (once per sibling)
+    :param int received: messages received from siblings
+    :param int errors: batches that couldn't be sent or read
+    """
+
+    published: int = 0
+    dropped: int = 0
+    batches: int = 0
+    received: int = 0
+    errors: int = 0
+
+
+@dataclass
+class Transport(ABC):
+    """Base class for transports that broadcast signals to sibling processes.
+
+    Broadcast messages are serialized as JSON (see `encode()`), so their
+    fields must be JSON-serializable; the HQ logs messages that aren't,
+    and only delivers them locally. They're buffered, then sent in
+    batches of up to `batch_size` messages, and `max_batch_bytes` bytes,
+    on the next turn of the event loop. When the buffer is full, the
+    oldest message is dropped. A message too large to fit in a batch by
+    itself is dropped as soon as it's published.
+
+    Subclasses implement `send_batch()`, and pass each batch received to
+    `receive()`. They may extend `start()` and `stop()` to open and
+    close connections.
+
+    :param int maxsize: the most messages to buffer before dropping the oldest
+    :param int batch_size: the most messages to send in one batch
+    :param int max_batch_bytes: the largest batch to send, in bytes
+    """
+
+    _: KW_ONLY
+    maxsize: int = 10000
+    batch_size: int = 100
+    max_batch_bytes: int = MAX_BATCH_BYTES
+
+    hq: Optional[HQ] = field(default=None, repr=False)
+    stats: TransportStats = field(init=False, default_factory=TransportStats)
+
+    _buffer: deque[bytes] = field(init=False, repr=False)
+    _loop: Optional[asyncio.AbstractEventLoop] = field(init=False, default=None, repr=False)
+    _flush_scheduled: bool = field(init=False, default=False, repr=False)
+    _signal_classes: dict[str, Optional[Type[Signal]]] = field(init=False, default_factory=dict, repr=False)
+
+    def __post_init__(self):
+        self._buffer = deque(maxlen=self.maxsize)
+
+    def start(self, loop: asyncio.AbstractEventLoop) -> None:
+        """Start sending and receiving on the given event loop.
+
+        Messages published before the transport starts are sent once it does.
+        """
+        self._loop = loop
+        if self._buffer:
+            self._schedule_flush()
+
+    async def stop(self) -> None:
+        """Send any buffered messages, then stop."""
+        if self._loop is not None:
+            self._flush()
+            self._loop = None
+
+    def publish(self, signal_class: Type[Signal], msg: Any) -> None:
+        """Buffer a message to broadcast to sibling processes. Safe to call from any thread.
+
+        :param Type[Signal] signal_class: The Signal subclass being sent
+        :param Any msg: An instance of signal_class.Message
+        :raises TypeError: if the message can't be serialized
+        """
+        data = self.encode(signal_class, msg)
+        if len(data) + 2 > self.max_batch_bytes:
+            logging.warning(f"Dropping broadcast message for {signal_class!r}, too large to send: {len(data)} bytes")
+            self.stats.dropped += 1
+            return
+        if len(self._buffer) == self.maxsize:
+            self.stats.dropped += 1
+        self._buffer.append(data)
+        self.stats.published += 1
+        if self._loop is not None and not self._flush_scheduled:
+            self._schedule_flush()
+
+    def _schedule_flush(self) -> None:
+        self._flush_scheduled = True
+        self._loop.call_soon_threadsafe(self._flush)
+
+    def _flush(self) -> None:
+        # Clear the flag before draining, so that a message published meanwhile schedules another flush.
+        self._flush_scheduled = False
+        buffer = self._buffer
+        while buffer:
+            batch = [buffer.popleft()]
+            size = len(batch[0]) + 2  # The enclosing brackets
+            while buffer and len(batch) < self.batch_size and size + len(buffer[0]) + 1 <= self.max_batch_bytes:
+                data = buffer.popleft()
+                batch.append(data)
+                size += len(data) + 1  # The separating comma
+            self.send_batch(b"[" + b",".join(batch) + b"]", len(batch))
+
+    @abstractmethod
+    def send_batch(self, data: bytes, count: int) -> None:
+        """Send a batch of serialized messages to every sibling process.
+
+        :param bytes data: the serialized batch
+        :param int count: the number of messages in the batch
+        """
+
+    def receive(self, data: bytes) -> None:
+        """Deliver a batch of messages received from a sibling process to local receivers.
+
+        Consecutive messages for the same Signal are sent together, with
+        [`HQ.send_signal_many`][convoke.bases.HQ.send_signal_many].
+        """
+        try:
+            messages = self.decode(data)
+        except (ValueError, TypeError):
+            logging.exception("Discarding unreadable batch of broadcast signals")
+            self.stats.errors += 1
+            return
+
+        self.stats.received += len(messages)
+        run: list = []
+        for signal_class, msg in messages:
+            if run and signal_class is not run[0][0]:
+                self._deliver(run)
+                run = []
+            run.append((signal_class, msg))
+        if run:
+            self._deliver(run)
+
+    def _deliver(self, run: list) -> None:
+        self.hq._spawn(self.hq.send_signal_many(run[0][0], [msg for _, msg in run], local=True), self._loop)
+
+    def encode(self, signal_class: Type[Signal], msg: Any) -> bytes:
+        """Serialize a single message, along with the name of its Signal."""
+        return json.dumps([signal_name(signal_class), dataclasses.asdict(msg)], separators=(",", ":")).encode()
+
+    def decode(self, data: bytes) -> list[tuple[Type[Signal], Any]]:
+        """Deserialize a batch of messages, skipping those for unknown Signals."""
+        messages = []
+        for name, fields in json.loads(data):
+            if (signal_class := self._resolve(name)) is not None:
+                messages.append((signal_class, signal_class.Message(**fields)))
+        return messages
+
+    def _resolve(self, name: str) -> Optional[Type[Signal]]:
+        """Look up a broadcast Signal class by name, without importing anything."""
+        if name in self._signal_classes:
+            return self._signal_classes[name]
+
+        try:
+            signal_class = resolve_signal(name, import_module=False)
+        except ValueError:
+            signal_class = None
+        if signal_class is None or not signal_class.broadcast:
+            logging.warning(f"Ignoring broadcast messages for unknown signal {name}")
+            signal_class = None
+        self._signal_classes[name] = signal_class
+        return signal_class
+
+
+@dataclass
+class UnixSocketTransport(Transport):
+    """Broadcast signals to sibling processes over Unix domain datagram sockets.
+
+    Each process binds a socket in a shared directory, and sends each
+    batch to every other socket in the directory, so there is no broker
+    to run. The directory is rescanned for siblings at most once every
+    `rescan_interval` seconds. Siblings that have gone away (including
+    sockets left behind by processes that died) are skipped until then.
+
+    Sends never block: if a sibling's socket buffer is full, the batch
+    is dropped for that sibling.
+
+    :param Path directory: the directory shared by sibling processes
+    :param str name: the file name of this process's socket (defaults to `<pid>.sock`)
+    :param float rescan_interval: the most seconds to wait before looking for new siblings
+    """
+
+    directory: Union[str, Path]
+    name: Optional[str] = None
+    rescan_interval: float = 1.0
+
+    _socket: Optional[socket.socket] = field(init=False, default=None, repr=False)
+    _peers: list[str] = field(init=False, default_factory=list, repr=False)
+    _scanned_at: float = field(init=False, default=float("-inf"), repr=False)
+
+    def __post_init__(self):
+        super().__post_init__()
+        self.directory = Path(self.directory)
+        if self.name is None:
+            self.name = f"{os.getpid()}.sock"
+
+    @property
+    def path(self) -> Path:
+        """The path of this process's socket."""
+        return self.directory / self.name
+
+    def start(self, loop: asyncio.AbstractEventLoop) -> None:
+        """Bind this process's socket, and start sending and receiving on the given event loop."""
+        if self._socket is None:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            self.path.unlink(missing_ok=True)  # Left behind by a previous process
+            self._socket = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+            self._socket.setblocking(False)
+            self._socket.bind(str(self.path))
+            loop.add_reader(self._socket, self._read)
+        super().start(loop)
+
+    async def stop(self) -> None:
+        """Send any buffered messages, then close and remove this process's socket."""
+        if self._socket is not None:
+            loop = self._loop
+            await super().stop()
+            loop.remove_reader(self._socket)
+            self._socket.close()
+            self._socket = None
+            self.path.unlink(missing_ok=True)
+
+    def send_batch(self, data: bytes, count: int) -> None:
+        """Send a batch of serialized messages to every other socket in the directory."""
+        for peer in list(self._get_peers()):
+            try:
+                self._socket.sendto(data, peer)
+            except BlockingIOError:
+                self.stats.dropped += count
+            except (FileNotFoundError, ConnectionRefusedError):
+                self._peers.remove(peer)  # The sibling has gone away
+            except OSError:
+                logging.exception(f"Exception occurred while broadcasting {count} signals to {peer}")
+                self.stats.errors += 1
+            else:
+                self.stats.batches += 1
+
+    def _get_peers(self) -> list[str]:
+        now = time.monotonic()
+        if now - self._scanned_at >= self.rescan_interval:
+            self._peers = [str(path) for path in self.directory.glob("*.sock") if path.name != self.name]
+            self._scanned_at = now
+        return self._peers
+
+    def _read(self) -> None:
+        while True:
+            try:
+                data = self._socket.recv(MAX_DATAGRAM)
+            except BlockingIOError:
+                return
+            self.receive(data)
@@ -1,6 +1,7 @@
 # ruff: noqa: D103
 """Global pytest fixtures"""
 import os
+import sys
 import tempfile
 from pathlib import Path
 import pytest
@@ -9,6 +10,8 @@ from convoke import current_hq
 from convoke.configs import BaseConfig
 from convoke.bases import HQ
 
+PATH = Path(__file__).absolute().parent
+
 
 @pytest.fixture(scope="session", autouse=True)
 def auto_env_base():
@@ -40,6 +43,15 @@ def config(tempdir) -> BaseConfig:
     return BaseConfig()
 
 
+@pytest.fixture
+def hq(config) -> HQ:
+    """Simple HQ, no dependencies, set as the current HQ."""
+    hq = HQ(config=config)
+    token = current_hq.set(hq)
+    yield hq
+    current_hq.reset(token)
+
+
 @pytest.fixture(scope="session")
 def hq_base(auto_env_base) -> HQ:
     hq = HQ()
@@ -48,3 +60,16 @@ def hq_base(auto_env_base) -> HQ:
     yield hq
     current_hq.reset(token)
     del hq
+
+
+@pytest.fixture
+def fakemodules():
+    with BaseConfig.fresh_plugins():
+        fakepath = str(PATH / "fakemodules")
+        sys.path.insert(0, fakepath)
+        yield
+
+    sys.path.pop(sys.path.index(fakepath))
+    for name in ("foo", "bar", "baz"):
+        if name in sys.modules:
+            del sys.modules[name]
@@ -1,15 +1,16 @@
 # ruff: noqa: D100, D101, D102, D103
 import asyncio
 import sys
+import types
 from pathlib import Path
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 
 import pytest
 
-from convoke.bases import HQ, Base
+from convoke.bases import HQ, Base, discover_dependencies
 from convoke.configs import BaseConfig
-
-PATH = Path(__file__).absolute().parent
+from convoke.graphs import DependencyGraph
+from convoke.signals import Signal
 
 
 class TestBase:
@@ -28,19 +29,28 @@ class TestBase:
 
         assert Main.get_current() is base
 
+    async def test_it_should_leave_async_initialization_to_areset(self, config: BaseConfig):
+        class Main(Base):
+            async def on_init(self):
+                self.initialized = True
+
+        base = Main(hq=Mock(config=config))
+        assert not hasattr(base, "initialized")
+        await base.areset()
+        assert base.initialized is True
+
+    async def test_it_should_shut_down_quietly_by_default(self, config: BaseConfig):
+        class Main(Base):
+            pass
+
+        base = Main(hq=Mock(config=config))
+        assert await base.ashutdown() is None
+
 
 class TestHQ:
     @pytest.fixture(autouse=True)
-    def fakemodules(self):
-        with BaseConfig.fresh_plugins():
-            fakepath = str(PATH / "fakemodules")
-            sys.path.insert(0, fakepath)
-            yield
-
-        sys.path.pop(sys.path.index(fakepath))
-        for name in ("foo", "bar", "baz"):
-            if name in sys.modules:
-                del sys.modules[name]
+    def autouse_fakemodules(self, fakemodules):
+        yield
 
     @pytest.fixture
     def hq(self, hq_base: HQ, config):
@@ -75,6 +85,31 @@ class TestHQ:
         assert HQ.current_instance.get() is hq
         assert hq.get_current() is hq
 
+    def test_it_should_skip_bases_with_unchanged_configs(self, hq: HQ):
+        import foo
+
+        foo_base = hq.bases["foo"]
+        foo_base.foos.append("sentinel")
+        foo.Main.current_instance.set(None)
+        assert hq.reset() == []
+        assert foo_base.foos == ["sentinel"]
+        assert foo.Main.get_current() is foo_base
+
+    def test_it_should_reset_bases_with_changed_configs(self, hq: HQ, monkeypatch):
+        monkeypatch.setenv("BAR", "changed")
+        assert hq.reset() == ["foo"]
+        assert hq.bases["foo"].config.BAR == "changed"
+
+    def test_it_should_force_a_reset(self, hq: HQ):
+        assert hq.reset(force=True) == ["foo", "baz", "bar"]
+
+    async def test_it_should_not_duplicate_registrations_on_reset(self, hq: HQ):
+        import baz
+
+        hq.reset(force=True)
+        assert len(hq.mountpoints[baz.ThingyMadoodle].mounted) == 2
+        assert len(hq.signal_receivers[baz.BAZ]) == 1
+
     async def test_it_should_send_a_sync_signal(self, hq: HQ):
         import foo
 
@@ -107,3 +142,492 @@ class TestHQ:
         await asyncio.sleep(0)
         assert baz_base.things == ["a thing"]
         assert baz_base.other_things == ["a thing"]
+
+    def test_it_should_discover_the_dependency_graph(self):
+        assert discover_dependencies(["foo", "bar"]).edges == {
+            "foo": ("baz",),
+            "baz": ("foo",),
+            "bar": ("baz",),
+        }
+
+
+class TestConcurrentImports:
+    @pytest.fixture
+    def slowmodules(self, tempdir: Path, fakemodules):
+        (tempdir / "slowsync.py").write_text("import threading\nbarrier = threading.Barrier(2, timeout=5)\n")
+        for name in ("slow_a", "slow_b"):
+            (tempdir / f"{name}.py").write_text(
+                "from convoke.bases import Base\n"
+                "import slowsync\n"
+                "slowsync.barrier.wait()  # Only passes if both modules import at once.\n"
+                "class Main(Base):\n"
+                "    dependencies = ['foo']\n"
+            )
+        sys.path.insert(0, str(tempdir))
+        yield
+        sys.path.remove(str(tempdir))
+        for name in ("slowsync", "slow_a", "slow_b"):
+            sys.modules.pop(name, None)
+
+    def test_it_should_import_independent_modules_concurrently(self, slowmodules, hq_base: HQ, config):
+        hq = HQ(config=config)
+        hq.load_dependencies(["slow_a", "slow_b"], max_workers=4)
+        assert list(hq.bases) == ["slow_a", "foo", "baz", "slow_b"]
+        assert hq.bases["slow_b"].bases["foo"] is hq.bases["foo"]
+        hq_base.reset()
+
+    def test_it_should_propagate_import_errors(self, fakemodules):
+        with pytest.raises(ModuleNotFoundError):
+            discover_dependencies(["foo", "does_not_exist"], max_workers=2)
+
+
+class TestDependencyGraph:
+    @pytest.fixture
+    def load(self, fakemodules, hq_base: HQ, config):
+        def load(**kwargs):
+            hq = HQ(config=config)
+            hq.load_dependencies(["foo", "bar"], **kwargs)
+            return hq
+
+        yield load
+        hq_base.reset()
+
+    def test_it_should_expose_the_graph(self, load):
+        hq = load()
+        assert hq.graph.roots == ("foo", "bar")
+        assert hq.graph.topological_order() == ("baz", "foo", "bar")
+        assert hq.graph.cycles() == [("foo", "baz")]
+
+    def test_it_should_write_a_graph_cache(self, load, tempdir: Path):
+        cache = tempdir / "graph.json"
+        hq = load(graph_cache=cache)
+        assert DependencyGraph.load(cache) == hq.graph
+
+    @pytest.mark.parametrize("max_workers", [None, 2])
+    def test_it_should_skip_discovery_with_a_graph_cache(self, load, tempdir: Path, max_workers):
+        cache = tempdir / "graph.json"
+        load(graph_cache=cache)
+        with patch("convoke.bases.discover_dependencies") as discover:
+            hq = load(graph_cache=cache, max_workers=max_workers)
+        discover.assert_not_called()
+        assert list(hq.bases) == ["foo", "baz", "bar"]
+
+    def test_it_should_rediscover_a_stale_graph_cache(self, load, tempdir: Path):
+        cache = tempdir / "graph.json"
+        DependencyGraph(roots=("foo", "bar"), edges={"foo": (), "bar": ()}).dump(cache)
+        hq = load(graph_cache=cache)
+        assert DependencyGraph.load(cache) == hq.graph
+        assert hq.graph.edges["foo"] == ("baz",)
+
+    def test_it_should_rediscover_a_graph_cache_naming_missing_modules(self, load, tempdir: Path):
+        cache = tempdir / "graph.json"
+        DependencyGraph(roots=("foo", "bar"), edges={"foo": ("gone",), "gone": (), "bar": ()}).dump(cache)
+        hq = load(graph_cache=cache)
+        assert "gone" not in hq.graph.edges
+
+    @pytest.mark.parametrize("content", ["not json", "[]", '{"version": 1, "roots": ["foo", "bar"]}'])
+    def test_it_should_ignore_an_unreadable_graph_cache(self, load, tempdir: Path, caplog, content):
+        cache = tempdir / "graph.json"
+        cache.write_text(content)
+        hq = load(graph_cache=cache)
+        assert "unreadable dependency graph cache" in caplog.text
+        assert DependencyGraph.load(cache) == hq.graph
+
+    def test_it_should_carry_on_when_the_graph_cache_is_a_directory(self, load, tempdir: Path, caplog):
+        cache = tempdir / "graph.json"
+        cache.mkdir()
+        hq = load(graph_cache=cache)
+        assert "unreadable dependency graph cache" in caplog.text
+        assert "Couldn't write dependency graph cache" in caplog.text
+        assert list(hq.bases) == ["foo", "baz", "bar"]
+
+    def test_it_should_carry_on_when_the_graph_cache_cant_be_written(self, load, tempdir: Path, caplog):
+        hq = load(graph_cache=tempdir / "missing" / "graph.json")
+        assert "Couldn't write dependency graph cache" in caplog.text
+        assert list(hq.bases) == ["foo", "baz", "bar"]
+
+
+class TestLazyHQ:
+    @pytest.fixture
+    def hq(self, fakemodules, hq_base: HQ, config):
+        hq = HQ(config=config, lazy=True)
+        hq.load_dependencies(["foo", "bar"])
+        yield hq
+        hq_base.reset()
+
+    def test_it_should_not_load_anything_up_front(self, hq: HQ):
+        assert list(hq.bases) == []
+        assert list(hq.bases.pending) == ["foo", "bar"]
+        assert "foo" not in sys.modules
+
+    def test_it_should_load_a_base_and_its_dependencies_on_lookup(self, hq: HQ):
+        foo_base = hq.bases["foo"]
+        assert list(hq.bases) == ["foo", "baz"]
+        assert list(hq.bases.pending) == ["bar"]
+        assert foo_base.bases["baz"] is hq.bases["baz"]
+        assert hq.graph.edges == {"foo": ("baz",), "baz": ("foo",)}
+
+    def test_it_should_reuse_loaded_bases(self, hq: HQ):
+        foo_base = hq.bases["foo"]
+        bar_base = hq.bases["bar"]
+        assert list(hq.bases) == ["foo", "baz", "bar"]
+        assert bar_base.bases["baz"].bases["foo"] is foo_base
+        assert not hq.bases.pending
+
+    async def test_it_should_load_responders_to_hierarchical_ancestors(self, make_module, hq_base: HQ, config):
+        class AUDIT(Signal):
+            hierarchical = True
+
+        class LOGIN(AUDIT):
+            pass
+
+        class Main(Base):
+            audits: list = Base.field(default_factory=list)
+
+            @Base.responds(AUDIT)
+            def on_audit(self, msg):
+                self.audits.append(msg)
+
+        make_module("auditor", Main)
+        hq = HQ(config=config, lazy=True)
+        hq.load_dependencies(["auditor"])
+        await LOGIN.send(value="alice", using=hq)
+        assert hq.bases["auditor"].audits == [LOGIN.Message(value="alice")]
+        hq_base.reset()
+
+    def test_it_should_make_loaded_bases_ready(self, hq: HQ):
+        with patch.object(Base, "on_ready") as on_ready:
+            hq.bases["foo"]
+        assert on_ready.call_count == 2
+
+    def test_it_should_reject_unknown_bases(self, hq: HQ):
+        with pytest.raises(KeyError):
+            hq.bases["nope"]
+
+    async def test_it_should_load_receivers_when_a_signal_is_sent(self, hq: HQ):
+        import bar
+
+        await bar.BAR.send(value="bar", using=hq)
+        assert list(hq.bases) == ["bar", "baz", "foo"]
+        assert hq.bases["bar"].bars == [bar.BAR.Message(value="bar")]
+
+    async def test_it_should_load_registrants_when_a_mountpoint_is_looked_up(self, hq: HQ):
+        import baz
+
+        hq.load_dependencies(["baz"])
+        assert len(hq.mountpoints[baz.ThingyMadoodle].mounted) == 2
+        assert "baz" in hq.bases
+
+    async def test_it_should_ignore_pending_bases_that_do_not_respond(self, hq: HQ):
+        import bar  # noqa: F401
+        import foo
+
+        await foo.FOO.send(value="foo", using=hq)
+        assert list(hq.bases) == ["foo", "baz"]
+        assert "bar" in hq.bases.pending
+
+
+@pytest.fixture
+def make_module():
+    """Install a Base subclass as `Main` in a fake module."""
+    names = []
+
+    def make_module(name: str, base_class: type[Base]):
+        module = types.ModuleType(name)
+        module.Main = base_class
+        sys.modules[name] = module
+        names.append(name)
+        return module
+
+    yield make_module
+    for name in names:
+        sys.modules.pop(name, None)
+
+
+class TestAsyncLifecycle:
+    @pytest.fixture
+    def events(self):
+        return []
+
+    @pytest.fixture
+    def modules(self, make_module, events):
+        def make_base(name, deps=(), delay=0.01):
+            class Main(Base):
+                dependencies = deps
+
+                async def on_init(self):
+                    events.append(f"{name} init start")
+                    await asyncio.sleep(delay)
+                    events.append(f"{name} init end")
+
+                async def on_ready(self):
+                    events.append(f"{name} ready")
+
+            make_module(name, Main)
+
+        make_base("async_a")
+        make_base("async_b")
+        make_base("async_c", deps=["async_a", "async_b"])
+
+        class Main(Base):
+            dependencies = ["async_c"]
+
+            def on_init(self):
+                events.append("sync_d init")
+
+        make_module("sync_d", Main)
+
+    @pytest.fixture
+    async def hq(self, modules, hq_base: HQ, config):
+        hq = HQ(config=config)
+        yield hq
+        hq_base.reset()
+
+    async def test_it_should_run_independent_hooks_concurrently(self, hq: HQ, events):
+        await hq.aload_dependencies(["sync_d"])
+        assert list(hq.bases) == ["sync_d", "async_c", "async_a", "async_b"]
+        assert events[:2] == ["async_a init start", "async_b init start"]
+        assert events.index("async_c init start") > events.index("async_a init end")
+        assert events.index("async_c init start") > events.index("async_b init end")
+        assert events.index("sync_d init") > events.index("async_c init end")
+        assert events[-3:] == ["async_a ready", "async_b ready", "async_c ready"]
+
+    async def test_it_should_register_special_methods_after_init(self, hq: HQ):
+        with patch.object(Base, "_register_special_methods") as register:
+            await hq.aload_dependencies(["async_a"])
+        register.assert_called_once_with()
+
+    async def test_it_should_set_the_current_instance(self, hq: HQ):
+        await hq.aload_dependencies(["async_a"])
+        assert sys.modules["async_a"].Main.get_current() is hq.bases["async_a"]
+
+    async def test_it_should_refuse_sync_loading(self, hq: HQ):
+        with pytest.raises(TypeError, match="aload_dependencies"):
+            hq.load_dependencies(["sync_d"])
+        assert not hq.bases
+
+    async def test_it_should_refuse_sync_reset(self, hq: HQ):
+        await hq.aload_dependencies(["async_a"])
+        with pytest.raises(TypeError, match="areset"):
+            hq.reset(force=True)
+
+    async def test_it_should_refuse_sync_ready(self, hq: HQ):
+        await hq.aload_dependencies(["async_a"])
+        with pytest.raises(TypeError, match="aready"):
+            hq.bases["async_a"].ready()
+
+    async def test_it_should_reset_asynchronously(self, hq: HQ, events):
+        await hq.aload_dependencies(["sync_d"])
+        events.clear()
+        assert await hq.areset() == []
+        assert await hq.areset(force=True) == ["sync_d", "async_c", "async_a", "async_b"]
+        assert events[:2] == ["async_a init start", "async_b init start"]
+        assert events[-1] == "sync_d init"
+
+    async def test_it_should_keep_reset_order_through_unchanged_bases(self, hq: HQ, events):
+        await hq.aload_dependencies(["sync_d"])
+        events.clear()
+        changed = {name: hq.bases[name].config for name in ["sync_d", "async_a", "async_b"]}
+        with patch.object(hq, "_changed_configs", return_value=changed):
+            assert await hq.areset() == ["sync_d", "async_a", "async_b"]
+        assert "async_c init start" not in events
+        assert events[-1] == "sync_d init"
+
+    async def test_it_should_propagate_init_errors(self, hq: HQ, make_module, events):
+        class Main(Base):
+            dependencies = ["async_a"]
+
+            async def on_init(self):
+                raise RuntimeError("boom")
+
+        make_module("broken", Main)
+
+        class Main(Base):
+            dependencies = ["broken"]
+
+        make_module("dependent", Main)
+        with pytest.raises(RuntimeError, match="boom"):
+            await hq.aload_dependencies(["dependent"])
+
+    async def test_it_should_load_sync_bases(self, hq: HQ, fakemodules):
+        await hq.aload_dependencies(["foo", "bar"])
+        assert list(hq.bases) == ["foo", "baz", "bar"]
+        assert hq.bases["foo"].foos == []
+
+    async def test_it_should_record_lazily(self, modules, config, hq_base: HQ):
+        hq = HQ(config=config, lazy=True)
+        await hq.aload_dependencies(["async_a"])
+        assert list(hq.bases.pending) == ["async_a"]
+        with pytest.raises(TypeError):
+            hq.bases["async_a"]
+        hq_base.reset()
+
+
+class TestShutdown:
+    @pytest.fixture
+    def events(self):
+        return []
+
+    @pytest.fixture
+    def hq(self, make_module, events, hq_base: HQ, config):
+        def make_base(name, deps=(), delay=0.0, sync=False):
+            class Main(Base):
+                dependencies = deps
+
+                if sync:
+
+                    def on_shutdown(self):
+                        events.append(f"{name} shutdown")
+
+                else:
+
+                    async def on_shutdown(self):
+                        events.append(f"{name} shutdown start")
+                        await asyncio.sleep(delay)
+                        events.append(f"{name} shutdown end")
+
+            make_module(name, Main)
+
+        make_base("db")
+        make_base("cache", delay=0.01)
+        make_base("files", sync=True)
+        make_base("web", deps=["db", "cache", "files"])
+        make_base("worker", deps=["db"], delay=0.01)
+
+        class Main(Base):
+            dependencies = ["web", "worker"]
+
+        make_module("app", Main)
+
+        hq = HQ(config=config)
+        hq.load_dependencies(["app"])
+        yield hq
+        hq_base.reset()
+
+    async def test_it_should_shut_down_dependents_first(self, hq: HQ, events):
+        report = await hq.shutdown()
+        assert report.ok
+        assert set(report.completed) == {"web", "worker", "db", "cache", "files"}
+        assert events[:2] == ["web shutdown start", "worker shutdown start"]
+        assert events.index("db shutdown start") > events.index("web shutdown end")
+        assert events.index("db shutdown start") > events.index("worker shutdown end")
+        assert events.index("files shutdown") > events.index("web shutdown end")
+        assert events.index("cache shutdown start") > events.index("web shutdown end")
+
+    async def test_it_should_keep_order_through_bases_without_hooks(self, hq: HQ, make_module, events):
+        class Main(Base):
+            dependencies = ["db"]
+
+        make_module("repo", Main)
+
+        class Main(Base):
+            dependencies = ["repo"]
+
+            async def on_shutdown(self):
+                events.append("api shutdown start")
+                await asyncio.sleep(0.05)  # Outlasts web and worker, which db also waits for
+                events.append("api shutdown end")
+
+        make_module("api", Main)
+        hq.load_dependencies(["app", "api"])
+        report = await hq.shutdown()
+        assert "repo" not in report.completed
+        assert events.index("db shutdown start") > events.index("api shutdown end")
+
+    async def test_it_should_report_stragglers(self, hq: HQ, make_module, events, caplog):
+        class Main(Base):
+            async def on_shutdown(self):
+                await asyncio.sleep(10)
+
+        make_module("slow", Main)
+        hq.load_dependencies(["app", "slow"])
+        report = await hq.shutdown(timeout=0.2)
+        assert report.timed_out == ["slow"]
+        assert not report.ok
+        assert "slow did not shut down within 0.2 seconds" in caplog.text
+
+    async def test_it_should_honor_per_base_deadlines(self, hq: HQ, make_module):
+        class Main(Base):
+            shutdown_timeout = 0.01
+
+            async def on_shutdown(self):
+                await asyncio.sleep(10)
+
+        make_module("slow", Main)
+        hq.load_dependencies(["slow"])
+        report = await hq.shutdown(timeout=60)
+        assert report.timed_out == ["slow"]
+
+    async def test_it_should_report_failures_and_carry_on(self, hq: HQ, make_module, events):
+        class Main(Base):
+            dependencies = ["db"]
+
+            async def on_shutdown(self):
+                raise RuntimeError("boom")
+
+        make_module("broken", Main)
+        hq.load_dependencies(["app", "broken"])
+        report = await hq.shutdown()
+        assert list(report.failed) == ["broken"]
+        assert "db" in report.completed
+
+    async def test_it_should_await_background_deliveries_first(self, hq: HQ, events):
+        class FLUSHED(Signal):
+            pass
+
+        async def receiver(msg):
+            await asyncio.sleep(0.01)
+            events.append("delivered")
+
+        hq.connect_signal_receiver(FLUSHED, receiver)
+        FLUSHED.send_sync(value="a", using=hq)
+        await hq.shutdown()
+        assert events[0] == "delivered"
+        assert not hq.background_tasks
+
+    async def test_it_should_abandon_background_deliveries_after_the_timeout(self, hq: HQ, events):
+        class HUNG(Signal):
+            pass
+
+        async def receiver(msg):
+            await asyncio.Event().wait()
+
+        hq.connect_signal_receiver(HUNG, receiver)
+        HUNG.send_sync(value="a", using=hq)
+        report = await asyncio.wait_for(hq.shutdown(timeout=0.05), 1)
+        assert report.abandoned == 1
+        assert not report.ok
+        assert set(report.completed) == {"web", "worker", "db", "cache", "files"}
+        assert not hq.background_tasks
+
+
+class TestSpecialMethodTable:
+    def test_it_should_tabulate_special_methods_at_class_creation(self, fakemodules):
+        import baz
+
+        table = {func.__name__: (signals, mountpoints) for func, signals, mountpoints in baz.Main.__special_methods__}
+        assert table == {
+            "on_baz": (((baz.BAZ, {}),), ()),
+            "do_a_thing": ((), (baz.ThingyMadoodle,)),
+            "do_another_thing": ((), (baz.ThingyMadoodle,)),
+        }
+        assert baz.Main.__special_targets__ == {baz.BAZ, baz.ThingyMadoodle}
+
+    def test_it_should_inherit_special_methods(self, fakemodules):
+        import foo
+
+        class Sub(foo.Main):
+            @staticmethod
+            @Base.responds(foo.FOO)
+            def ignored(msg):  # pragma: nocover
+                pass
+
+        assert [func.__name__ for func, _, _ in Sub.__special_methods__] == ["on_foo"]
+
+    def test_it_should_register_from_the_table(self, fakemodules, config, hq_base: HQ):
+        import foo
+
+        hq = HQ(config=config)
+        base = foo.Main(hq=hq)
+        assert hq.receivers(foo.FOO) == [base.on_foo]
+        hq_base.reset()
@@ -0,0 +1,87 @@
+# ruff: noqa: D100, D101, D102, D103
+import pytest
+
+from convoke.graphs import GRAPH_CACHE_VERSION, DependencyGraph
+
+
+@pytest.fixture
+def graph():
+    # The same shape as tests/fakemodules: foo <-> baz, bar -> baz
+    return DependencyGraph(roots=("foo", "bar"), edges={"foo": ("baz",), "baz": ("foo",), "bar": ("baz",)})
+
+
+def test_it_should_list_nodes_in_discovery_order(graph: DependencyGraph):
+    assert graph.nodes == ("foo", "baz", "bar")
+
+
+def test_it_should_order_dependencies_first(graph: DependencyGraph):
+    assert graph.topological_order() == ("baz", "foo", "bar")
+
+
+def test_it_should_break_cycles_deterministically(graph: DependencyGraph):
+    assert graph.broken_edges() == (("baz", "foo"),)
+
+
+def test_it_should_report_cycles(graph: DependencyGraph):
+    assert graph.cycles() == [("foo", "baz")]
+
+
+def test_it_should_report_self_dependency_as_a_cycle():
+    graph = DependencyGraph(roots=("a",), edges={"a": ("a", "b"), "b": ()})
+    assert graph.cycles() == [("a",)]
+    assert graph.topological_order() == ("b", "a")
+
+
+def test_it_should_report_multiple_cycles_in_discovery_order():
+    graph = DependencyGraph(
+        roots=("a",),
+        edges={"a": ("b", "d"), "b": ("c",), "c": ("b",), "d": ("e",), "e": ("f",), "f": ("d",)},
+    )
+    assert graph.cycles() == [("b", "c"), ("d", "e", "f")]
+    assert graph.topological_order() == ("c", "b", "f", "e", "d", "a")
+
+
+def test_it_should_list_dependents(graph: DependencyGraph):
+    assert graph.dependents("baz") == ("foo", "bar")
+    assert graph.dependents("bar") == ()
+
+
+def test_it_should_update(graph: DependencyGraph):
+    graph.update(["bar", "qux"], {"qux": ["foo"]})
+    assert graph.roots == ("foo", "bar", "qux")
+    assert graph.edges["qux"] == ("foo",)
+
+
+def test_it_should_round_trip_through_a_cache_file(graph: DependencyGraph, tempdir):
+    path = tempdir / "graph.json"
+    graph.dump(path)
+    assert DependencyGraph.load(path) == graph
+
+
+def test_it_should_reject_an_unknown_cache_version(graph: DependencyGraph):
+    data = graph.asdict()
+    data["version"] = 0
+    with pytest.raises(ValueError):
+        DependencyGraph.fromdict(data)
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        [],
+        {"version": GRAPH_CACHE_VERSION},
+        {"version": GRAPH_CACHE_VERSION, "roots": 1, "edges": {}},
+        {"version": GRAPH_CACHE_VERSION, "roots": [], "edges": []},
+    ],
+)
+def test_it_should_reject_a_malformed_cache(data):
+    with pytest.raises(ValueError, match="Malformed"):
+        DependencyGraph.fromdict(data)
+
+
+def test_it_should_list_acyclic_edges(graph: DependencyGraph):
+    assert graph.acyclic_edges() == {"foo": ("baz",), "baz": (), "bar": ("baz",)}
+
+
+def test_it_should_list_reversed_acyclic_edges(graph: DependencyGraph):
+    assert graph.acyclic_edges(reverse=True) == {"foo": (), "baz": ("foo", "bar"), "bar": ()}
@@ -0,0 +1,111 @@
+# ruff: noqa: D100, D101, D102, D103, D106
+import asyncio
+import json
+from functools import partial
+
+import pytest
+
+from convoke import current_hq
+from convoke.bases import HQ
+from convoke.metrics import LatencyHistogram, SignalMetrics, get_name
+from convoke.signals import Signal
+
+
+class PING(Signal):
+    pass
+
+
+def record(received, msg):
+    received.append(msg)
+
+
+async def slow(msg):
+    await asyncio.sleep(0.02)
+
+
+def broken(msg):
+    raise ValueError("broken")
+
+
+@pytest.fixture
+def metrics(config):
+    metrics = SignalMetrics(slow_threshold=0.01)
+    hq = HQ(config=config, metrics=metrics)
+    token = current_hq.set(hq)
+    yield metrics
+    current_hq.reset(token)
+
+
+class TestSignalMetrics:
+    async def test_it_should_count_sends_and_calls(self, metrics: SignalMetrics):
+        received = []
+        PING.connect(partial(record, received))
+        PING.connect(received.append, batch=True)
+
+        await PING.send(value="a")
+        await PING.send_many([PING.Message(value="b"), PING.Message(value="c")])
+
+        signal = metrics.snapshot()["signals"][get_name(PING)]
+        assert signal["sends"] == 2
+        assert signal["messages"] == 3
+        assert signal["latency"]["count"] == 2
+        receivers = signal["receivers"]
+        assert receivers[f"{__name__}.record"]["calls"] == 3
+        assert receivers["list.append"]["calls"] == 2
+
+    async def test_it_should_count_errors(self, metrics: SignalMetrics):
+        PING.connect(broken)
+        await PING.send(value="a")
+        await PING.send(value="b")
+        stats = metrics.receivers[get_name(PING)][f"{__name__}.broken"]
+        assert stats.calls == 2
+        assert stats.errors == 2
+
+    async def test_it_should_warn_about_slow_receivers(self, metrics: SignalMetrics, caplog):
+        PING.connect(slow)
+        await PING.send(value="a")
+        stats = metrics.receivers[get_name(PING)][f"{__name__}.slow"]
+        assert stats.slow == 1
+        assert stats.latency.max >= 0.02
+        assert f"Slow receiver {__name__}.slow took" in caplog.text
+
+    async def test_it_should_snapshot_as_json(self, metrics: SignalMetrics):
+        PING.connect(slow)
+        await PING.send(value="a")
+        snapshot = json.loads(json.dumps(metrics.snapshot()))
+        latency = snapshot["signals"][get_name(PING)]["receivers"][f"{__name__}.slow"]["latency"]
+        assert sum(latency["buckets"].values()) == 1
+        assert latency["buckets"]["le_0.05"] == 1
+
+    async def test_it_should_reset(self, metrics: SignalMetrics):
+        await PING.send(value="a")
+        metrics.reset()
+        assert metrics.snapshot() == {"signals": {}}
+
+    async def test_it_should_not_record_without_metrics(self, config):
+        hq = HQ(config=config)
+        PING.connect(slow, using=hq)
+        await PING.send(value="a", using=hq)
+        assert hq.metrics is None
+
+
+class TestLatencyHistogram:
+    def test_it_should_bucket_latencies(self):
+        histogram = LatencyHistogram(bounds=(0.1, 1.0))
+        assert histogram.mean == 0.0
+        for seconds in (0.05, 0.1, 0.5, 2.0):
+            histogram.record(seconds)
+        assert histogram.buckets == [2, 1, 1]
+        assert histogram.max == 2.0
+        assert histogram.mean == pytest.approx(2.65 / 4)
+        assert histogram.asdict()["buckets"] == {"le_0.1": 2, "le_1": 1, "inf": 1}
+
+
+def test_it_should_name_callables():
+    class Handler:
+        def __call__(self, msg):  # pragma: nocover
+            pass
+
+    handler = Handler()
+    assert get_name(partial(broken, 1)) == f"{__name__}.broken"
+    assert get_name(handler) == repr(handler)
@@ -0,0 +1,181 @@
+# ruff: noqa: D100, D101, D102, D103
+import json
+import sys
+import textwrap
+from importlib.machinery import ModuleSpec
+
+import pytest
+
+from convoke.bases import HQ
+from convoke.profiling import (
+    PHASES,
+    ImportProfiler,
+    StartupProfiler,
+    current_import_profiler,
+    current_profiler,
+)
+
+
+@pytest.fixture
+def profiler(fakemodules, hq_base: HQ, config):
+    profiler = StartupProfiler()
+    hq = HQ(config=config, profiler=profiler)
+    hq.load_dependencies(["foo", "bar"])
+    yield profiler
+    hq_base.reset()
+
+
+def test_it_should_record_the_load_tree(profiler: StartupProfiler):
+    tree = profiler.asdict()["tree"]
+    assert [node["name"] for node in tree] == ["foo", "bar"]
+    assert [node["name"] for node in tree[0]["children"]] == ["baz"]
+    assert tree[1]["children"] == []
+
+
+def test_it_should_record_every_phase(profiler: StartupProfiler):
+    for name in ("foo", "baz", "bar"):
+        node = profiler.nodes[name]
+        assert tuple(node.phases) == PHASES
+        assert all(duration >= 0 for duration in node.phases.values())
+
+
+def test_it_should_total_time_across_the_tree(profiler: StartupProfiler):
+    foo = profiler.nodes["foo"]
+    assert foo.total_time == pytest.approx(foo.self_time + profiler.nodes["baz"].total_time)
+    assert profiler.total_time == pytest.approx(foo.total_time + profiler.nodes["bar"].total_time)
+
+
+def test_it_should_highlight_the_slowest(profiler: StartupProfiler):
+    slowest = profiler.slowest(2)
+    assert len(slowest) == 2
+    assert slowest[0].self_time >= slowest[1].self_time
+
+    report = profiler.report(count=1)
+    assert report.startswith("HQ startup: ")
+    assert f"{slowest[0].name}: " in report
+    assert "<-- slowest #1" in report
+    assert "<-- slowest #2" not in report
+
+
+def test_it_should_serialize_as_json(profiler: StartupProfiler):
+    data = json.loads(json.dumps(profiler.asdict()))
+    assert data["slowest"][0] == profiler.slowest()[0].name
+
+
+def test_it_should_only_profile_during_loading(profiler: StartupProfiler):
+    assert current_profiler.get() is None
+
+
+@pytest.fixture
+def heavymodules(tempdir):
+    modules = {
+        "heavy_dep": """
+            from convoke.bases import Base
+            import heavy_lib
+
+            class Main(Base):
+                dependencies = ["light_dep"]
+        """,
+        "heavy_lib": """
+            import heavy_lib_helper
+
+            BALLAST = [bytes(1000) for _ in range(1000)]
+        """,
+        "heavy_lib_helper": """
+            HELPED = True
+        """,
+        "light_dep": """
+            from convoke.bases import Base
+
+            class Main(Base):
+                pass
+        """,
+    }
+    for name, source in modules.items():
+        (tempdir / f"{name}.py").write_text(textwrap.dedent(source))
+    sys.path.insert(0, str(tempdir))
+    yield
+    sys.path.remove(str(tempdir))
+    for name in modules:
+        sys.modules.pop(name, None)
+
+
+@pytest.fixture
+def import_profiler(heavymodules, hq_base: HQ, config):
+    import_profiler = ImportProfiler(trace_memory=True)
+    hq = HQ(config=config, import_profiler=import_profiler)
+    hq.load_dependencies(["heavy_dep"])
+    yield import_profiler
+    hq_base.reset()
+
+
+class TestImportProfiler:
+    def test_it_should_attribute_imports_to_dependencies(self, import_profiler: ImportProfiler):
+        assert list(import_profiler.dependencies) == ["heavy_dep", "light_dep"]
+        (heavy_dep,) = import_profiler.dependencies["heavy_dep"].children
+        assert heavy_dep.name == "heavy_dep"
+        (heavy_lib,) = heavy_dep.children
+        assert heavy_lib.name == "heavy_lib"
+        assert [child.name for child in heavy_lib.children] == ["heavy_lib_helper"]
+        assert [child.name for child in import_profiler.dependencies["light_dep"].children] == ["light_dep"]
+
+    def test_it_should_record_cumulative_and_self_time(self, import_profiler: ImportProfiler):
+        root = import_profiler.dependencies["heavy_dep"]
+        for node in root.walk():
+            assert node.self_time >= 0
+            assert node.cumulative_time >= sum(child.cumulative_time for child in node.children)
+        assert import_profiler.slowest(1)[0].name in {"heavy_dep", "heavy_lib", "heavy_lib_helper"}
+        assert root not in import_profiler.slowest(10)
+
+    def test_it_should_record_memory(self, import_profiler: ImportProfiler):
+        heavy_lib = import_profiler.dependencies["heavy_dep"].children[0].children[0]
+        assert heavy_lib.self_memory > 1_000_000
+        assert heavy_lib.cumulative_memory >= heavy_lib.self_memory
+
+    def test_it_should_not_record_previously_imported_modules(self, heavymodules, hq_base: HQ, config):
+        import heavy_lib  # noqa: F401
+
+        import_profiler = ImportProfiler()
+        HQ(config=config, import_profiler=import_profiler).load_dependencies(["heavy_dep"])
+        (heavy_dep,) = import_profiler.dependencies["heavy_dep"].children
+        assert heavy_dep.children == []
+        assert heavy_dep.cumulative_memory == 0
+        hq_base.reset()
+
+    def test_it_should_step_aside_afterward(self, import_profiler: ImportProfiler):
+        import heavy_lib
+
+        assert not any(isinstance(finder, type(import_profiler._finder)) for finder in sys.meta_path)
+        assert type(heavy_lib.__loader__).__name__ == "SourceFileLoader"
+        assert heavy_lib.__spec__.loader is heavy_lib.__loader__
+        assert current_import_profiler.get() is None
+
+    def test_it_should_ignore_imports_outside_dependencies(self, heavymodules):
+        import_profiler = ImportProfiler()
+        with import_profiler.tracing(), import_profiler.tracing():
+            import heavy_lib_helper  # noqa: F401
+        assert import_profiler.dependencies == {}
+
+    def test_it_should_pass_through_unusual_specs(self, heavymodules):
+        class LoaderlessFinder:
+            def find_spec(self, fullname, path, target=None):
+                return ModuleSpec(fullname, None) if fullname == "loaderless" else None
+
+        import_profiler = ImportProfiler()
+        finder = LoaderlessFinder()
+        sys.meta_path.append(finder)
+        try:
+            with import_profiler.tracing(), import_profiler.dependency("heavy_dep"):
+                assert import_profiler._finder.find_spec("loaderless", None).loader is None
+                assert import_profiler._finder.find_spec("nonexistent_module", None) is None
+                with pytest.raises(ModuleNotFoundError):
+                    import nonexistent_module  # noqa: F401
+        finally:
+            sys.meta_path.remove(finder)
+
+    def test_it_should_dump_json(self, import_profiler: ImportProfiler, tempdir):
+        import_profiler.dump(tempdir / "imports.json")
+        data = json.loads((tempdir / "imports.json").read_text())
+        assert data["trace_memory"] is True
+        assert [node["name"] for node in data["dependencies"]] == ["heavy_dep", "light_dep"]
+        assert data["dependencies"][0]["children"][0]["children"][0]["name"] == "heavy_lib"
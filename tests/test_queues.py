@@ -0,0 +1,166 @@
+# ruff: noqa: D100, D101, D102, D103, D106
+import asyncio
+from dataclasses import dataclass
+
+import pytest
+
+from convoke import current_hq
+from convoke.bases import HQ
+from convoke.queues import BLOCK, DROP_NEWEST, DROP_OLDEST, SignalQueue
+from convoke.signals import Signal
+
+
+class AUDIT(Signal):
+    @dataclass
+    class Message:
+        n: int
+
+
+def make_hq(config, **kwargs) -> HQ:
+    hq = HQ(config=config, signal_queue=SignalQueue(**kwargs))
+    current_hq.set(hq)
+    return hq
+
+
+@pytest.fixture
+def gate():
+    """Connect a receiver that records messages, but only once the gate is opened."""
+    state = {"received": [], "open": asyncio.Event()}
+
+    async def receiver(msg):
+        await state["open"].wait()
+        state["received"].append(msg.n)
+
+    def connect(hq: HQ):
+        hq.connect_signal_receiver(AUDIT, receiver)
+        return state
+
+    return connect
+
+
+class TestSignalQueue:
+    async def test_it_should_post_without_waiting_for_receivers(self, config, gate):
+        hq = make_hq(config)
+        state = gate(hq)
+        assert await AUDIT.post(n=1) is True
+        assert state["received"] == []
+
+        state["open"].set()
+        await hq.signal_queue.join()
+        assert state["received"] == [1]
+        assert hq.signal_queue.stats.posted == 1
+        assert hq.signal_queue.stats.delivered == 1
+
+    async def test_it_should_block_when_full(self, config, gate):
+        hq = make_hq(config, maxsize=2, overflow=BLOCK)
+        state = gate(hq)
+        for n in range(3):  # The first is taken by the worker; two wait in the queue
+            await AUDIT.post(n=n, using=hq)
+        await asyncio.sleep(0)
+
+        blocked = asyncio.create_task(AUDIT.post(n=3, using=hq))
+        await asyncio.sleep(0.01)
+        assert not blocked.done()
+        assert hq.signal_queue.depth == 2
+
+        state["open"].set()
+        assert await blocked is True
+        await hq.signal_queue.join()
+        assert state["received"] == [0, 1, 2, 3]
+        assert hq.signal_queue.stats.dropped == 0
+
+    @pytest.mark.parametrize(
+        "overflow, accepted, received",
+        [
+            (DROP_OLDEST, True, [0, 2, 3]),
+            (DROP_NEWEST, False, [0, 1, 2]),
+        ],
+    )
+    async def test_it_should_drop_when_full(self, config, gate, overflow, accepted, received):
+        hq = make_hq(config, maxsize=2, overflow=overflow)
+        state = gate(hq)
+        await AUDIT.post(n=0, using=hq)
+        await asyncio.sleep(0)  # The worker takes the first message
+        for n in (1, 2):
+            await AUDIT.post(n=n, using=hq)
+
+        assert await AUDIT.post(n=3, using=hq) is accepted
+        assert hq.signal_queue.stats.dropped == 1
+        assert hq.signal_queue.stats.high_water == 2
+
+        state["open"].set()
+        await hq.signal_queue.join()
+        assert state["received"] == received
+
+    async def test_it_should_keep_working_after_errors(self, config, caplog, monkeypatch):
+        hq = make_hq(config)
+        received = []
+        hq.connect_signal_receiver(AUDIT, lambda msg: received.append(msg.n))
+        original = hq.send_signal
+
+        async def flaky_send(signal_class, msg):
+            if msg.n == 0:
+                raise RuntimeError("oops")
+            await original(signal_class, msg)
+
+        monkeypatch.setattr(hq, "send_signal", flaky_send)
+        await AUDIT.post(n=0)
+        await AUDIT.post(n=1)
+        await hq.signal_queue.join()
+        assert received == [1]
+        assert "Exception occurred while delivering posted" in caplog.text
+
+    async def test_it_should_use_several_workers(self, config, gate):
+        hq = make_hq(config, workers=3)
+        state = gate(hq)
+        for n in range(3):
+            await AUDIT.post(n=n)
+        await asyncio.sleep(0)
+        assert hq.signal_queue.depth == 0
+
+        state["open"].set()
+        await hq.signal_queue.join()
+        assert sorted(state["received"]) == [0, 1, 2]
+
+    async def test_it_should_drain_on_shutdown(self, config, gate):
+        hq = make_hq(config)
+        state = gate(hq)
+        await AUDIT.post(n=1)
+        state["open"].set()
+        await hq.shutdown()
+        assert state["received"] == [1]
+        assert hq.signal_queue.depth == 0
+
+        await AUDIT.post(n=2)  # Workers restart on demand
+        await hq.signal_queue.join()
+        assert state["received"] == [1, 2]
+
+    async def test_it_should_abandon_undelivered_messages_when_shutdown_times_out(self, config, gate):
+        hq = make_hq(config)
+        gate(hq)
+        await AUDIT.post(n=1)
+        await AUDIT.post(n=2)
+        report = await asyncio.wait_for(hq.shutdown(timeout=0.05), 1)
+        assert report.abandoned == 2
+        assert not report.ok
+        assert hq.signal_queue.stats.abandoned == 2
+        assert hq.signal_queue.stats.delivered == 0
+        assert hq.signal_queue.depth == 0
+
+    async def test_it_should_deliver_queued_messages_before_stopping(self, config, gate):
+        hq = make_hq(config)
+        state = gate(hq)
+        await AUDIT.post(n=1)
+        state["open"].set()
+        await hq.signal_queue.stop()
+        assert state["received"] == [1]
+        assert hq.signal_queue.stats.abandoned == 0
+
+    def test_it_should_reject_unknown_policies(self):
+        with pytest.raises(ValueError, match="Unknown overflow policy"):
+            SignalQueue(overflow="explode")
+
+    def test_it_should_have_no_depth_before_starting(self):
+        queue = SignalQueue()
+        assert queue.depth == 0
+        asyncio.run(queue.join())
@@ -0,0 +1,165 @@
+# ruff: noqa: D100, D101, D102, D103, D106
+import asyncio
+from dataclasses import dataclass
+
+import pytest
+
+from convoke.bases import HQ
+from convoke.metrics import SignalMetrics, get_name
+from convoke.rates import Coalesce, Debounce, Throttle
+from convoke.signals import Signal
+
+
+class TOUCHED(Signal):
+    rate_policy = Debounce(wait=0.02)
+
+
+class TICK(Signal):
+    rate_policy = Throttle(limit=2, interval=0.05)
+
+
+class DIRTIED(Signal):
+    rate_policy = Coalesce(key="key")
+
+    @dataclass
+    class Message:
+        key: str
+        count: int = 1
+
+
+class COUNTED(DIRTIED):
+    rate_policy = Coalesce(key="key", wait=0.02, merge=lambda held, new: DIRTIED.Message(held.key, held.count + new.count))
+
+
+@pytest.fixture
+def received(hq: HQ):
+    """Record the batches of messages each rate-limited Signal delivers."""
+    received = []
+    for signal_class in (TOUCHED, TICK, DIRTIED, COUNTED):
+        hq.connect_signal_receiver(signal_class, received.append, batch=True)
+    return received
+
+
+def values(received) -> list[list]:
+    return [[getattr(msg, "value", None) or getattr(msg, "key") for msg in batch] for batch in received]
+
+
+class TestDebounce:
+    async def test_it_should_deliver_the_last_message_of_a_burst(self, hq: HQ, received):
+        for value in "abc":
+            await TOUCHED.send(value=value)
+            await asyncio.sleep(0.005)
+        assert received == []
+
+        await asyncio.sleep(0.04)
+        assert values(received) == [["c"]]
+        assert hq.rate_limiters[TOUCHED].held == 2
+
+    async def test_it_should_deliver_again_after_a_quiet_period(self, received):
+        await TOUCHED.send(value="a")
+        await asyncio.sleep(0.04)
+        await TOUCHED.send_many([TOUCHED.Message(value="b"), TOUCHED.Message(value="c")])
+        await asyncio.sleep(0.04)
+        assert values(received) == [["a"], ["c"]]
+
+    async def test_it_should_debounce_sync_sends(self, received):
+        for value in "ab":
+            TOUCHED.send_sync(value=value)
+        await asyncio.sleep(0.04)
+        assert values(received) == [["b"]]
+
+
+class TestThrottle:
+    async def test_it_should_deliver_up_to_the_limit_at_once(self, received):
+        for value in "ab":
+            await TICK.send(value=value)
+        await asyncio.sleep(0)
+        assert values(received) == [["a"], ["b"]]
+
+    async def test_it_should_deliver_the_latest_excess_message_next_interval(self, hq: HQ, received):
+        await TICK.send_many([TICK.Message(value=value) for value in "abc"])
+        await TICK.send(value="d")
+        await TICK.send(value="e")
+        await asyncio.sleep(0)
+        assert values(received) == [["a", "b"]]
+
+        await asyncio.sleep(0.07)
+        assert values(received) == [["a", "b"], ["e"]]
+        assert hq.rate_limiters[TICK].held == 2
+
+        # The held message counts toward the interval it was delivered in.
+        await TICK.send_many([TICK.Message(value=value) for value in "fg"])
+        await asyncio.sleep(0)
+        assert values(received) == [["a", "b"], ["e"], ["f"]]
+
+    async def test_it_should_start_a_new_interval(self, received):
+        await TICK.send_many([TICK.Message(value=value) for value in "ab"])
+        await asyncio.sleep(0.06)
+        await TICK.send_many([TICK.Message(value=value) for value in "cd"])
+        await asyncio.sleep(0)
+        assert values(received) == [["a", "b"], ["c", "d"]]
+
+
+class TestCoalesce:
+    async def test_it_should_deliver_one_message_per_key(self, hq: HQ, received):
+        for key in ["x", "y", "x", "x", "z"]:
+            await DIRTIED.send(key=key)
+        assert received == []
+
+        await asyncio.sleep(0.01)
+        assert values(received) == [["x", "y", "z"]]
+        assert hq.rate_limiters[DIRTIED].held == 2
+
+    async def test_it_should_merge_messages(self, received):
+        await COUNTED.send_many([COUNTED.Message(key=key) for key in "xyx"])
+        await COUNTED.send(key="x")
+        await asyncio.sleep(0.04)
+        assert [(msg.key, msg.count) for msg in received[0]] == [("x", 3), ("y", 1)]
+
+
+class TestRateLimiters:
+    async def test_it_should_flush_held_messages_on_shutdown(self, hq: HQ, received):
+        await TOUCHED.send(value="a")
+        await DIRTIED.send(key="x")
+        await hq.shutdown()
+        assert values(received) == [["a"], ["x"]]
+
+    async def test_it_should_abandon_held_messages_when_shutdown_times_out(self, hq: HQ):
+        async def hang(msgs):
+            await asyncio.Event().wait()
+
+        hq.connect_signal_receiver(TOUCHED, hang, batch=True)
+        await TOUCHED.send(value="a")
+        report = await asyncio.wait_for(hq.shutdown(timeout=0.05), 1)
+        assert report.abandoned == 1
+        assert not report.ok
+
+    async def test_it_should_deliver_posted_messages_on_shutdown(self, hq: HQ, received):
+        await TOUCHED.post(value="a")
+        await hq.shutdown()
+        assert values(received) == [["a"]]
+
+    async def test_it_should_limit_sync_sends_from_other_threads(self, hq: HQ, received):
+        hq.loop = asyncio.get_running_loop()
+        for value in "ab":
+            await asyncio.to_thread(TOUCHED.send_sync, value=value, using=hq)
+        await asyncio.sleep(0.04)
+        assert values(received) == [["b"]]
+
+    async def test_it_should_record_metrics_for_delivered_messages(self, config):
+        metrics = SignalMetrics()
+        hq = HQ(config=config, metrics=metrics)
+        hq.connect_signal_receiver(DIRTIED, lambda msg: None)
+        await DIRTIED.send_many([DIRTIED.Message(key="x")] * 3, using=hq)
+        await hq.shutdown()
+        stats = metrics.snapshot()["signals"][get_name(DIRTIED)]
+        assert (stats["sends"], stats["messages"]) == (1, 1)
+
+    async def test_it_should_keep_limiters_per_event_loop(self, hq: HQ, received):
+        other = asyncio.new_event_loop()
+        stale = hq.rate_limiters[TOUCHED] = TOUCHED.rate_policy.limiter(received.append, other)
+        other.close()
+
+        await TOUCHED.send(value="a")
+        assert hq.rate_limiters[TOUCHED] is not stale
+        assert hq.rate_limiters[TOUCHED].loop is asyncio.get_running_loop()
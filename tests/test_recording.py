@@ -0,0 +1,138 @@
+# ruff: noqa: D100, D101, D102, D103, D106
+import asyncio
+import json
+from dataclasses import dataclass
+
+import pytest
+
+from convoke import current_hq
+from convoke.bases import HQ
+from convoke.recording import RecordedSignal, SignalRecorder, replay
+from convoke.signals import Signal
+
+
+class DIRTY(Signal):
+    @dataclass
+    class Message:
+        key: str
+
+
+class TOUCHED(Signal):
+    pass
+
+
+@pytest.fixture
+def recorder(config):
+    recorder = SignalRecorder()
+    hq = HQ(config=config, recorder=recorder)
+    token = current_hq.set(hq)
+    yield recorder
+    current_hq.reset(token)
+
+
+class TestSignalRecorder:
+    async def test_it_should_record_every_send(self, recorder: SignalRecorder):
+        await DIRTY.send(key="a")
+        DIRTY.send_sync(key="b")
+        await TOUCHED.send_many([TOUCHED.Message(value="c"), TOUCHED.Message(value="d")])
+
+        assert [(record.signal_class, record.msg, record.many) for record in recorder.records] == [
+            (DIRTY, DIRTY.Message(key="a"), False),
+            (DIRTY, DIRTY.Message(key="b"), False),
+            (TOUCHED, (TOUCHED.Message(value="c"), TOUCHED.Message(value="d")), True),
+        ]
+        timestamps = [record.timestamp for record in recorder.records]
+        assert timestamps[0] == 0.0
+        assert timestamps == sorted(timestamps)
+
+    async def test_it_should_not_record_local_sends(self, recorder: SignalRecorder):
+        await current_hq.get().send_signal_many(DIRTY, [DIRTY.Message(key="a")], local=True)
+        assert recorder.records == []
+
+    async def test_it_should_stop_at_the_limit(self, recorder: SignalRecorder):
+        recorder.limit = 2
+        for key in "abc":
+            await DIRTY.send(key=key)
+        assert [record.msg.key for record in recorder.records] == ["a", "b"]
+        assert recorder.skipped == 1
+
+    @pytest.mark.parametrize("name", ["signals.jsonl", "signals.jsonl.gz"])
+    async def test_it_should_dump_and_load(self, recorder: SignalRecorder, tempdir, name):
+        await DIRTY.send(key="a")
+        await TOUCHED.send(value="b")
+        await DIRTY.send(key="c")
+        await DIRTY.send_many([DIRTY.Message(key="d"), DIRTY.Message(key="e")])
+        recorder.dump(tempdir / name)
+
+        loaded = SignalRecorder.load(tempdir / name)
+        assert [(record.signal_class, record.msg, record.many) for record in loaded.records] == [
+            (DIRTY, DIRTY.Message(key="a"), False),
+            (TOUCHED, TOUCHED.Message(value="b"), False),
+            (DIRTY, DIRTY.Message(key="c"), False),
+            (DIRTY, (DIRTY.Message(key="d"), DIRTY.Message(key="e")), True),
+        ]
+        assert loaded.records[1].timestamp == pytest.approx(recorder.records[1].timestamp, abs=1e-6)
+
+    def test_it_should_write_one_message_per_line(self, tempdir):
+        recorder = SignalRecorder(records=[RecordedSignal(DIRTY, DIRTY.Message(key="a"), 0.5)])
+        recorder.dump(tempdir / "signals.jsonl")
+        line = json.loads((tempdir / "signals.jsonl").read_text())
+        assert line == [0.5, f"{__name__}:DIRTY", {"key": "a"}]
+
+    def test_it_should_refuse_to_load_other_things(self, tempdir):
+        (tempdir / "signals.jsonl").write_text(json.dumps([0, f"{__name__}:recorder", {}]) + "\n")
+        with pytest.raises(ValueError, match="Not a Signal subclass"):
+            SignalRecorder.load(tempdir / "signals.jsonl")
+
+
+class TestReplay:
+    def make_records(self, count: int, interval: float) -> list[RecordedSignal]:
+        return [RecordedSignal(DIRTY, DIRTY.Message(key=str(n)), n * interval) for n in range(count)]
+
+    async def test_it_should_send_each_message(self, hq: HQ):
+        received = []
+        DIRTY.connect(received.append)
+        report = await replay(self.make_records(3, 0.0), speed=None)
+        assert [msg.key for msg in received] == ["0", "1", "2"]
+        assert report.messages == report.latency.count == 3
+        assert report.throughput > 0
+
+    async def test_it_should_send_many_messages_at_once(self, hq: HQ):
+        batches = []
+        DIRTY.connect(batches.append, batch=True)
+        msgs = (DIRTY.Message(key="a"), DIRTY.Message(key="b"))
+        report = await replay([RecordedSignal(DIRTY, msgs, 0.0, many=True)], speed=None)
+        assert batches == [list(msgs)]
+        assert report.messages == 2
+        assert report.latency.count == 1
+
+    async def test_it_should_keep_the_original_schedule(self, hq: HQ):
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        await replay(self.make_records(3, 0.05), hq)
+        assert loop.time() - start >= 0.1
+
+    async def test_it_should_speed_up(self, hq: HQ):
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        report = await replay(self.make_records(3, 0.05), hq, speed=10)
+        assert loop.time() - start < 0.1
+        assert report.elapsed >= 0.01
+
+    async def test_it_should_report_lag(self, hq: HQ):
+        async def slow(msg):
+            await asyncio.sleep(0.05)
+
+        DIRTY.connect(slow)
+        report = await replay(self.make_records(3, 0.01), hq)
+        assert report.lag >= 0.05
+        assert report.latency.max >= 0.05
+
+    async def test_it_should_replay_nothing(self, hq: HQ):
+        report = await replay([], hq)
+        assert report.asdict()["messages"] == 0
+        assert report.asdict()["throughput"] == 0.0
+
+    async def test_it_should_refuse_bad_speeds(self, hq: HQ):
+        with pytest.raises(ValueError, match="must be positive"):
+            await replay([], hq, speed=0)
@@ -1,13 +1,26 @@
 # ruff: noqa: D100, D101, D102, D103, D106
 import asyncio
+import gc
+import os
+import threading
+import time
+import weakref
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from dataclasses import dataclass, field
+from functools import partial
+from pathlib import Path
 from unittest.mock import Mock
 
 import pytest
 
 from convoke import current_hq
-from convoke.bases import HQ
-from convoke.signals import Signal
+from convoke.bases import HQ, Base
+from convoke.metrics import SignalMetrics, get_name
+from convoke.signals import Signal, resolve_signal, signal_name
+
+
+def broken_receiver(msg):
+    raise ValueError("broken")
 
 
 class MY_SIGNAL(Signal):
@@ -19,13 +32,8 @@ class MY_SIGNAL(Signal):
 
 
 @pytest.fixture(autouse=True)
-def hq(config):
-    """Simple HQ, no dependencies."""
-    hq = HQ(config=config)
-    token = current_hq.set(hq)
-    yield hq
-    current_hq.reset(token)
-    del hq
+def autouse_hq(hq):
+    yield
 
 
 async def test_it_should_broadcast_a_message_to_an_async_handler():
@@ -100,3 +108,804 @@ async def test_it_should_connect_and_disconnect_using(hq: HQ):
 
     mock1.assert_not_called()
     mock2.assert_called_once_with(MY_SIGNAL.Message(zoom=5))
+
+
+class CONCURRENT_SIGNAL(Signal):
+    concurrent = True
+
+    @dataclass
+    class Message:
+        zoom: int = field(default=10)
+
+
+class LIMITED_SIGNAL(CONCURRENT_SIGNAL):
+    max_concurrency = 2
+
+
+class TestConcurrentSend:
+    @pytest.fixture
+    def tracker(self):
+        """Connect slow receivers that track how many of them are running at once."""
+        state = {"running": 0, "peak": 0, "received": []}
+
+        def connect(signal, count=4, delay=0.02):
+            for i in range(count):
+
+                async def handler(msg, i=i):
+                    state["running"] += 1
+                    state["peak"] = max(state["peak"], state["running"])
+                    await asyncio.sleep(delay)
+                    state["running"] -= 1
+                    state["received"].append(i)
+
+                signal.connect(handler)
+            return state
+
+        return connect
+
+    async def test_it_should_send_sequentially_by_default(self, tracker):
+        state = tracker(MY_SIGNAL)
+        await MY_SIGNAL.send(zoom=1)
+        assert state["peak"] == 1
+        assert sorted(state["received"]) == [0, 1, 2, 3]
+
+    async def test_it_should_run_async_receivers_concurrently(self, tracker):
+        state = tracker(CONCURRENT_SIGNAL, delay=0.1)
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        await CONCURRENT_SIGNAL.send(zoom=1)
+        assert loop.time() - start < 0.3
+        assert state["peak"] == 4
+        assert sorted(state["received"]) == [0, 1, 2, 3]
+
+    async def test_it_should_limit_concurrency(self, tracker):
+        state = tracker(LIMITED_SIGNAL)
+        await LIMITED_SIGNAL.send(zoom=1)
+        assert state["peak"] == 2
+        assert sorted(state["received"]) == [0, 1, 2, 3]
+
+    async def test_it_should_choose_the_mode_per_send(self, tracker):
+        state = tracker(MY_SIGNAL)
+        await MY_SIGNAL.send(zoom=1, concurrent=True, max_concurrency=3)
+        assert state["peak"] == 3
+
+        state["peak"] = 0
+        await CONCURRENT_SIGNAL.send(zoom=1, concurrent=False)
+        assert state["peak"] == 0
+
+    async def test_it_should_call_sync_receivers_too(self):
+        mock = Mock()
+        CONCURRENT_SIGNAL.connect(mock)
+        await CONCURRENT_SIGNAL.send(zoom=5)
+        mock.assert_called_once_with(CONCURRENT_SIGNAL.Message(zoom=5))
+
+    @pytest.mark.parametrize("concurrent", [False, True])
+    async def test_it_should_isolate_receiver_errors(self, concurrent, caplog):
+        mock = Mock()
+
+        async def broken_async(msg):
+            raise ValueError("async")
+
+        def broken_sync(msg):
+            raise ValueError("sync")
+
+        async def handler(msg):
+            mock(msg)
+
+        for receiver in (broken_async, broken_sync, handler):
+            MY_SIGNAL.connect(receiver)
+
+        await MY_SIGNAL.send(zoom=5, concurrent=concurrent)
+
+        mock.assert_called_once_with(MY_SIGNAL.Message(zoom=5))
+        errors = [record for record in caplog.records if record.exc_info]
+        assert sorted(str(record.exc_info[1]) for record in errors) == ["async", "sync"]
+
+
+class TestDispatchTable:
+    async def test_it_should_classify_receivers_once(self, hq: HQ):
+        async def handler(msg):
+            pass
+
+        MY_SIGNAL.connect(handler)
+        (connection,) = hq.dispatch_tables[MY_SIGNAL]
+        assert connection.receiver is handler
+        assert connection.is_async is True
+
+    async def test_it_should_not_connect_a_receiver_twice(self, hq: HQ):
+        mock = Mock()
+        MY_SIGNAL.connect(mock)
+        table = hq.dispatch_tables[MY_SIGNAL]
+        MY_SIGNAL.connect(mock)
+        assert hq.dispatch_tables[MY_SIGNAL] is table
+
+        await MY_SIGNAL.send(zoom=5)
+        mock.assert_called_once_with(MY_SIGNAL.Message(zoom=5))
+
+    async def test_it_should_call_receivers_in_connection_order(self):
+        received = []
+        receivers = [lambda msg, i=i: received.append(i) for i in range(5)]
+        for receiver in receivers:
+            MY_SIGNAL.connect(receiver)
+        MY_SIGNAL.disconnect(receivers[2])
+        MY_SIGNAL.disconnect(receivers[2])
+
+        await MY_SIGNAL.send(zoom=5)
+        assert received == [0, 1, 3, 4]
+
+    async def test_it_should_tolerate_receivers_changing_mid_send(self):
+        received = []
+
+        def late(msg):
+            received.append("late")
+
+        def connecting(msg):
+            received.append("connecting")
+            MY_SIGNAL.connect(late)
+            MY_SIGNAL.disconnect(connecting)
+
+        MY_SIGNAL.connect(connecting)
+        await MY_SIGNAL.send(zoom=5)
+        assert received == ["connecting"]
+
+        await MY_SIGNAL.send(zoom=5)
+        assert received == ["connecting", "late"]
+
+
+class TestSendMany:
+    @pytest.fixture
+    def received(self):
+        received = {"batch": [], "single": []}
+
+        async def batch_receiver(msgs):
+            received["batch"].append([msg.zoom for msg in msgs])
+
+        def single_receiver(msg):
+            received["single"].append(msg.zoom)
+
+        MY_SIGNAL.connect(batch_receiver, batch=True)
+        MY_SIGNAL.connect(single_receiver)
+        return received
+
+    async def test_it_should_deliver_batches(self, received):
+        await MY_SIGNAL.send_many(MY_SIGNAL.Message(zoom=zoom) for zoom in range(3))
+        assert received == {"batch": [[0, 1, 2]], "single": [0, 1, 2]}
+
+    async def test_it_should_deliver_single_sends_as_batches_of_one(self, received):
+        await MY_SIGNAL.send(zoom=7)
+        assert received == {"batch": [[7]], "single": [7]}
+
+    async def test_it_should_send_batches_concurrently(self, received):
+        await MY_SIGNAL.send_many([MY_SIGNAL.Message(zoom=1), MY_SIGNAL.Message(zoom=2)], concurrent=True)
+        assert received == {"batch": [[1, 2]], "single": [1, 2]}
+
+    async def test_it_should_ignore_an_empty_batch(self, received, hq: HQ):
+        await MY_SIGNAL.send_many([], using=hq)
+        assert received == {"batch": [], "single": []}
+
+    async def test_it_should_change_options_on_reconnecting(self, hq: HQ):
+        received = []
+        MY_SIGNAL.connect(received.append)
+        MY_SIGNAL.connect(received.append, batch=True)
+        assert [connection.batch for connection in hq.dispatch_tables[MY_SIGNAL]] == [True]
+
+        await MY_SIGNAL.send(zoom=1)
+        assert received == [[MY_SIGNAL.Message(zoom=1)]]
+
+    async def test_it_should_connect_batch_responders(self, hq: HQ):
+        class Main(Base):
+            received: list = Base.field(default_factory=list)
+
+            @Base.responds(MY_SIGNAL, batch=True)
+            def on_many(self, msgs):
+                self.received.append(len(msgs))
+
+        base = Main(hq=hq)
+        await MY_SIGNAL.send_many([MY_SIGNAL.Message(), MY_SIGNAL.Message()])
+        assert base.received == [2]
+
+
+class FILE_SIGNAL(Signal):
+    @dataclass
+    class Message:
+        path: str
+
+
+def write_pid(msg):
+    Path(msg.path).write_text(str(os.getpid()))
+
+
+class TestExecutorReceivers:
+    async def test_it_should_not_block_the_event_loop(self):
+        ticks = []
+        threads = []
+
+        def blocking(msg):
+            time.sleep(0.1)
+            threads.append(threading.current_thread())
+
+        async def tick():
+            for _ in range(5):
+                ticks.append(len(threads))
+                await asyncio.sleep(0.01)
+
+        MY_SIGNAL.connect(blocking, executor=True)
+        await asyncio.gather(MY_SIGNAL.send(zoom=1), tick())
+        assert ticks == [0, 0, 0, 0, 0]
+        assert threads[0] is not threading.main_thread()
+
+    async def test_it_should_run_offloaded_receivers_concurrently(self):
+        barrier = threading.Barrier(2, timeout=5)
+        passed = []
+
+        def blocking(msg):
+            passed.append(barrier.wait())  # Only passes if both receivers run at once.
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            MY_SIGNAL.connect(blocking, executor=executor)
+            MY_SIGNAL.connect(lambda msg: blocking(msg), executor=executor)
+            await MY_SIGNAL.send(zoom=1, concurrent=True)
+        assert sorted(passed) == [0, 1]
+
+    async def test_it_should_share_context_with_threads(self, hq: HQ):
+        seen = []
+        MY_SIGNAL.connect(lambda msg: seen.append(current_hq.get()), executor=True)
+        await MY_SIGNAL.send(zoom=1)
+        assert seen == [hq]
+
+    async def test_it_should_run_in_a_process_pool(self, tempdir):
+        with ProcessPoolExecutor(max_workers=1) as executor:
+            FILE_SIGNAL.connect(write_pid, executor=executor)
+            await FILE_SIGNAL.send(path=str(tempdir / "pid"))
+        assert int((tempdir / "pid").read_text()) != os.getpid()
+
+    def test_it_should_refuse_async_receivers(self):
+        async def handler(msg):  # pragma: nocover
+            pass
+
+        with pytest.raises(TypeError, match="Only sync receivers"):
+            MY_SIGNAL.connect(handler, executor=True)
+
+    def test_it_should_refuse_to_run_responders_in_a_process_pool(self, hq: HQ):
+        class Main(Base):
+            @Base.responds(MY_SIGNAL, executor=ProcessPoolExecutor(max_workers=1))
+            def on_signal(self, msg):  # pragma: nocover
+                pass
+
+        with pytest.raises(TypeError, match="Base methods can't run in a process pool"):
+            Main(hq=hq)
+
+    async def test_it_should_offload_responders(self, hq: HQ):
+        class Main(Base):
+            threads: list = Base.field(default_factory=list)
+
+            @Base.responds(MY_SIGNAL, executor=True)
+            def on_signal(self, msg):
+                self.threads.append(threading.current_thread())
+
+        base = Main(hq=hq)
+        await MY_SIGNAL.send()
+        assert base.threads[0] is not threading.main_thread()
+
+
+class AUDIT(Signal):
+    hierarchical = True
+
+
+class LOGIN(AUDIT):
+    pass
+
+
+class ADMIN_LOGIN(LOGIN):
+    pass
+
+
+class TestHierarchicalDispatch:
+    async def test_it_should_deliver_subclass_messages_to_ancestor_receivers(self):
+        received = []
+        AUDIT.connect(lambda msg: received.append(("audit", msg.value)))
+        LOGIN.connect(lambda msg: received.append(("login", msg.value)))
+
+        await ADMIN_LOGIN.send(value="root")
+        await LOGIN.send(value="alice")
+        await AUDIT.send(value="event")
+        assert received == [
+            ("login", "root"),
+            ("audit", "root"),
+            ("login", "alice"),
+            ("audit", "alice"),
+            ("audit", "event"),
+        ]
+
+    async def test_it_should_only_dispatch_up_from_hierarchical_signals(self):
+        mock = Mock()
+        MY_SIGNAL.connect(mock)
+
+        class MY_SUBSIGNAL(MY_SIGNAL):
+            pass
+
+        await MY_SUBSIGNAL.send()
+        mock.assert_not_called()
+        assert MY_SUBSIGNAL.dispatch_classes() == (MY_SUBSIGNAL,)
+        assert ADMIN_LOGIN.dispatch_classes() == (ADMIN_LOGIN, LOGIN, AUDIT)
+
+    async def test_it_should_deliver_once_to_receivers_of_several_classes(self):
+        mock = Mock()
+        AUDIT.connect(mock)
+        LOGIN.connect(mock)
+        await LOGIN.send(value="alice")
+        mock.assert_called_once_with(LOGIN.Message(value="alice"))
+
+    async def test_it_should_invalidate_cached_tables(self, hq: HQ):
+        received = []
+        await LOGIN.send(value="before")
+        assert hq.dispatch_tables[LOGIN] == ()
+
+        AUDIT.connect(received.append)
+        assert LOGIN not in hq.dispatch_tables
+        await LOGIN.send(value="after")
+        assert received == [LOGIN.Message(value="after")]
+
+        AUDIT.disconnect(received.append)
+        await LOGIN.send(value="gone")
+        assert received == [LOGIN.Message(value="after")]
+
+
+class TestWeakReceivers:
+    class Handler:
+        def __init__(self):
+            self.received = []
+
+        def on_signal(self, msg):
+            self.received.append(msg)
+
+    async def test_it_should_not_keep_bound_method_owners_alive(self, hq: HQ):
+        handler = self.Handler()
+        MY_SIGNAL.connect(handler.on_signal, weak=True)
+        await MY_SIGNAL.send(zoom=1)
+        assert handler.received == [MY_SIGNAL.Message(zoom=1)]
+
+        owner = weakref.ref(handler)
+        del handler
+        gc.collect()
+        assert owner() is None
+
+    async def test_it_should_discard_dead_receivers_on_dispatch(self, hq: HQ):
+        mock = Mock()
+
+        def receiver(msg):  # pragma: nocover
+            mock(msg)
+
+        kept = Mock()
+        CONCURRENT_SIGNAL.connect(Mock())
+        MY_SIGNAL.connect(receiver, weak=True)
+        MY_SIGNAL.connect(kept, weak=True)
+        del receiver
+        gc.collect()
+
+        await MY_SIGNAL.send(zoom=1)
+        mock.assert_not_called()
+        kept.assert_called_once_with(MY_SIGNAL.Message(zoom=1))
+        assert hq.receivers(MY_SIGNAL) == [kept]
+        assert [connection.resolve() for connection in hq.dispatch_tables[MY_SIGNAL]] == [kept]
+
+    def test_it_should_list_live_receivers(self, hq: HQ):
+        handler, other = self.Handler(), self.Handler()
+        MY_SIGNAL.connect(handler.on_signal)
+        MY_SIGNAL.connect(other.on_signal, weak=True)
+        del other
+        gc.collect()
+        assert hq.receivers(MY_SIGNAL) == [handler.on_signal]
+        assert handler.on_signal in hq.receivers(MY_SIGNAL)
+        assert hq.receivers(CONCURRENT_SIGNAL) == []
+
+    async def test_it_should_keep_strong_receivers_alive(self, hq: HQ):
+        handler = self.Handler()
+        MY_SIGNAL.connect(handler.on_signal)
+        owner = weakref.ref(handler)
+        del handler
+        gc.collect()
+        await MY_SIGNAL.send(zoom=1)
+        assert owner().received == [MY_SIGNAL.Message(zoom=1)]
+
+    async def test_it_should_disconnect_weak_receivers(self, hq: HQ):
+        handler = self.Handler()
+        MY_SIGNAL.connect(handler.on_signal, weak=True)
+        MY_SIGNAL.disconnect(handler.on_signal)
+        await MY_SIGNAL.send(zoom=1)
+        assert handler.received == []
+        assert hq.dispatch_tables[MY_SIGNAL] == ()
+
+    def test_it_should_connect_weak_responders(self, hq: HQ):
+        class Main(Base):
+            @Base.responds(MY_SIGNAL, weak=True)
+            def on_signal(self, msg):  # pragma: nocover
+                pass
+
+        base = Main(hq=hq)
+        (connection,) = hq.dispatch_tables[MY_SIGNAL]
+        assert connection.weak is True
+        assert connection.resolve() == base.on_signal
+
+
+class EXPENSIVE_SIGNAL(Signal):
+    @dataclass(slots=True)
+    class Message:
+        value: str
+
+        def __post_init__(self):
+            raise AssertionError("The message should not be constructed")
+
+
+class TestNoReceivers:
+    async def test_it_should_not_construct_unheard_messages(self, hq: HQ):
+        await EXPENSIVE_SIGNAL.send(value="a")
+        assert EXPENSIVE_SIGNAL not in hq.signal_receivers
+
+    async def test_it_should_not_record_disconnections_of_unconnected_signals(self, hq: HQ):
+        EXPENSIVE_SIGNAL.disconnect(print)
+        assert EXPENSIVE_SIGNAL not in hq.signal_receivers
+
+    async def test_it_should_know_when_sends_matter(self, hq: HQ, config):
+        assert hq.has_receivers(MY_SIGNAL) is False
+        MY_SIGNAL.connect(Mock())
+        assert hq.has_receivers(MY_SIGNAL) is True
+
+        measured = HQ(config=config, metrics=SignalMetrics())
+        assert measured.has_receivers(MY_SIGNAL) is True
+
+        lazy = HQ(config=config, lazy=True)
+        lazy.bases.pending["somewhere"] = None
+        assert lazy.has_receivers(MY_SIGNAL) is True
+
+    async def test_it_should_send_directly_to_an_unseen_signal(self, hq: HQ):
+        await hq.send_signal(MY_SIGNAL, MY_SIGNAL.Message())
+        assert hq.dispatch_tables[MY_SIGNAL] == ()
+
+    def test_it_should_use_slotted_default_messages(self):
+        assert not hasattr(Signal.Message(value="a"), "__dict__")
+
+
+@pytest.fixture
+def loop_thread():
+    """Run an event loop in another thread."""
+    loop = asyncio.new_event_loop()
+    thread = threading.Thread(target=loop.run_forever)
+    thread.start()
+    yield loop
+    loop.call_soon_threadsafe(loop.stop)
+    thread.join()
+    loop.close()
+
+
+def wait_for_loop(loop: asyncio.AbstractEventLoop):
+    """Wait until a loop running in another thread has run the callbacks scheduled so far."""
+    done = threading.Event()
+    loop.call_soon_threadsafe(done.set)
+    assert done.wait(timeout=5)
+
+
+class TestSendSync:
+    def test_it_should_call_sync_receivers(self, hq: HQ, caplog):
+        received = []
+        MY_SIGNAL.connect(received.append)
+        MY_SIGNAL.connect(lambda msgs: received.append(len(msgs)), batch=True)
+        MY_SIGNAL.connect(broken_receiver)
+
+        MY_SIGNAL.send_sync(zoom=3)
+        assert received == [MY_SIGNAL.Message(zoom=3), 1]
+        assert "Exception occurred while sending" in caplog.text
+
+    def test_it_should_discard_dead_weak_receivers(self, hq: HQ):
+        def receiver(msg):  # pragma: nocover
+            pass
+
+        MY_SIGNAL.connect(receiver, weak=True)
+        del receiver
+        gc.collect()
+        MY_SIGNAL.send_sync(zoom=3)
+        assert hq.dispatch_tables[MY_SIGNAL] == ()
+
+    def test_it_should_skip_unheard_signals(self):
+        EXPENSIVE_SIGNAL.send_sync(value="a")
+
+    def test_it_should_build_the_dispatch_table_when_sent_directly(self, hq: HQ):
+        receiver = Mock()
+        MY_SIGNAL.connect(receiver)
+        hq.dispatch_tables.clear()
+        hq.bases.pending["not.yet.imported"] = None
+        hq.send_signal_sync(MY_SIGNAL, MY_SIGNAL.Message(zoom=3))
+        receiver.assert_called_once_with(MY_SIGNAL.Message(zoom=3))
+
+    def test_it_should_refuse_async_receivers_without_a_loop(self):
+        async def receiver(msg):  # pragma: nocover
+            pass
+
+        MY_SIGNAL.connect(receiver)
+        with pytest.raises(RuntimeError, match="need an event loop"):
+            MY_SIGNAL.send_sync(zoom=3)
+
+    def test_it_should_schedule_async_receivers_on_the_hq_loop(self, hq: HQ, loop_thread):
+        done = threading.Event()
+        loops = []
+
+        async def receiver(msg):
+            loops.append(asyncio.get_running_loop())
+            done.set()
+
+        MY_SIGNAL.connect(receiver)
+        hq.loop = loop_thread
+        MY_SIGNAL.send_sync(zoom=3)
+        assert done.wait(timeout=5)
+        assert loops == [loop_thread]
+
+    def test_it_should_leave_changes_to_the_hq_loop(self, config, loop_thread):
+        metrics = SignalMetrics()
+        hq = HQ(config=config, metrics=metrics, loop=loop_thread)
+        threads = []
+        MY_SIGNAL.connect(lambda msg: threads.append(threading.current_thread()), using=hq)
+
+        def dead_receiver(msg):  # pragma: nocover
+            pass
+
+        MY_SIGNAL.connect(dead_receiver, using=hq, weak=True)
+        del dead_receiver
+        gc.collect()
+        MY_SIGNAL.send_sync(zoom=3, using=hq)
+        assert threads == [threading.current_thread()]
+        wait_for_loop(loop_thread)
+        assert len(hq.dispatch_tables[MY_SIGNAL]) == 1
+        assert metrics.snapshot()["signals"][get_name(MY_SIGNAL)]["sends"] == 1
+
+    def test_it_should_leave_building_the_dispatch_table_to_the_hq_loop(self, hq: HQ, loop_thread):
+        threads = []
+        MY_SIGNAL.connect(lambda msg: threads.append(threading.current_thread()))
+        hq.dispatch_tables.clear()
+        hq.loop = loop_thread
+        MY_SIGNAL.send_sync(zoom=3)
+        wait_for_loop(loop_thread)
+        assert len(threads) == 1
+        assert threads[0] is not threading.current_thread()
+        assert MY_SIGNAL in hq.dispatch_tables
+
+    async def test_it_should_schedule_async_receivers_on_the_running_loop(self, hq: HQ):
+        received = []
+
+        async def receiver(msg):
+            received.append(msg)
+
+        MY_SIGNAL.connect(receiver)
+        MY_SIGNAL.send_sync(zoom=3)
+        assert received == []
+        assert len(hq.background_tasks) == 1
+
+        await asyncio.gather(*hq.background_tasks)
+        assert received == [MY_SIGNAL.Message(zoom=3)]
+        assert not hq.background_tasks
+
+    def test_it_should_record_metrics(self, config):
+        metrics = SignalMetrics()
+        hq = HQ(config=config, metrics=metrics)
+        MY_SIGNAL.connect(Mock(), using=hq)
+        MY_SIGNAL.connect(broken_receiver, using=hq)
+        MY_SIGNAL.send_sync(zoom=3, using=hq)
+        signal = metrics.snapshot()["signals"][get_name(MY_SIGNAL)]
+        assert signal["sends"] == 1
+        assert signal["receivers"][f"{__name__}.broken_receiver"]["errors"] == 1
+
+
+class TestSendThreadsafe:
+    async def test_it_should_send_from_other_threads(self, hq: HQ):
+        received = []
+
+        async def receiver(msg):
+            received.append((msg, threading.current_thread()))
+
+        MY_SIGNAL.connect(receiver)
+        await hq.aload_dependencies([])
+        assert hq.loop is asyncio.get_running_loop()
+
+        def worker():
+            MY_SIGNAL.send_threadsafe(zoom=3, using=hq).result(timeout=5)
+            return len(received)
+
+        assert await asyncio.to_thread(worker) == 1
+        assert received == [(MY_SIGNAL.Message(zoom=3), threading.main_thread())]
+
+    async def test_it_should_keep_a_given_loop(self, hq: HQ, loop_thread):
+        hq.loop = loop_thread
+        await hq.aload_dependencies([])
+        assert hq.loop is loop_thread
+
+    def test_it_should_skip_unheard_signals(self):
+        future = EXPENSIVE_SIGNAL.send_threadsafe(value="a")
+        assert future.done()
+
+    def test_it_should_need_a_loop(self, hq: HQ):
+        MY_SIGNAL.connect(Mock())
+        with pytest.raises(RuntimeError, match="No event loop"):
+            MY_SIGNAL.send_threadsafe(zoom=3)
+
+
+class SLOW_SIGNAL(Signal):
+    deadline = 0.05
+
+
+@pytest.fixture
+def hanging():
+    """An async receiver that never finishes, recording whether it was cancelled."""
+    state = {"started": 0, "cancelled": 0}
+
+    async def receiver(msg):
+        state["started"] += 1
+        try:
+            await asyncio.sleep(60)
+        except asyncio.CancelledError:
+            state["cancelled"] += 1
+            raise
+
+    return receiver, state
+
+
+class TestReceiverTimeouts:
+    async def test_it_should_cancel_receivers_that_time_out(self, hanging, caplog):
+        receiver, state = hanging
+        after = Mock()
+        MY_SIGNAL.connect(receiver, timeout=0.01)
+        MY_SIGNAL.connect(after)
+
+        await MY_SIGNAL.send(zoom=1)
+        assert state == {"started": 1, "cancelled": 1}
+        after.assert_called_once_with(MY_SIGNAL.Message(zoom=1))
+        assert "timed out after 0.01 seconds" in caplog.text
+
+    async def test_it_should_allow_receivers_that_finish_in_time(self):
+        received = []
+
+        async def receiver(msg):
+            received.append(msg)
+
+        MY_SIGNAL.connect(receiver, timeout=1)
+        await MY_SIGNAL.send(zoom=1)
+        assert received == [MY_SIGNAL.Message(zoom=1)]
+
+    async def test_it_should_stop_waiting_for_receivers_in_an_executor(self):
+        done = threading.Event()
+        MY_SIGNAL.connect(lambda msg: done.wait(5), executor=True, timeout=0.01)
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        await MY_SIGNAL.send(zoom=1)
+        assert loop.time() - start < 1
+        done.set()
+
+    def test_it_should_refuse_sync_receivers_on_the_event_loop(self):
+        with pytest.raises(TypeError, match="can time out"):
+            MY_SIGNAL.connect(Mock(), timeout=1)
+
+    async def test_it_should_count_timeouts(self, config, hanging):
+        receiver, state = hanging
+        metrics = SignalMetrics()
+        hq = HQ(config=config, metrics=metrics)
+        MY_SIGNAL.connect(receiver, using=hq, timeout=0.01)
+        await MY_SIGNAL.send(zoom=1, using=hq)
+
+        (stats,) = metrics.snapshot()["signals"][get_name(MY_SIGNAL)]["receivers"].values()
+        assert stats["calls"] == stats["errors"] == stats["timeouts"] == 1
+
+    @pytest.mark.parametrize("timeout", [None, 1])
+    async def test_it_should_log_timeouts_raised_by_receivers_as_errors(self, config, caplog, timeout):
+        async def receiver(msg):
+            raise TimeoutError("the receiver's own")
+
+        metrics = SignalMetrics()
+        hq = HQ(config=config, metrics=metrics)
+        MY_SIGNAL.connect(receiver, using=hq, timeout=timeout)
+        await MY_SIGNAL.send(zoom=1, using=hq)
+
+        assert "Exception occurred while sending" in caplog.text
+        assert "the receiver's own" in caplog.text
+        assert "timed out" not in caplog.text
+        (stats,) = metrics.snapshot()["signals"][get_name(MY_SIGNAL)]["receivers"].values()
+        assert (stats["errors"], stats["timeouts"]) == (1, 0)
+
+    async def test_it_should_time_out_responders(self, hq: HQ):
+        class Main(Base):
+            @Base.responds(MY_SIGNAL, timeout=0.01)
+            async def on_signal(self, msg):
+                await asyncio.sleep(60)
+
+        hq.bases["main"] = Main(hq=hq)
+        (connection,) = hq.dispatch_tables[MY_SIGNAL]
+        assert connection.timeout == 0.01
+        await MY_SIGNAL.send(zoom=1)
+        assert hq.clone().dispatch_tables[MY_SIGNAL][0].timeout == 0.01
+
+
+class TestSendDeadlines:
+    async def test_it_should_cut_sends_short_at_the_deadline(self, hanging, caplog):
+        receiver, state = hanging
+        MY_SIGNAL.connect(receiver)
+        MY_SIGNAL.connect(partial(receiver))
+
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        await MY_SIGNAL.send(zoom=1, deadline=0.01)
+        assert loop.time() - start < 1
+        assert state == {"started": 1, "cancelled": 1}
+        assert "missed its deadline of 0.01 seconds" in caplog.text
+
+    async def test_it_should_cancel_concurrent_receivers_at_the_deadline(self, hanging):
+        receiver, state = hanging
+        MY_SIGNAL.connect(receiver)
+        MY_SIGNAL.connect(partial(receiver))
+        await MY_SIGNAL.send(zoom=1, concurrent=True, deadline=0.01)
+        assert state == {"started": 2, "cancelled": 2}
+
+    @pytest.mark.parametrize("concurrent", [False, True])
+    async def test_it_should_not_start_sync_receivers_after_the_deadline(self, config, caplog, concurrent):
+        calls = []
+
+        def slow_receiver(msg):
+            calls.append(msg)
+            time.sleep(0.05)
+
+        metrics = SignalMetrics()
+        hq = HQ(config=config, metrics=metrics)
+        for _ in range(5):
+            MY_SIGNAL.connect(partial(slow_receiver), using=hq)
+        await MY_SIGNAL.send(zoom=1, using=hq, concurrent=concurrent, deadline=0.01)
+
+        assert len(calls) == 1
+        assert "missed its deadline of 0.01 seconds" in caplog.text
+        assert metrics.snapshot()["signals"][get_name(MY_SIGNAL)]["overdue"] == 1
+
+    async def test_it_should_default_to_the_signal_deadline(self, hanging):
+        receiver, state = hanging
+        SLOW_SIGNAL.connect(receiver)
+        await SLOW_SIGNAL.send(value="a")
+        assert state == {"started": 1, "cancelled": 1}
+
+    async def test_it_should_apply_deadlines_to_send_many(self, hanging):
+        receiver, state = hanging
+        MY_SIGNAL.connect(receiver)
+        await MY_SIGNAL.send_many([MY_SIGNAL.Message(zoom=1), MY_SIGNAL.Message(zoom=2)], deadline=0.01)
+        assert state == {"started": 1, "cancelled": 1}
+
+    async def test_it_should_not_interrupt_sends_that_finish_in_time(self):
+        received = []
+        MY_SIGNAL.connect(received.append)
+        await MY_SIGNAL.send(zoom=1, deadline=1)
+        assert received == [MY_SIGNAL.Message(zoom=1)]
+
+    async def test_it_should_count_overdue_sends(self, config, hanging):
+        receiver, state = hanging
+        metrics = SignalMetrics()
+        hq = HQ(config=config, metrics=metrics)
+        SLOW_SIGNAL.connect(receiver, using=hq)
+        await SLOW_SIGNAL.send(value="a", using=hq)
+        await SLOW_SIGNAL.send(value="b", using=hq, deadline=1e-9)
+
+        stats = metrics.snapshot()["signals"][get_name(SLOW_SIGNAL)]
+        assert stats["sends"] == stats["overdue"] == 2
+
+
+class TestSignalNames:
+    class NESTED(Signal):
+        pass
+
+    def test_it_should_name_signals(self):
+        assert signal_name(MY_SIGNAL) == f"{__name__}:MY_SIGNAL"
+
+    @pytest.mark.parametrize("signal_class", [MY_SIGNAL, NESTED])
+    def test_it_should_resolve_names(self, signal_class):
+        assert resolve_signal(signal_name(signal_class)) is signal_class
+
+    def test_it_should_refuse_other_things(self):
+        with pytest.raises(ValueError, match="Not a Signal subclass"):
+            resolve_signal(f"{__name__}:broken_receiver")
+
+    def test_it_should_only_import_when_asked(self):
+        with pytest.raises(ValueError, match="Not a Signal subclass"):
+            resolve_signal("not.yet.imported:SIGNAL", import_module=False)
+        with pytest.raises(ImportError):
+            resolve_signal("not.yet.imported:SIGNAL")
@@ -0,0 +1,146 @@
+# ruff: noqa: D100, D101, D102, D103
+import asyncio
+
+import pytest
+
+from convoke import current_hq
+from convoke.bases import HQ, Base
+from convoke.metrics import SignalMetrics
+from convoke.testing import hq_fixture, isolated_hq
+
+
+@pytest.fixture(autouse=True)
+def autouse_fakemodules(fakemodules):
+    yield
+
+
+@pytest.fixture
+def template():
+    hq = HQ()
+    hq.load_dependencies(["foo", "bar"])
+    return hq
+
+
+@pytest.fixture(autouse=True)
+def restore(hq_base: HQ):
+    yield
+    hq_base.reset()
+
+
+hq = hq_fixture(["foo", "bar"])
+
+
+def test_it_should_clone_bases(template: HQ):
+    clone = template.clone()
+    assert list(clone.bases) == ["foo", "baz", "bar"]
+    assert clone.graph == template.graph
+    for name, base in clone.bases.items():
+        assert isinstance(base, type(template.bases[name]))
+        assert base is not template.bases[name]
+        assert base.hq is clone
+        assert base.config is template.bases[name].config
+    assert clone.bases["bar"].bases["baz"] is clone.bases["baz"]
+    assert clone.bases["baz"].bases["foo"] is clone.bases["foo"]
+
+
+def test_it_should_not_derive_configs(template: HQ, monkeypatch):
+    monkeypatch.setattr(type(template.bases["foo"]).config_class, "from_config", None)
+    template.clone()
+
+
+def test_it_should_initialize_clones(template: HQ):
+    template.bases["foo"].foos.append("sentinel")
+    clone = template.clone()
+    assert clone.bases["foo"].foos == []
+    template.bases["foo"].foos.clear()
+
+
+async def test_it_should_rebind_signal_receivers(template: HQ):
+    import foo
+
+    clone = template.clone()
+    await foo.FOO.send(value="foo", using=clone)
+    assert clone.bases["foo"].foos == [foo.FOO.Message(value="foo")]
+    assert template.bases["foo"].foos == []
+
+
+async def test_it_should_not_copy_other_signal_receivers(template: HQ):
+    import foo
+
+    received = []
+    foo.FOO.connect(received.append, using=template)
+    clone = template.clone()
+    await foo.FOO.send(value="foo", using=clone)
+    assert received == []
+    assert len(clone.signal_receivers[foo.FOO]) == 1
+
+
+async def test_it_should_not_duplicate_receivers_connected_by_on_init(template: HQ):
+    import foo
+
+    class Main(Base):
+        def on_init(self):
+            self.received = []
+            self.hq.connect_signal_receiver(foo.FOO, lambda msg: self.received.append(msg))
+
+    template.bases["listener"] = Main(hq=template)
+    clone = template.clone()
+    await foo.FOO.send(value="foo", using=clone)
+    assert clone.bases["listener"].received == [foo.FOO.Message(value="foo")]
+    assert template.bases["listener"].received == []
+    assert len(clone.signal_receivers[foo.FOO]) == 2
+
+
+def test_it_should_not_share_instrumentation(config):
+    template = HQ(config=config, metrics=SignalMetrics())
+    assert template.clone().metrics is None
+
+
+async def test_it_should_rebind_mountpoints(template: HQ):
+    import baz
+
+    clone = template.clone()
+    await baz.BAZ.send(value="thing", using=clone)
+    await asyncio.sleep(0)
+    assert clone.bases["baz"].things == ["thing"]
+    assert template.bases["baz"].things == []
+    assert clone.mountpoints[baz.ThingyMadoodle] is not template.mountpoints[baz.ThingyMadoodle]
+
+
+def test_it_should_make_the_clone_current(template: HQ):
+    import foo
+
+    clone = template.clone()
+    assert HQ.get_current() is clone
+    assert foo.Main.get_current() is clone.bases["foo"]
+
+
+def test_it_should_refuse_async_bases(template: HQ):
+    class Main(Base):
+        async def on_init(self):  # pragma: nocover
+            pass
+
+    hq = HQ()
+    hq.bases["async"] = Main(hq=hq)
+    with pytest.raises(TypeError, match="async lifecycle"):
+        hq.clone()
+
+
+def test_it_should_isolate_and_restore(template: HQ):
+    import foo
+
+    with isolated_hq(template) as clone:
+        assert current_hq.get() is clone
+        assert foo.Main.get_current() is clone.bases["foo"]
+    assert HQ.get_current() is template
+    assert foo.Main.get_current() is template.bases["foo"]
+
+
+def test_it_should_provide_a_fixture(hq: HQ):
+    assert list(hq.bases) == ["foo", "baz", "bar"]
+    assert current_hq.get() is hq
+    hq.bases["foo"].foos.append("polluted")
+
+
+def test_it_should_provide_a_fresh_clone_each_time(hq: HQ):
+    assert hq.bases["foo"].foos == []
@@ -0,0 +1,269 @@
+# ruff: noqa: D100, D101, D102, D103, D106
+import asyncio
+import json
+import socket
+from dataclasses import dataclass
+from pathlib import Path
+
+import pytest
+
+from convoke.bases import HQ
+from convoke.signals import Signal
+from convoke.transports import Transport, UnixSocketTransport
+
+
+class INVALIDATE(Signal):
+    broadcast = True
+
+    @dataclass
+    class Message:
+        key: str
+
+
+class PURGE(Signal):
+    broadcast = True
+
+    @dataclass
+    class Message:
+        key: str
+
+
+class LOCAL(Signal):
+    @dataclass
+    class Message:
+        key: str
+
+
+class NOT_A_SIGNAL:
+    pass
+
+
+class ListTransport(Transport):
+    """Keep batches, rather than sending them."""
+
+    def __post_init__(self):
+        super().__post_init__()
+        self.batches = []
+
+    def send_batch(self, data: bytes, count: int) -> None:
+        self.batches.append((json.loads(data), count))
+
+
+async def until(condition, timeout=5.0):
+    """Let the event loop run until the condition holds."""
+    async with asyncio.timeout(timeout):
+        while not condition():
+            await asyncio.sleep(0.001)
+
+
+@pytest.fixture
+def make_hq(config, tempdir: Path):
+    """Build HQs whose transports share a directory, as sibling processes would."""
+
+    async def make_hq(name: str, **kwargs) -> HQ:
+        hq = HQ(config=config, transport=UnixSocketTransport(tempdir, name=name, **kwargs))
+        await hq.aload_dependencies([])
+        return hq
+
+    return make_hq
+
+
+@pytest.fixture
+async def siblings(make_hq):
+    """Two HQs, each recording the keys they receive."""
+    hqs = [await make_hq("a.sock"), await make_hq("b.sock")]
+    received = []
+    for hq in hqs:
+        hq.connect_signal_receiver(INVALIDATE, lambda msg, hq=hq: received.append((hq, msg.key)))
+        hq.connect_signal_receiver(LOCAL, lambda msg, hq=hq: received.append((hq, msg.key)))
+    yield hqs, received
+    for hq in hqs:
+        await hq.shutdown()
+
+
+class TestUnixSocketTransport:
+    async def test_it_should_broadcast_to_siblings(self, siblings):
+        (a, b), received = siblings
+        await INVALIDATE.send(key="foo", using=a)
+        assert received == [(a, "foo")]
+
+        await until(lambda: len(received) == 2)
+        assert received == [(a, "foo"), (b, "foo")]
+        assert a.transport.stats.published == 1
+        assert a.transport.stats.batches == 1
+        assert b.transport.stats.received == 1
+
+    async def test_it_should_not_broadcast_local_signals(self, siblings):
+        (a, b), received = siblings
+        await LOCAL.send(key="foo", using=a)
+        await asyncio.sleep(0.01)
+        assert received == [(a, "foo")]
+        assert a.transport.stats.published == 0
+
+    async def test_it_should_broadcast_without_local_receivers(self, siblings):
+        (a, b), received = siblings
+        a.signal_receivers.clear()
+        a.dispatch_tables.clear()
+        assert a.has_receivers(INVALIDATE) is True
+        await INVALIDATE.send(key="foo", using=a)
+        await until(lambda: received == [(b, "foo")])
+
+    async def test_it_should_broadcast_sync_sends(self, siblings):
+        (a, b), received = siblings
+        INVALIDATE.send_sync(key="foo", using=a)
+        await until(lambda: len(received) == 2)
+
+    async def test_it_should_send_many_in_batches(self, make_hq):
+        a = await make_hq("a.sock", batch_size=100)
+        b = await make_hq("b.sock")
+        batches = []
+        b.connect_signal_receiver(INVALIDATE, batches.append, batch=True)
+
+        await INVALIDATE.send_many([INVALIDATE.Message(key=str(n)) for n in range(250)], using=a)
+        await until(lambda: sum(map(len, batches)) == 250)
+        assert [len(batch) for batch in batches] == [100, 100, 50]
+        assert a.transport.stats.batches == 3
+        await a.shutdown()
+        await b.shutdown()
+
+    async def test_it_should_drop_the_oldest_messages_when_full(self, config, tempdir):
+        transport = UnixSocketTransport(tempdir, name="a.sock", maxsize=2)
+        hq = HQ(config=config, transport=transport)
+        for key in "abc":  # Not started yet, so messages wait in the buffer
+            INVALIDATE.send_sync(key=key, using=hq)
+        assert transport.stats.dropped == 1
+        assert list(transport._buffer) == [
+            transport.encode(INVALIDATE, INVALIDATE.Message(key=key)) for key in "bc"
+        ]
+
+    async def test_it_should_deliver_runs_of_messages_together(self, siblings):
+        (a, b), received = siblings
+        batches = []
+        b.connect_signal_receiver(INVALIDATE, batches.append, batch=True)
+        b.connect_signal_receiver(PURGE, batches.append, batch=True)
+
+        await INVALIDATE.send_many([INVALIDATE.Message(key="a"), INVALIDATE.Message(key="b")], using=a)
+        await PURGE.send(key="c", using=a)
+        await INVALIDATE.send(key="d", using=a)
+        await until(lambda: len(batches) == 3)
+        assert [[msg.key for msg in batch] for batch in batches] == [["a", "b"], ["c"], ["d"]]
+        assert a.transport.stats.batches == 1
+
+    async def test_it_should_send_messages_buffered_before_starting(self, make_hq, config, tempdir):
+        b = await make_hq("b.sock")
+        received = []
+        b.connect_signal_receiver(INVALIDATE, received.append)
+
+        a = HQ(config=config, transport=UnixSocketTransport(tempdir, name="a.sock"))
+        await INVALIDATE.send(key="foo", using=a)
+        await a.aload_dependencies([])
+        await until(lambda: received == [INVALIDATE.Message(key="foo")])
+        await a.shutdown()
+        await b.shutdown()
+
+    async def test_it_should_deliver_unserializable_messages_locally(self, siblings, caplog):
+        (a, b), received = siblings
+        key = object()
+        await INVALIDATE.send(key=key, using=a)
+        INVALIDATE.send_sync(key=key, using=a)
+        await INVALIDATE.send_many([INVALIDATE.Message(key=key)], using=a)
+        assert received == [(a, key)] * 3
+        assert a.transport.stats.published == 0
+        assert caplog.text.count(f"Exception occurred while broadcasting {INVALIDATE!r}") == 3
+
+    async def test_it_should_ignore_unknown_signals(self, siblings, caplog):
+        (a, b), received = siblings
+        b.transport.receive(json.dumps([[f"{__name__}:LOCAL", {"key": "a"}], [f"{__name__}:NOT_A_SIGNAL", {}]]).encode())
+        b.transport.receive(json.dumps([["nowhere:LOCAL", {"key": "a"}], [f"{__name__}:INVALIDATE", {"key": "b"}]]).encode())
+        await until(lambda: received == [(b, "b")])
+        assert caplog.text.count("Ignoring broadcast messages for unknown signal") == 3
+
+    async def test_it_should_discard_unreadable_batches(self, siblings, caplog):
+        (a, b), received = siblings
+        b.transport.receive(b"[not json")
+        assert b.transport.stats.errors == 1
+        assert "Discarding unreadable batch" in caplog.text
+
+    async def test_it_should_forget_siblings_that_go_away(self, siblings):
+        (a, b), received = siblings
+        a.transport._get_peers()
+        await b.shutdown()
+        await INVALIDATE.send(key="foo", using=a)
+        await asyncio.sleep(0.01)
+        assert a.transport.stats.batches == 0
+        assert a.transport._get_peers() == []
+
+    async def test_it_should_skip_stale_sockets_until_the_next_rescan(self, siblings, tempdir):
+        (a, b), received = siblings
+        with socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM) as dead:
+            dead.bind(str(tempdir / "dead.sock"))  # Left behind when closed
+        a.transport._scanned_at = float("-inf")
+        a.transport.send_batch(b"[]", 0)
+        scanned_at = a.transport._scanned_at
+        assert a.transport._peers == [str(b.transport.path)]
+
+        a.transport.send_batch(b"[]", 0)
+        assert a.transport._scanned_at == scanned_at
+        assert a.transport.stats.batches == 2
+
+    async def test_it_should_drop_batches_for_siblings_that_cant_keep_up(self, siblings, tempdir):
+        (a, b), received = siblings
+        with socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM) as stuck:
+            stuck.bind(str(tempdir / "stuck.sock"))
+            a.transport._scanned_at = float("-inf")
+            data = b"[" + b" " * 60000 + b"]"
+            for _ in range(100):
+                a.transport.send_batch(data, 10)
+        assert a.transport.stats.dropped > 0
+
+    async def test_it_should_log_other_send_errors(self, siblings, caplog):
+        (a, b), received = siblings
+        a.transport.send_batch(b" " * 2**24, 1)  # Too big for a datagram
+        assert a.transport.stats.errors == 1
+        assert f"broadcasting 1 signals to {b.transport.path}" in caplog.text
+
+    async def test_it_should_start_and_stop_once(self, make_hq):
+        a = await make_hq("a.sock")
+        await a.aload_dependencies([])
+        assert a.transport.path.exists()
+        await a.shutdown()
+        assert not a.transport.path.exists()
+        await a.shutdown()
+
+    def test_it_should_name_sockets_after_the_process(self, tempdir):
+        transport = UnixSocketTransport(tempdir)
+        assert transport.path.suffix == ".sock"
+        assert transport.path.stem.isdigit()
+
+
+
+class TestTransport:
+    async def test_it_should_stop_before_starting(self):
+        transport = ListTransport()
+        await transport.stop()
+        assert transport.stats.published == 0
+
+    def test_it_should_require_send_batch(self):
+        with pytest.raises(TypeError, match="send_batch"):
+            Transport()
+
+    def test_it_should_keep_batches_within_the_byte_limit(self):
+        message_bytes = len(ListTransport().encode(INVALIDATE, INVALIDATE.Message(key="0000")))
+        transport = ListTransport(max_batch_bytes=3 * message_bytes + 4)
+        for n in range(7):
+            transport.publish(INVALIDATE, INVALIDATE.Message(key=f"{n:04}"))
+        transport._flush()
+        assert [count for _, count in transport.batches] == [3, 3, 1]
+        assert [len(json.dumps(batch, separators=(",", ":"))) for batch, _ in transport.batches[:2]] == [
+            3 * message_bytes + 4
+        ] * 2
+
+    def test_it_should_drop_messages_too_large_to_send(self, caplog):
+        transport = ListTransport(max_batch_bytes=100)
+        transport.publish(INVALIDATE, INVALIDATE.Message(key="x" * 100))
+        transport.publish(INVALIDATE, INVALIDATE.Message(key="y"))
+        transport._flush()
+        assert transport.stats.dropped == 1
+        assert transport.stats.published == 1
+        assert [count for _, count in transport.batches] == [1]
+        assert "too large to send" in caplog.text